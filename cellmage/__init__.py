@@ -7,6 +7,7 @@ for interacting with LLMs in Jupyter/IPython environments.
 
 import logging
 import os
+import threading
 from typing import Optional
 
 from .chat_manager import ChatManager
@@ -32,15 +33,38 @@ setup_logging()
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# When imported inside a running IPython shell, expose the magics lazily so that
+# %llm / %llm_config load the extension on first use
+try:
+    from ._lazy import register_lazy_magics
+
+    register_lazy_magics()
+except Exception as e:
+    logger.debug(f"Lazy magic registration skipped: {e}")
+
+
+# Default SQLite-backed storage, created on first use and shared afterwards
+_default_conversation_manager: Optional[ConversationManager] = None
+_default_conversation_manager_lock = threading.Lock()
+
 
-# Default SQLite-backed storage
 def get_default_conversation_manager() -> ConversationManager:
     """
     Returns a default conversation manager, using SQLite storage.
 
     This is the preferred way to get a conversation manager as it
-    ensures that SQLite storage is used by default.
+    ensures that SQLite storage is used by default. The manager is created
+    once and the same instance is returned on every later call.
     """
+    global _default_conversation_manager
+    if _default_conversation_manager is None:
+        with _default_conversation_manager_lock:
+            if _default_conversation_manager is None:
+                _default_conversation_manager = _create_default_conversation_manager()
+    return _default_conversation_manager
+
+
+def _create_default_conversation_manager() -> ConversationManager:
     from .context_providers.ipython_context_provider import get_ipython_context_provider
 
     # Default to SQLite storage unless explicitly disabled
@@ -80,6 +104,7 @@ def load_ipython_extension(ipython):
     """
     import importlib
     import pkgutil
+    from concurrent.futures import ThreadPoolExecutor
 
     try:
         # Load the new refactored magic commands
@@ -117,20 +142,35 @@ def load_ipython_extension(ipython):
                 # Import the tools package
                 import cellmage.magic_commands.tools
 
+                # Known integrations are only imported the first time their magic is used
+                lazy_modules = cellmage.magic_commands.tools.register_lazy_tool_magics(ipython)
+
                 # Skip sqlite_magic as it was already attempted above
                 # Also skip base_tool_magic which is a base class, not an integration
-                skip_modules = ["sqlite_magic", "__pycache__", "base_tool_magic"]
-
-                # Iterate over all modules in the tools package
-                for finder, mod_name, is_pkg in pkgutil.iter_modules(
-                    cellmage.magic_commands.tools.__path__
-                ):
-                    if mod_name in skip_modules:
-                        continue
-
-                    full_name = f"{cellmage.magic_commands.tools.__name__}.{mod_name}"
+                skip_modules = ["sqlite_magic", "__pycache__", "base_tool_magic", *lazy_modules]
+
+                mod_names = [
+                    mod_name
+                    for finder, mod_name, is_pkg in pkgutil.iter_modules(
+                        cellmage.magic_commands.tools.__path__
+                    )
+                    if mod_name not in skip_modules
+                ]
+
+                # Any other integration modules import their SDKs at module level, so import
+                # them concurrently; registration below stays serial and in discovery order
+                with ThreadPoolExecutor(max_workers=min(8, len(mod_names) or 1)) as executor:
+                    futures = [
+                        executor.submit(
+                            importlib.import_module,
+                            f"{cellmage.magic_commands.tools.__name__}.{mod_name}",
+                        )
+                        for mod_name in mod_names
+                    ]
+
+                for mod_name, future in zip(mod_names, futures):
                     try:
-                        module = importlib.import_module(full_name)
+                        module = future.result()
                         loader = getattr(module, "load_ipython_extension", None)
                         if callable(loader):
                             loader(ipython)
@@ -154,8 +194,8 @@ def load_ipython_extension(ipython):
 # Unload extension
 def unload_ipython_extension(ipython):
     """Unregisters the magics from the IPython runtime."""
-    import importlib
     import pkgutil
+    import sys
 
     try:
         # Try to unload the refactored magic commands
@@ -175,8 +215,11 @@ def unload_ipython_extension(ipython):
                 cellmage.magic_commands.tools.__path__
             ):
                 full_name = f"{cellmage.magic_commands.tools.__name__}.{mod_name}"
+                # Integrations that were never used were never imported; nothing to undo
+                if full_name not in sys.modules:
+                    continue
                 try:
-                    module = importlib.import_module(full_name)
+                    module = sys.modules[full_name]
                     unloader = getattr(module, "unload_ipython_extension", None)
                     if callable(unloader):
                         unloader(ipython)
@@ -0,0 +1,66 @@
+"""
+Lazy registration of the CellMage magics.
+
+IPython (>= 8.0) can map a magic name to an extension module through
+``magics_manager.lazy_magics``; the extension is only loaded the first time
+one of those magics is used. This lets ``%llm`` / ``%llm_config`` be available
+without paying the full ``%load_ext cellmage`` cost up front.
+"""
+
+import logging
+import sys
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Extension module that IPython loads (via %load_ext) on first use of a lazy magic
+_EXTENSION_MODULE = "cellmage"
+
+# Magics provided by the extension that can trigger the lazy load
+_LAZY_MAGIC_NAMES = (
+    "llm",
+    "llm_config",
+    "llm_config_persistent",
+    "disable_llm_config_persistent",
+)
+
+
+def register_lazy_magics(ipython: Optional[Any] = None) -> bool:
+    """
+    Register the CellMage magics with IPython's lazy-loading mechanism.
+
+    Args:
+        ipython: IPython shell instance. If None, uses the running shell (if any).
+
+    Returns:
+        True if the magics were registered lazily, False otherwise
+    """
+    if ipython is None:
+        # Never import IPython ourselves: if it isn't loaded, there's no shell to register with
+        if "IPython" not in sys.modules:
+            return False
+
+        from IPython import get_ipython
+
+        ipython = get_ipython()
+        if ipython is None:
+            return False
+
+    magics_manager = getattr(ipython, "magics_manager", None)
+    if magics_manager is None:
+        return False
+
+    lazy_magics = getattr(magics_manager, "lazy_magics", None)
+    if lazy_magics is None:
+        logger.debug("IPython shell does not support lazy magics (requires IPython >= 8.0)")
+        return False
+
+    # Nothing to do if the extension is already loaded
+    if "llm" in magics_manager.magics.get("cell", {}):
+        return False
+
+    for name in _LAZY_MAGIC_NAMES:
+        lazy_magics.setdefault(name, _EXTENSION_MODULE)
+
+    logger.debug(f"Registered lazy CellMage magics: {', '.join(_LAZY_MAGIC_NAMES)}")
+    return True
@@ -0,0 +1,141 @@
+"""
+Prompt-level cache for LLM responses.
+
+Responses are keyed by a SHA-256 hash of the full request (model, messages, LLM
+parameters and the client configuration they are sent with), so re-running an
+unchanged cell can be answered without calling the provider. A second key, which
+ignores trailing whitespace and blank lines, catches prompts that only differ in
+those; indentation and line breaks inside the text still count. Entries are kept in memory and persisted as small JSON
+files so they survive kernel restarts.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from .models import Message
+
+logger = logging.getLogger(__name__)
+
+
+def _strip_blank_space(text: str) -> str:
+    """Drop trailing whitespace from each line and remove blank lines."""
+    return "\n".join(line.rstrip() for line in text.splitlines() if line.strip())
+
+
+class ResponseCache:
+    """Disk-backed cache of LLM responses keyed by request hash."""
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory where cached responses are stored
+        """
+        self.cache_dir = Path(os.path.expanduser(str(cache_dir)))
+        self._memory: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def make_key(
+        model: Optional[str],
+        messages: Iterable[Message],
+        params: Dict[str, Any],
+        config: Optional[Dict[str, Any]] = None,
+        normalize: bool = False,
+    ) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            model: Model the request is sent to
+            messages: Messages sent to the LLM
+            params: Additional LLM parameters (temperature, max_tokens, ...)
+            config: Client configuration the request is sent with (adapter, API base,
+                instance overrides), so a changed setup doesn't reuse old answers
+            normalize: Ignore trailing whitespace and blank lines in message contents,
+                so prompts that only differ in those share the key
+
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        if normalize:
+            contents = [[m.role, _strip_blank_space(m.content)] for m in messages]
+        else:
+            contents = [[m.role, m.content] for m in messages]
+        payload = {
+            "model": model,
+            "messages": contents,
+            "params": params,
+            "config": config or {},
+        }
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The cached entry (with at least a "content" key), or None on a miss
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            return entry
+
+        path = self._path(key)
+        if not path.is_file():
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable response cache entry {path}: {e}")
+            return None
+
+        self._memory[key] = entry
+        return entry
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_key()
+            entry: Data to store; must contain the response "content"
+        """
+        self._memory[key] = entry
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._path(key), "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"Failed to write response cache entry: {e}")
+
+    def clear(self) -> int:
+        """
+        Remove all cached responses.
+
+        Returns:
+            Number of entries removed from disk
+        """
+        self._memory.clear()
+        removed = 0
+        if self.cache_dir.is_dir():
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError as e:
+                    logger.warning(f"Failed to remove response cache entry {path}: {e}")
+        return removed
@@ -394,17 +394,33 @@ class DirectLLMAdapter(LLMClientInterface):
 
         return ""
 
+    @staticmethod
+    def _parse_usage(usage: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Normalize an OpenAI-style usage block.
+
+        Args:
+            usage: The "usage" object of a response or final stream chunk
+
+        Returns:
+            Dictionary with prompt_tokens, completion_tokens, total_tokens and
+            cached_tokens (prompt tokens served from the provider's prompt cache)
+        """
+        details = usage.get("prompt_tokens_details") or {}
+        return {
+            "prompt_tokens": usage.get("prompt_tokens", 0),
+            "completion_tokens": usage.get("completion_tokens", 0),
+            "total_tokens": usage.get("total_tokens", 0),
+            "cached_tokens": details.get("cached_tokens") or 0,
+        }
+
     def _extract_token_usage(self, response_data: Dict[str, Any]) -> None:
         """Extract token usage information from API response."""
         if "usage" in response_data:
-            usage = response_data["usage"]
-            self._last_token_usage = {
-                "prompt_tokens": usage.get("prompt_tokens", 0),
-                "completion_tokens": usage.get("completion_tokens", 0),
-                "total_tokens": usage.get("total_tokens", 0),
-            }
+            self._last_token_usage = self._parse_usage(response_data["usage"])
             self.logger.debug(
-                f"Token usage: {self._last_token_usage['prompt_tokens']} (prompt) + "
+                f"Token usage: {self._last_token_usage['prompt_tokens']} (prompt, "
+                f"{self._last_token_usage['cached_tokens']} cached) + "
                 f"{self._last_token_usage['completion_tokens']} (completion) = "
                 f"{self._last_token_usage['total_tokens']} (total)"
             )
@@ -417,7 +433,7 @@ class DirectLLMAdapter(LLMClientInterface):
         Get token usage from the last API call.
 
         Returns:
-            Dictionary with prompt_tokens, completion_tokens, and total_tokens
+            Dictionary with prompt_tokens, completion_tokens, total_tokens and cached_tokens
         """
         return self._last_token_usage.copy()
 
@@ -463,7 +479,7 @@ class DirectLLMAdapter(LLMClientInterface):
             self._handle_error_response(response)
 
         # Variables to collect the response
-        accumulated_content = ""
+        content_parts: List[str] = []
         model_from_stream = None
         # For streaming responses, we need to look for token usage in the final chunk
         token_usage_data = {}
@@ -505,13 +521,16 @@ class DirectLLMAdapter(LLMClientInterface):
                     if "delta" in choice and "content" in choice["delta"]:
                         content = choice["delta"]["content"]
                         if content:
-                            accumulated_content += content
+                            content_parts.append(content)
                             if stream_callback:
                                 stream_callback(content)
             except json.JSONDecodeError:
                 self.logger.warning(f"Failed to parse streaming JSON: {line}")
                 continue
 
+        # Join the streamed pieces once instead of concatenating per chunk
+        accumulated_content = "".join(content_parts)
+
         # Calculate response time in milliseconds
         response_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
 
@@ -521,11 +540,7 @@ class DirectLLMAdapter(LLMClientInterface):
 
         # Update token usage from streaming response (if available)
         if token_usage_data:
-            self._last_token_usage = {
-                "prompt_tokens": token_usage_data.get("prompt_tokens", 0),
-                "completion_tokens": token_usage_data.get("completion_tokens", 0),
-                "total_tokens": token_usage_data.get("total_tokens", 0),
-            }
+            self._last_token_usage = self._parse_usage(token_usage_data)
         else:
             # If we didn't get token usage data in the stream, make an estimate based on char count
             # This is a very rough approximation and should be improved
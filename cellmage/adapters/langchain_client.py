@@ -20,11 +20,16 @@ class LangChainStreamingCallbackHandler(StreamingStdOutCallbackHandler):
     def __init__(self, callback: Optional[StreamCallbackHandler]):
         super().__init__()
         self.callback = callback
-        self.captured_text = ""
+        self._tokens: List[str] = []
+
+    @property
+    def captured_text(self) -> str:
+        """Text streamed so far."""
+        return "".join(self._tokens)
 
     def on_llm_new_token(self, token: str, **kwargs) -> None:
         """Process a new token in the stream."""
-        self.captured_text += token
+        self._tokens.append(token)
         if self.callback:
             self.callback(token)
 
@@ -3,12 +3,13 @@ import os
 import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from tokencostauto import calculate_completion_cost, calculate_prompt_cost
+from tokencostauto import calculate_cost_by_tokens
 
+from ._response_cache import ResponseCache
 from .config import Settings
-from .conversation_manager import ConversationManager
+from .conversation_manager import ConversationManager, count_token_stats
 from .exceptions import ConfigurationError, ResourceNotFoundError
 from .interfaces import (
     ContextProvider,
@@ -20,6 +21,36 @@ from .interfaces import (
 from .model_mapping import ModelMapper
 from .models import Message, PersonaConfig
 
+# Per-token USD rates (input, cached input, output) by model name. Resolved from
+# tokencostauto once per model; None marks models without pricing data.
+_MODEL_RATES: Dict[str, Optional[Tuple[float, float, float]]] = {}
+
+
+def _get_model_rates(model: str) -> Optional[Tuple[float, float, float]]:
+    """
+    Get the per-token rates for a model.
+
+    Args:
+        model: Full model name
+
+    Returns:
+        Tuple of (input, cached input, output) USD per token, or None if unknown
+    """
+    if model not in _MODEL_RATES:
+        try:
+            rate_in = float(calculate_cost_by_tokens(1, model, "input"))
+            rate_out = float(calculate_cost_by_tokens(1, model, "output"))
+        except (KeyError, ValueError):
+            _MODEL_RATES[model] = None
+        else:
+            try:
+                rate_cached = float(calculate_cost_by_tokens(1, model, "cached"))
+            except (KeyError, ValueError):
+                # No discounted rate published: cached input costs the same as input
+                rate_cached = rate_in
+            _MODEL_RATES[model] = (rate_in, rate_cached, rate_out)
+    return _MODEL_RATES[model]
+
 
 class ChatManager:
     """
@@ -89,6 +120,12 @@ class ChatManager:
         self._session_id = str(uuid.uuid4())
         self._active_persona: Optional[PersonaConfig] = None
 
+        # Token/cost/model metadata of the most recent chat() call
+        self._last_response_metadata: Dict[str, Any] = {}
+
+        # Created on first use, only when the response cache is enabled
+        self._response_cache: Optional[ResponseCache] = None
+
         # Initialize with default persona if specified
         if self.settings.default_persona and self.persona_loader:
             try:
@@ -264,6 +301,7 @@ class ChatManager:
         add_to_history: bool = True,
         auto_rollback: bool = True,
         execution_context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
         **kwargs,
     ) -> Optional[str]:
         """
@@ -277,12 +315,14 @@ class ChatManager:
             add_to_history: Whether to add the message to conversation history
             auto_rollback: Whether to perform automatic rollback on cell re-execution
             execution_context: Optional explicit execution context (execution_count, cell_id)
+            use_cache: Whether the response cache may be used (if enabled in settings)
             **kwargs: Additional parameters to pass to the LLM
 
         Returns:
             The LLM response text
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        self._last_response_metadata = {}
         self.logger.info(f"PERSONA DEBUG: Request made with persona_name='{persona_name}'")
 
         # Get execution context
@@ -530,69 +570,72 @@ class ChatManager:
             if self.llm_client is None:
                 raise ConfigurationError("LLM client is not configured")
 
-            assistant_response_content = self.llm_client.chat(
-                messages=messages, stream=stream, stream_callback=stream_callback, **llm_params
-            )
-
-            # Get token usage data from the LLM client
-            token_usage = {}
-            if hasattr(self.llm_client, "get_last_token_usage"):
-                token_usage = self.llm_client.get_last_token_usage()
-                tokens_in = token_usage.get("prompt_tokens", 0)
-                tokens_out = token_usage.get("completion_tokens", 0)
-                total_tokens = token_usage.get("total_tokens", 0)
-                self.logger.debug(
-                    f"Token usage from API: {tokens_in} (prompt) + "
-                    f"{tokens_out} (completion) = {total_tokens} (total)"
-                )
+            # Serve repeated requests from the response cache when enabled
+            cache_keys: List[str] = []
+            cached_response = None
+            if use_cache and self.settings.response_cache:
+                response_cache = self._get_response_cache()
+                call_config = self._get_call_config()
+                # Exact request first, then ignoring trailing whitespace and blank lines
+                cache_keys = [
+                    ResponseCache.make_key(model_name, messages, llm_params, call_config),
+                    ResponseCache.make_key(
+                        model_name, messages, llm_params, call_config, normalize=True
+                    ),
+                ]
+                for cache_key in cache_keys:
+                    cached_response = response_cache.get(cache_key)
+                    if cached_response is not None:
+                        break
+
+            if cached_response is not None:
+                self.logger.info(f"Response cache hit ({cache_key[:12]}), skipping LLM call")
+                assistant_response_content = cached_response["content"]
+                if stream_callback and self.context_provider is not None:
+                    stream_callback(assistant_response_content)
+                    self.context_provider.finish_stream(display_handle)
+                # Nothing was sent to the provider, so nothing was spent
+                usage = {
+                    "tokens_in": 0,
+                    "tokens_out": 0,
+                    "total_tokens": 0,
+                    "cached_tokens": 0,
+                    "cost_str": f"{0.0:f}",
+                }
             else:
-                # Fallback to estimation if token usage isn't available from the client
-                from .utils.token_utils import count_tokens
-
-                # Get text content from messages
-                input_text = "\n".join([m.content for m in messages])
-                # Use proper token counting function
-                tokens_in = count_tokens(input_text)
-
-                # Ensure assistant_response_content is treated as a string for length calculation
-                response_content_str = (
-                    str(assistant_response_content)
-                    if assistant_response_content is not None
-                    else ""
-                )
-                tokens_out = count_tokens(response_content_str)
-                total_tokens = tokens_in + tokens_out
-                self.logger.debug(
-                    f"Estimated token usage: {tokens_in} (prompt) + "
-                    f"{tokens_out} (completion) = {total_tokens} (total)"
-                )
+                try:
+                    assistant_response_content = self.llm_client.chat(
+                        messages=messages,
+                        stream=stream,
+                        stream_callback=stream_callback,
+                        **llm_params,
+                    )
+                finally:
+                    if stream_callback and self.context_provider is not None:
+                        # Render whatever the stream display still has buffered
+                        self.context_provider.finish_stream(display_handle)
+                usage = self._calculate_usage(messages, assistant_response_content, model_name)
 
-            # Calculate cost using tokencostauto (with model alias mapping)
-            try:
-                # Map alias to full model name for cost calculation
-                mapped_model_name = self.model_mapper.get_full_name(model_name)
-
-                prompt_for_cost = [{"role": m.role, "content": m.content} for m in messages]
-                completion_for_cost = (
-                    str(assistant_response_content)
-                    if assistant_response_content is not None
-                    else ""
-                )
-                prompt_cost = calculate_prompt_cost(prompt_for_cost, mapped_model_name)
-                completion_cost = calculate_completion_cost(completion_for_cost, mapped_model_name)
-                cost_dollars = prompt_cost + completion_cost
-            except Exception as e:
-                self.logger.warning(f"Failed to calculate cost with tokencostauto: {e}")
-                cost_dollars = 0.0
-                prompt_cost = 0.0
-                completion_cost = 0.0
+            # Streamed responses are already on screen; complete responses are shown once here
+            if (
+                stream_callback is None
+                and assistant_response_content
+                and self.context_provider is not None
+                and self.settings.auto_display
+            ):
+                self.context_provider.display_response(assistant_response_content)
 
-            # Format cost as a string for display
-            cost_str = f"{cost_dollars:f}"
+            tokens_in = usage["tokens_in"]
+            tokens_out = usage["tokens_out"]
+            total_tokens = usage["total_tokens"]
+            cached_tokens = usage["cached_tokens"]
+            cost_str = usage["cost_str"]
 
             # Get the actual model used from the LLM client
             actual_model_used = None
-            if hasattr(self.llm_client, "get_last_model_used"):
+            if cached_response is not None:
+                actual_model_used = cached_response.get("model_used")
+            elif hasattr(self.llm_client, "get_last_model_used"):
                 actual_model_used = self.llm_client.get_last_model_used()
             elif (
                 hasattr(self.llm_client, "_instance_overrides")
@@ -600,6 +643,26 @@ class ChatManager:
             ):
                 actual_model_used = self.llm_client._instance_overrides.get("model")
 
+            # Keep the usage of this call so callers don't have to dig it out of the history
+            self._last_response_metadata = {
+                "tokens_in": tokens_in,
+                "tokens_out": tokens_out,
+                "total_tokens": total_tokens,
+                "cost_str": cost_str,
+                "model_used": actual_model_used or model_name,
+            }
+            if cached_tokens:
+                self._last_response_metadata["cached_tokens"] = cached_tokens
+            if cached_response is not None:
+                self._last_response_metadata["cache_hit"] = True
+            elif cache_keys and assistant_response_content:
+                entry = {
+                    "content": assistant_response_content,
+                    "model_used": actual_model_used or model_name,
+                }
+                for cache_key in cache_keys:
+                    self._get_response_cache().set(cache_key, entry)
+
             # If we're adding to history, add both user and assistant messages
             if add_to_history and assistant_response_content:
                 # Add user message to history WITH token count information
@@ -621,13 +684,7 @@ class ChatManager:
                         cell_id=cell_id,
                         execution_count=exec_count,
                     ),
-                    metadata={
-                        "tokens_in": tokens_in,
-                        "tokens_out": tokens_out,
-                        "total_tokens": total_tokens,
-                        "cost_str": cost_str,
-                        "model_used": actual_model_used or model_name,
-                    },
+                    metadata=dict(self._last_response_metadata),
                     execution_count=exec_count,
                     cell_id=cell_id,
                 )
@@ -646,7 +703,7 @@ class ChatManager:
 
             # Update the call to display_status in the success case
             # Display status bar if context provider is available
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             if self.context_provider is not None and not stream:
                 # Always provide model_used and duration for status bar
                 status_model = actual_model_used or model_name
@@ -658,6 +715,7 @@ class ChatManager:
                     "total_tokens": total_tokens,
                     "cost_str": cost_str,
                     "model_used": status_model,  # Always use model_used key
+                    "cache_hit": cached_response is not None,
                     "response_content": assistant_response_content,
                 }
                 self.context_provider.display_status(status_info)
@@ -665,7 +723,7 @@ class ChatManager:
             return assistant_response_content
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self.logger.error(f"Error during chat: {e}")
 
             # Show error in status bar
@@ -685,12 +743,151 @@ class ChatManager:
             # Re-raise to let caller handle
             raise
 
+    def _calculate_usage(
+        self, messages: List[Message], assistant_response_content: Any, model_name: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Work out token usage and cost of the LLM call that just completed.
+
+        Args:
+            messages: Messages that were sent to the LLM
+            assistant_response_content: The LLM response
+            model_name: Model the request was sent to
+
+        Returns:
+            Dictionary with tokens_in, tokens_out, total_tokens, cached_tokens and cost_str
+        """
+        from .utils.token_utils import count_tokens
+
+        # Get token usage data from the LLM client
+        cached_tokens = 0
+        get_last_token_usage = getattr(self.llm_client, "get_last_token_usage", None)
+        if get_last_token_usage is not None:
+            token_usage = get_last_token_usage()
+            tokens_in = token_usage.get("prompt_tokens", 0)
+            tokens_out = token_usage.get("completion_tokens", 0)
+            total_tokens = token_usage.get("total_tokens", 0)
+            cached_tokens = token_usage.get("cached_tokens", 0)
+            if not tokens_in and messages:
+                # Streaming responses usually carry no usage, so estimate the prompt size
+                tokens_in = count_tokens("\n".join([m.content for m in messages]))
+                total_tokens = tokens_in + tokens_out
+            self.logger.debug(
+                f"Token usage from API: {tokens_in} (prompt, {cached_tokens} cached) + "
+                f"{tokens_out} (completion) = {total_tokens} (total)"
+            )
+        else:
+            # Fallback to estimation if token usage isn't available from the client
+            # Get text content from messages
+            input_text = "\n".join([m.content for m in messages])
+            # Use proper token counting function
+            tokens_in = count_tokens(input_text)
+
+            # Ensure assistant_response_content is treated as a string for length calculation
+            response_content_str = (
+                str(assistant_response_content) if assistant_response_content is not None else ""
+            )
+            tokens_out = count_tokens(response_content_str)
+            total_tokens = tokens_in + tokens_out
+            self.logger.debug(
+                f"Estimated token usage: {tokens_in} (prompt) + "
+                f"{tokens_out} (completion) = {total_tokens} (total)"
+            )
+
+        # Calculate cost from the token counts and the model's rates (with model alias mapping)
+        mapped_model_name = self.model_mapper.get_full_name(model_name) if model_name else None
+        rates = _get_model_rates(mapped_model_name) if mapped_model_name else None
+        if rates is not None:
+            rate_in, rate_cached, rate_out = rates
+            # Prompt-cache hits are billed at the (cheaper) cached-input rate
+            cost_dollars = (
+                (tokens_in - cached_tokens) * rate_in
+                + cached_tokens * rate_cached
+                + tokens_out * rate_out
+            )
+        else:
+            self.logger.warning(f"No pricing data for model '{mapped_model_name}', cost unknown")
+            cost_dollars = 0.0
+
+        # Format cost as a string for display
+        cost_str = f"{cost_dollars:f}"
+
+        return {
+            "tokens_in": tokens_in,
+            "tokens_out": tokens_out,
+            "total_tokens": total_tokens,
+            "cached_tokens": cached_tokens,
+            "cost_str": cost_str,
+        }
+
+    def set_model_rate(
+        self,
+        model: str,
+        input_rate: float,
+        output_rate: float,
+        cached_rate: Optional[float] = None,
+    ) -> None:
+        """
+        Override the per-token USD rates used to compute the cost of a model.
+
+        Args:
+            model: Model name or alias
+            input_rate: USD per prompt token
+            output_rate: USD per completion token
+            cached_rate: USD per cached prompt token (defaults to input_rate)
+        """
+        full_name = self.model_mapper.get_full_name(model)
+        _MODEL_RATES[full_name] = (
+            input_rate,
+            input_rate if cached_rate is None else cached_rate,
+            output_rate,
+        )
+        self.logger.info(f"Set rates for model '{full_name}': {_MODEL_RATES[full_name]}")
+
+    def _get_response_cache(self) -> ResponseCache:
+        """Get the response cache, creating it on first use."""
+        if self._response_cache is None:
+            self._response_cache = ResponseCache(self.settings.response_cache_dir)
+        return self._response_cache
+
+    def _get_call_config(self) -> Dict[str, Any]:
+        """
+        Get the client configuration requests are sent with, for the response cache key.
+
+        The adapters merge their instance overrides (temperature, api_base, ...)
+        into every request, so the overrides and the adapter in use are part of
+        the request. The API key is left out since it doesn't change the answer.
+
+        Returns:
+            Dictionary of the overrides (without api_key) plus the adapter class name
+        """
+        if self.llm_client is None:
+            return {}
+
+        config = {
+            key: value for key, value in self.llm_client.get_overrides().items() if key != "api_key"
+        }
+        config["adapter"] = type(self.llm_client).__name__
+        return config
+
+    def get_last_response_metadata(self) -> Dict[str, Any]:
+        """
+        Get the token, cost and model metadata of the most recent chat() call.
+
+        Unlike reading the last assistant message from the history, this is
+        also available when the exchange was not added to the history.
+
+        Returns:
+            Metadata dictionary (empty if the last call failed or none was made)
+        """
+        return self._last_response_metadata
+
     def list_personas(self) -> List[str]:
         """
         List available personas.
 
         Returns:
-            List of persona names
+            List of persona names, sorted by name
         """
         if not self.persona_loader:
             self.logger.warning("No persona loader configured")
@@ -703,7 +900,7 @@ class ChatManager:
         List available snippets.
 
         Returns:
-            List of snippet names
+            List of snippet names, sorted by name
         """
         if not self.snippet_provider:
             self.logger.warning("No snippet provider configured")
@@ -723,6 +920,21 @@ class ChatManager:
         """
         return self.conversation_manager._save_current_conversation()
 
+    def prepare_save_conversation(
+        self, filename: Optional[str] = None
+    ) -> Optional[Callable[[], Optional[str]]]:
+        """
+        Capture the current conversation for a save that runs later, e.g. on another thread.
+
+        Args:
+            filename: Base filename to use for saving
+
+        Returns:
+            A function that writes the captured conversation and returns its path
+            (None on failure), or None if there is nothing to save
+        """
+        return self.conversation_manager.prepare_save()
+
     def load_conversation(self, conversation_id: str) -> bool:
         """
         Load a conversation from a file.
@@ -735,6 +947,40 @@ class ChatManager:
         """
         return self.conversation_manager.load_conversation(conversation_id)
 
+    def get_history_length(self) -> int:
+        """
+        Get the number of messages in the current conversation without copying it.
+
+        Returns:
+            Number of messages in the conversation
+        """
+        if self.conversation_manager:
+            return len(self.conversation_manager.messages)
+        return 0
+
+    def get_last_message(self) -> Optional[Message]:
+        """
+        Get the most recent message of the current conversation without copying it.
+
+        Returns:
+            The last message, or None if the conversation is empty
+        """
+        if self.conversation_manager:
+            return self.conversation_manager.get_last_message()
+        return None
+
+    def get_token_stats(self) -> Dict[str, Any]:
+        """
+        Get the token totals of the current conversation.
+
+        Returns:
+            Dictionary with tokens_in, tokens_out, total_tokens, estimated_messages
+            and models_used, as computed by ConversationManager.get_token_stats()
+        """
+        if self.conversation_manager:
+            return self.conversation_manager.get_token_stats()
+        return count_token_stats([])
+
     def get_history(self) -> List[Message]:
         """
         Get the current conversation history.
@@ -51,6 +51,7 @@ class Settings(BaseSettings):
         "log_level": str,
         "console_log_level": str,
         "log_file": str,
+        "verbose_load": bool,
         # Image settings
         "image_default_width": int,
         "image_default_quality": float,
@@ -68,6 +69,8 @@ class Settings(BaseSettings):
         "gdocs_parallel_fetch_limit": int,
         "gdocs_request_timeout": int,
         "sqlite_path": str,
+        "response_cache": bool,
+        "response_cache_dir": str,
     }
 
     # Default settings
@@ -149,6 +152,9 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO", description="Global logging level")
     console_log_level: str = Field(default="WARNING", description="Console logging level")
     log_file: str = Field(default=str(get_base_dir() / "cellmage.log"), description="Log file path")
+    verbose_load: bool = Field(
+        default=False, description="Print a confirmation when each extension is loaded"
+    )
 
     # Google Docs integration settings
     gdocs_token_path: str = Field(
@@ -197,6 +203,16 @@ class Settings(BaseSettings):
         description="Path to SQLite database file. Defaults to ${base_dir}/.data/conversations.db unless CELLMAGE_SQLITE_PATH is set.",
     )
 
+    # Response cache settings
+    response_cache: bool = Field(
+        default=False,
+        description="Reuse stored LLM responses for repeated requests instead of calling the LLM",
+    )
+    response_cache_dir: str = Field(
+        default="~/.cache/cellmage/responses",
+        description="Directory where cached LLM responses are stored",
+    )
+
     model_config = SettingsConfigDict(
         env_prefix="CELLMAGE_",
         case_sensitive=False,
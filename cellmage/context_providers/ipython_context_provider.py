@@ -6,6 +6,7 @@ that works with IPython/Jupyter environments.
 """
 
 import logging
+import time
 import uuid
 from typing import Any, Dict, Optional, Tuple
 
@@ -33,6 +34,11 @@ except ImportError:
 # Import from parent package
 from ..interfaces import ContextProvider  # noqa: E402
 
+# A streaming response is re-rendered at most every _STREAM_FLUSH_INTERVAL seconds,
+# unless at least _STREAM_FLUSH_CHARS new characters arrived since the last render
+_STREAM_FLUSH_INTERVAL = 0.05
+_STREAM_FLUSH_CHARS = 64
+
 
 class IPythonContextProvider(ContextProvider):
     """
@@ -48,6 +54,9 @@ class IPythonContextProvider(ContextProvider):
         """Initialize the context provider."""
         self._ipython = get_ipython() if _IPYTHON_AVAILABLE else None
         self._display_handles = {}  # Store display handles for updating
+        # Status bar of the cell currently running, updated in place if shown again
+        self._status_handle: Any = None
+        self._status_execution_count: Optional[int] = None
 
     def display_markdown(self, content: str) -> None:
         """
@@ -95,7 +104,13 @@ class IPythonContextProvider(ContextProvider):
             stream_id = str(uuid.uuid4().hex)
 
             # Set up the base content for tracking accumulated output
-            stream_obj = {"content": "", "id": stream_id}
+            stream_obj = {
+                "chunks": [],
+                "pending": 0,
+                "last_flush": 0.0,
+                "printed": 0,
+                "id": stream_id,
+            }
 
             if _WIDGETS_AVAILABLE:
                 # Try ipywidgets approach first
@@ -110,8 +125,8 @@ class IPythonContextProvider(ContextProvider):
                     # Fall through to simpler approach
 
             # Simple approach using direct display
-            # Display initial empty markdown that we'll update
-            display(Markdown(""))
+            # Display initial empty markdown that we'll update in place
+            stream_obj["handle"] = display(Markdown(""), display_id=True)
 
             # Store the stream object for tracking content
             self._display_handles[stream_id] = True
@@ -127,42 +142,75 @@ class IPythonContextProvider(ContextProvider):
         """
         Update a streaming display with new content.
 
+        Chunks are buffered and the display is only re-rendered when enough time
+        has passed or enough text has arrived, instead of once per token.
+
         Args:
             display_object: The display object from display_stream_start
             content: The content to display
         """
-        if not _IPYTHON_AVAILABLE or not display_object:
+        if (
+            not _IPYTHON_AVAILABLE
+            or not isinstance(display_object, dict)
+            or "id" not in display_object
+        ):
             # For non-IPython environments or if display failed to initialize
             print(content, end="", flush=True)
             return
 
-        try:
-            # Append new content to existing accumulated content
-            if isinstance(display_object, dict):
-                display_object["content"] += content
-                accumulated_content = display_object["content"]
-            else:
-                accumulated_content = content
+        display_object["chunks"].append(content)
+        display_object["pending"] += len(content)
+
+        if (
+            display_object["pending"] < _STREAM_FLUSH_CHARS
+            and time.monotonic() - display_object["last_flush"] < _STREAM_FLUSH_INTERVAL
+        ):
+            return
+
+        self._render_stream(display_object)
+
+    def finish_stream(self, display_object: Any) -> None:
+        """
+        Render any buffered content of a streaming display.
+
+        Args:
+            display_object: The display object from display_stream_start
+        """
+        if isinstance(display_object, dict) and display_object.get("pending"):
+            self._render_stream(display_object)
+
+    def _render_stream(self, display_object: Dict[str, Any]) -> None:
+        """Re-render a streaming display with all content received so far."""
+        chunks = display_object["chunks"]
+        if len(chunks) > 1:
+            # Keep a single chunk so the next render doesn't join everything again
+            chunks[:] = ["".join(chunks)]
+        accumulated_content = chunks[0] if chunks else ""
+        display_object["pending"] = 0
+        display_object["last_flush"] = time.monotonic()
 
+        try:
             # Try widgets approach first if available
-            if (
-                _WIDGETS_AVAILABLE
-                and isinstance(display_object, dict)
-                and "widget" in display_object
-            ):
+            if _WIDGETS_AVAILABLE and "widget" in display_object:
                 with display_object["widget"]:
                     clear_output(wait=True)
                     display(Markdown(accumulated_content))
                 return
 
-            # For non-widget approach, use standard display with clear_output
+            handle = display_object.get("handle")
+            if handle is not None:
+                handle.update(Markdown(accumulated_content))
+                return
+
+            # Fall back to clearing the cell output and displaying again
             clear_output(wait=True)
             display(Markdown(accumulated_content))
 
         except Exception as e:
             logger.error(f"Error updating stream display: {e}")
-            # Emergency fallback - print to console
-            print(content, end="", flush=True)
+            # Emergency fallback - print the content not printed yet to the console
+            print(accumulated_content[display_object["printed"] :], end="", flush=True)
+            display_object["printed"] = len(accumulated_content)
 
     def display_status(self, status_info: Dict[str, Any]) -> None:
         """
@@ -188,6 +236,7 @@ class IPythonContextProvider(ContextProvider):
         success = status_info.get("success", False)
         tokens_in = status_info.get("tokens_in")
         tokens_out = status_info.get("tokens_out")
+        cached_tokens = status_info.get("cached_tokens")
         cost_str = status_info.get("cost_str")
         model_used = status_info.get("model_used")
 
@@ -197,10 +246,17 @@ class IPythonContextProvider(ContextProvider):
         tokens_text = ""
         if tokens_in is not None or tokens_out is not None:
             in_txt = f"{tokens_in}↑" if tokens_in is not None else "?"  # Changed from ↓ to ↑
+            if cached_tokens and tokens_in:
+                # Show how much of the prompt was served from the provider's prompt cache
+                in_txt += f" ({cached_tokens}/{tokens_in} cached)"
             out_txt = f"{tokens_out}↓" if tokens_out is not None else "?"  # Changed from ↑ to ↓
             tokens_text = f" • {in_txt}/{out_txt} tokens"
 
         cost_text = f" • ${cost_str}" if cost_str else ""
+        if status_info.get("cache_hit"):
+            cost_text += " • cached response"
+        if status_info.get("skipped"):
+            cost_text += " • skipped"
 
         # Single unified status text
         status_text = f"{icon}{model_text} • {duration:.2f}s{tokens_text}{cost_text}"
@@ -319,7 +375,17 @@ class IPythonContextProvider(ContextProvider):
         </div>
         """
         try:
-            display(HTML(status_html))
+            # Only one status bar per cell: a second status for the same run updates the first
+            execution_count = getattr(self._ipython, "execution_count", None)
+            if (
+                self._status_handle is not None
+                and execution_count is not None
+                and execution_count == self._status_execution_count
+            ):
+                self._status_handle.update(HTML(status_html))
+            else:
+                self._status_handle = display(HTML(status_html), display_id=True)
+                self._status_execution_count = execution_count
         except Exception:
             # Fallback if display fails
             print(f"Status: {status_text}")
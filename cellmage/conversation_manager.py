@@ -5,10 +5,13 @@ This module provides a ConversationManager class for managing conversations with
 with SQLite as the default and recommended storage option.
 """
 
+import contextlib
 import logging
+import threading
 import uuid
+from collections import Counter
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .config import settings
 from .interfaces import ContextProvider
@@ -18,6 +21,57 @@ from .storage.sqlite_store import SQLiteStore
 from .utils.token_utils import count_tokens
 
 
+def count_token_stats(
+    messages: Iterable[Message], stats: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Add up the token counts of messages, as shown by %llm_config --status.
+
+    Messages without token metadata are estimated from their content.
+
+    Args:
+        messages: Messages to count
+        stats: Totals to add to, updated in place; a new dictionary if None
+
+    Returns:
+        Dictionary with tokens_in, tokens_out, total_tokens (sum of the messages'
+        own totals), estimated_messages and models_used (a Counter of the models
+        that produced the assistant messages)
+    """
+    if stats is None:
+        stats = {
+            "tokens_in": 0,
+            "tokens_out": 0,
+            "total_tokens": 0,
+            "estimated_messages": 0,
+            "models_used": Counter(),
+        }
+
+    models_used = stats["models_used"]
+    for msg in messages:
+        metadata = msg.metadata
+        if metadata:
+            get = metadata.get
+            stats["tokens_in"] += get("tokens_in", 0)
+            stats["tokens_out"] += get("tokens_out", 0)
+            msg_total = get("total_tokens", 0)
+            if msg_total > 0:
+                stats["total_tokens"] += msg_total
+
+            model = get("model_used")
+            if model and msg.role == "assistant":
+                models_used[model] += 1
+        elif msg.content:
+            estimated_tokens = count_tokens(msg.content)
+            if msg.role == "user" or msg.role == "system":
+                stats["tokens_in"] += estimated_tokens
+            elif msg.role == "assistant":
+                stats["tokens_out"] += estimated_tokens
+            stats["estimated_messages"] += 1
+
+    return stats
+
+
 class ConversationManager:
     """
     Manages conversation data using configurable storage backends, with SQLite as default.
@@ -55,6 +109,22 @@ class ConversationManager:
         self.messages: List[Message] = []
         self.cell_last_message_index: Dict[str, int] = {}
 
+        # Open transaction() blocks and whether a save was deferred inside them
+        self._transaction_depth = 0
+        self._save_pending = False
+
+        # Saves may be written from another thread (see prepare_save()). Each save
+        # is numbered when its messages are taken, and a write is skipped if a
+        # later save of the same conversation has already been written.
+        self._save_lock = threading.Lock()
+        self._save_count = 0
+        self._last_write: Optional[Tuple[str, int, Optional[str]]] = None
+
+        # Running totals for get_token_stats() and the message list they cover
+        self._token_stats: Optional[Dict[str, Any]] = None
+        self._token_stats_messages: Optional[List[Message]] = None
+        self._token_stats_count = 0
+
     def _init_storage(self, db_path: Optional[str] = None) -> None:
         """Initialize the storage backend based on storage_type."""
         if self.storage_type == "sqlite":
@@ -132,6 +202,46 @@ class ConversationManager:
 
         return message.id
 
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator["ConversationManager"]:
+        """
+        Group several history changes into a single save.
+
+        Inside the block, add_message(), perform_rollback() and clear_messages()
+        only update the in-memory history; the conversation is written to the
+        store once, in one commit, when the outermost block exits. If the block
+        raises, the in-memory history is restored and nothing is written.
+
+        Yields:
+            This conversation manager
+        """
+        if self._transaction_depth > 0:
+            # Nested block: the outermost one saves or restores
+            self._transaction_depth += 1
+            try:
+                yield self
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        saved_messages = list(self.messages)
+        saved_cell_index = dict(self.cell_last_message_index)
+        self._transaction_depth = 1
+        self._save_pending = False
+        try:
+            yield self
+        except BaseException:
+            self.messages = saved_messages
+            self.cell_last_message_index = saved_cell_index
+            raise
+        else:
+            if self._save_pending:
+                self._transaction_depth = 0
+                self._save_current_conversation()
+        finally:
+            self._transaction_depth = 0
+            self._save_pending = False
+
     def get_messages(self) -> List[Message]:
         """
         Get a copy of the current messages.
@@ -141,6 +251,40 @@ class ConversationManager:
         """
         return self.messages.copy()
 
+    def get_last_message(self) -> Optional[Message]:
+        """
+        Get the most recent message without copying the history.
+
+        Returns:
+            The last message, or None if the conversation is empty
+        """
+        return self.messages[-1] if self.messages else None
+
+    def get_token_stats(self) -> Dict[str, Any]:
+        """
+        Get the token totals of the current conversation.
+
+        Messages appended since the last call are added to the running totals.
+        The totals are only recomputed when the message list has been replaced
+        (load, clear, rollback). Messages without token metadata are estimated
+        from their content.
+
+        Returns:
+            Dictionary with tokens_in, tokens_out, total_tokens (sum of the
+            messages' own totals), estimated_messages and models_used (a Counter
+            of the models that produced the assistant messages)
+        """
+        messages = self.messages
+        if self._token_stats_messages is messages and self._token_stats_count <= len(messages):
+            stats = count_token_stats(messages[self._token_stats_count :], self._token_stats)
+        else:
+            stats = count_token_stats(messages)
+
+        self._token_stats = stats
+        self._token_stats_messages = messages
+        self._token_stats_count = len(messages)
+        return {**stats, "models_used": Counter(stats["models_used"])}
+
     def perform_rollback(
         self,
         current_cell_id: Optional[str] = None,
@@ -493,6 +637,54 @@ class ConversationManager:
 
         return metadata
 
+    def _can_save(self) -> bool:
+        """Check whether there is anything to save now; saves inside transactions are deferred."""
+        if not self.store:
+            self.logger.error("Cannot save: No store configured")
+            return False
+
+        if self._transaction_depth > 0:
+            # Saved once when the enclosing transaction() exits
+            self._save_pending = True
+            return False
+
+        if not self.messages:
+            self.logger.warning("Cannot save: No messages to save")
+            return False
+
+        return True
+
+    def _write_conversation(
+        self,
+        messages: List[Message],
+        metadata: ConversationMetadata,
+        conversation_id: str,
+        save_number: int,
+    ) -> Optional[str]:
+        """
+        Write a conversation to the store, unless a later save of it was already written.
+
+        Returns:
+            URI of the saved conversation or None on failure
+        """
+        with self._save_lock:
+            last_write = self._last_write
+            if last_write and last_write[0] == conversation_id and last_write[1] > save_number:
+                self.logger.debug(f"Skipping outdated save of conversation {conversation_id}")
+                return last_write[2]
+
+            try:
+                self.logger.debug(f"Saving conversation with ID: {conversation_id}")
+                save_path = self.store.save_conversation(
+                    messages=messages, metadata=metadata, filename=conversation_id
+                )
+            except Exception as e:
+                self.logger.error(f"Error saving conversation: {e}")
+                return None
+
+            self._last_write = (conversation_id, save_number, save_path)
+            return save_path
+
     def _save_current_conversation(self) -> Optional[str]:
         """
         Save the current conversation to SQLite.
@@ -500,26 +692,48 @@ class ConversationManager:
         Returns:
             URI of the saved conversation or None on failure
         """
-        if not self.store:
-            self.logger.error("Cannot save: No store configured")
-            return None
-
-        if not self.messages:
-            self.logger.warning("Cannot save: No messages to save")
+        if not self._can_save():
             return None
 
         try:
             # Build metadata
             metadata = self._build_conversation_metadata()
+        except Exception as e:
+            self.logger.error(f"Error saving conversation: {e}")
+            return None
 
-            # Save using the store
-            self.logger.debug(f"Saving conversation with ID: {self.current_conversation_id}")
-            save_path = self.store.save_conversation(
-                messages=self.messages, metadata=metadata, filename=self.current_conversation_id
-            )
+        self._save_count += 1
+        return self._write_conversation(
+            self.messages, metadata, self.current_conversation_id, self._save_count
+        )
 
-            return save_path
+    def prepare_save(self) -> Optional[Callable[[], Optional[str]]]:
+        """
+        Take a copy of the current conversation and return a function that saves it.
+
+        The messages and metadata are captured when this is called, so the
+        returned function can run on another thread while the conversation keeps
+        changing. It does nothing if a later save has been written in the meantime.
 
+        Returns:
+            A function that writes the captured conversation and returns its URI
+            (None on failure), or None if there is nothing to save
+        """
+        if not self._can_save():
+            return None
+
+        try:
+            metadata = self._build_conversation_metadata()
         except Exception as e:
             self.logger.error(f"Error saving conversation: {e}")
             return None
+
+        messages = [message.model_copy(deep=True) for message in self.messages]
+        conversation_id = self.current_conversation_id
+        self._save_count += 1
+        save_number = self._save_count
+
+        def write() -> Optional[str]:
+            return self._write_conversation(messages, metadata, conversation_id, save_number)
+
+        return write
@@ -1,7 +1,11 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
-from .models import ConversationMetadata, Message, PersonaConfig
+# Only needed for annotations: importing the interfaces doesn't load the pydantic models
+if TYPE_CHECKING:
+    from .models import ConversationMetadata, Message, PersonaConfig
 
 # Type definition for a stream callback function
 StreamCallbackHandler = Callable[[str], None]
@@ -105,7 +109,7 @@ class PersonaLoader(ABC):
         List available personas.
 
         Returns:
-            List of persona names
+            List of persona names, sorted by name
         """
         pass
 
@@ -132,7 +136,7 @@ class SnippetProvider(ABC):
         List available snippets.
 
         Returns:
-            List of snippet names
+            List of snippet names, sorted by name
         """
         pass
 
@@ -251,6 +255,15 @@ class ContextProvider(ABC):
         """
         pass
 
+    def finish_stream(self, display_object: Any) -> None:
+        """
+        Finish a streaming display, rendering anything that is still buffered.
+
+        Args:
+            display_object: The display object from display_stream_start
+        """
+        pass
+
     @abstractmethod
     def display_status(self, status_info: Dict[str, Any]) -> None:
         """
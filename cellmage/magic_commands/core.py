@@ -9,8 +9,43 @@ from typing import Any, Dict
 
 logger = logging.getLogger(__name__)
 
+# Box-drawing rules shared by the magics' reports
+HEAVY_RULE = "═" * 58
+LIGHT_RULE = "─" * 58
+SECTION_RULE = "━" * 30
+
+
+def report_extension_loaded(message: str) -> None:
+    """Print an extension-loaded message if CELLMAGE_VERBOSE_LOAD is set, otherwise log it.
+
+    Args:
+        message: Message to show, e.g. "✅ GitHub Magics loaded."
+    """
+    from ..config import settings
+
+    if settings.verbose_load:
+        print(message)
+    else:
+        logger.info(message)
+
 
 # Common functions that might be used by multiple magic command implementations
+def preview_text(text: str, length: int = 100) -> str:
+    """Shorten a text to a one-line preview for reports.
+
+    Args:
+        text: Text to preview, e.g. a message or system prompt
+        length: Maximum length of the preview, including the trailing "..."
+
+    Returns:
+        The text with newlines replaced by spaces, cut to ``length`` characters
+    """
+    # Cut before replacing newlines so only the shown part is copied
+    if len(text) > length:
+        return text[: length - 3].replace("\n", " ") + "..."
+    return text.replace("\n", " ")
+
+
 def format_tokens_info(tokens_in: int, tokens_out: int) -> str:
     """Format token usage information for display.
 
@@ -60,17 +95,20 @@ def extract_metadata_for_status(metadata: Dict[str, Any]) -> Dict[str, Any]:
     result = {}
     if not metadata:
         return result
-    # Always use 'model_used' for status bar
-    if "model_used" in metadata:
-        result["model_used"] = metadata["model_used"]
-    elif "model" in metadata:
-        result["model_used"] = metadata["model"]
+    # Always use 'model_used' for status bar; leave it unset when the call didn't report one
+    model_used = metadata.get("model_used") or metadata.get("model")
+    if model_used:
+        result["model_used"] = model_used
     if "tokens_in" in metadata:
         result["tokens_in"] = metadata["tokens_in"]
     if "tokens_out" in metadata:
         result["tokens_out"] = metadata["tokens_out"]
+    if "cached_tokens" in metadata:
+        result["cached_tokens"] = metadata["cached_tokens"]
     if "cost_str" in metadata:
         result["cost_str"] = metadata["cost_str"]
+    if metadata.get("cache_hit"):
+        result["cache_hit"] = True
     return result
 
 
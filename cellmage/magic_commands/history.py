@@ -4,11 +4,20 @@ History management commands for CellMage.
 This module provides the history management and persistence commands for CellMage.
 """
 
+import functools
 import logging
 import os
+from collections import Counter
+from pathlib import Path
 from typing import Any, Dict, List
 
-from cellmage.magic_commands.core import extract_metadata_for_status
+from cellmage.magic_commands.core import (
+    HEAVY_RULE,
+    LIGHT_RULE,
+    SECTION_RULE,
+    extract_metadata_for_status,
+    preview_text,
+)
 from cellmage.utils.message_token_utils import get_token_counts
 
 from ..chat_manager import ChatManager
@@ -18,6 +27,15 @@ from ..exceptions import PersistenceError, ResourceNotFoundError
 # Logging setup
 logger = logging.getLogger(__name__)
 
+# Icons shown in front of each message of --show-history
+_ROLE_ICONS = {"system": "⚙️", "user": "👤", "assistant": "🤖"}
+
+
+@functools.lru_cache(maxsize=32)
+def _resolved_dir(directory: str) -> Path:
+    """Resolve a configured directory once; resolve() stats every ancestor of the path."""
+    return Path(directory).resolve()
+
 
 def handle_history_commands(args, manager: ChatManager) -> bool:
     """
@@ -49,7 +67,7 @@ def handle_history_commands(args, manager: ChatManager) -> bool:
 
         # Print history header with summary information
         print("📜 Conversation History")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print(SECTION_RULE)
         print(f"• Messages: {len(history)}")
 
         # Format token information
@@ -61,14 +79,17 @@ def handle_history_commands(args, manager: ChatManager) -> bool:
         if not history:
             print("(No messages in history)")
         else:
+            # Status metadata of each message, extracted once for the summary and the listing
+            message_meta = [
+                extract_metadata_for_status(msg.metadata) if msg.metadata else {} for msg in history
+            ]
+
             # First, display a summary of models used in the conversation
-            models_used = {}
-            for msg in history:
-                if msg.metadata:
-                    meta = extract_metadata_for_status(msg.metadata)
-                    model = meta.get("model_used") or meta.get("model") or ""
-                    if model and msg.role == "assistant":
-                        models_used[model] = models_used.get(model, 0) + 1
+            models_used = Counter(
+                meta["model_used"]
+                for msg, meta in zip(history, message_meta)
+                if msg.role == "assistant" and meta.get("model_used")
+            )
 
             if models_used:
                 model_str = "• 🤖 Models: " + ", ".join(
@@ -76,27 +97,18 @@ def handle_history_commands(args, manager: ChatManager) -> bool:
                 )
                 print(model_str)
 
-            print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+            print(SECTION_RULE)
 
             # Display the messages with improved formatting
             for i, msg in enumerate(history):
-                meta = extract_metadata_for_status(msg.metadata) if msg.metadata else {}
+                meta = message_meta[i]
                 tokens_in = meta.get("tokens_in", 0)
                 tokens_out = meta.get("tokens_out", 0)
                 model_used = meta.get("model_used") or meta.get("model") or ""
                 cost_str = meta.get("cost_str") or meta.get("cost") or ""
 
                 # Determine role icon and create a formatted role label
-                role_icon = ""
-                if msg.role == "system":
-                    role_icon = "⚙️"
-                elif msg.role == "user":
-                    role_icon = "👤"
-                elif msg.role == "assistant":
-                    role_icon = "🤖"
-                else:
-                    role_icon = "📄"
-
+                role_icon = _ROLE_ICONS.get(msg.role, "📄")
                 role_label = f"[{i}] {role_icon} {msg.role.upper()}"
 
                 # Display token info based on role
@@ -115,10 +127,7 @@ def handle_history_commands(args, manager: ChatManager) -> bool:
                     print(role_label)
 
                 # Format the message content with proper handling of long text
-                content_preview = msg.content.replace("\n", " ").strip()
-                if len(content_preview) > 100:
-                    content_preview = content_preview[:97] + "..."
-                print(f"  {content_preview}")
+                print(f"  {preview_text(msg.content.strip())}")
 
                 # Format metadata in a cleaner way
                 meta_items = []
@@ -141,7 +150,7 @@ def handle_history_commands(args, manager: ChatManager) -> bool:
                 if i < len(history) - 1:
                     print("  ·····")
 
-            print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+            print(SECTION_RULE)
 
     return action_taken
 
@@ -164,23 +173,31 @@ def handle_persistence_commands(args, manager: ChatManager) -> bool:
         try:
             sessions = manager.conversation_manager.list_conversations()
             method_used = "conversation_manager.list_conversations"
-            print("══════════════════════════════════════════════════════════")
-            print("  📋 Saved Sessions")
-            print("══════════════════════════════════════════════════════════")
+            # Collect the lines and print them at once: every print is a separate
+            # message to the notebook frontend
+            lines = [
+                HEAVY_RULE,
+                "  📋 Saved Sessions",
+                HEAVY_RULE,
+            ]
             if sessions:
-                for session in sessions:
-                    # Print name if available, else id
-                    name = session.get("name") or session.get("id") or str(session)
-                    print(f"  • {name}")
-                print("──────────────────────────────────────────────────────────")
-                print(f"  Total: {len(sessions)} session(s)")
-                print("  Use: %llm_config --load SESSION_NAME to load a session")
+                # Show name if available, else id
+                lines.extend(
+                    f"  • {session.get('name') or session.get('id') or session}"
+                    for session in sessions
+                )
+                lines.append(LIGHT_RULE)
+                lines.append(f"  Total: {len(sessions)} session(s)")
+                lines.append("  Use: %llm_config --load SESSION_NAME to load a session")
             else:
-                print("  No saved sessions found.")
+                lines.append("  No saved sessions found.")
                 if hasattr(manager, "settings") and hasattr(manager.settings, "conversations_dir"):
-                    print(f"  Sessions directory: {manager.settings.conversations_dir}")
-                print("  Use: %llm_config --save SESSION_NAME to save the current conversation")
-            print("══════════════════════════════════════════════════════════")
+                    lines.append(f"  Sessions directory: {manager.settings.conversations_dir}")
+                lines.append(
+                    "  Use: %llm_config --save SESSION_NAME to save the current conversation"
+                )
+            lines.append(HEAVY_RULE)
+            print("\n".join(lines))
             logger.debug(f"Listed {len(sessions)} sessions using {method_used}")
         except Exception as e:
             print(f"❌ Error listing saved sessions: {e}")
@@ -204,9 +221,9 @@ def handle_persistence_commands(args, manager: ChatManager) -> bool:
             manager.settings.auto_save = True
             # Get absolute path for better user experience
             conversations_dir = os.path.abspath(manager.settings.conversations_dir)
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  🔄 Auto-Save Enabled")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print(f"  • Conversations will be saved to: {conversations_dir}")
 
             # Check if directory exists, create if not
@@ -218,7 +235,7 @@ def handle_persistence_commands(args, manager: ChatManager) -> bool:
                 except Exception as mkdir_error:
                     print(f"  ❌ Failed to create directory: {mkdir_error}")
 
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
         except Exception as e:
             print(f"❌ Error enabling auto-save: {e}")
 
@@ -226,12 +243,12 @@ def handle_persistence_commands(args, manager: ChatManager) -> bool:
         action_taken = True
         try:
             manager.settings.auto_save = False
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  🔄 Auto-Save Disabled")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  • Conversations will not be saved automatically.")
             print("  • Use %llm_config --save to manually save conversations.")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
         except Exception as e:
             print(f"❌ Error disabling auto-save: {e}")
 
@@ -240,42 +257,40 @@ def handle_persistence_commands(args, manager: ChatManager) -> bool:
         try:
             session_id = args.load
 
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print(f"  📂 Loading Session: {session_id}")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
 
             manager.conversation_manager.load_conversation(session_id)
             method = "conversation_manager.load_conversation"
 
             # Try to get history length after loading
             try:
-                history = manager.get_history()
+                message_count = manager.get_history_length()
                 print(f"  ✅ Session loaded successfully using '{method}'")
-                print(f"  • Messages: {len(history)}")
+                print(f"  • Messages: {message_count}")
             except Exception:
                 print(f"  ✅ Session loaded successfully using '{method}'")
 
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
 
         except ResourceNotFoundError:
             print(f"  ❌ Session '{session_id}' not found.")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
         except PersistenceError as e:
             print(f"  ❌ Error loading session: {e}")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
         except Exception as e:
             print(f"  ❌ Unexpected error: {e}")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
 
     # Save needs to be after load/clear etc.
     if args.save:
         action_taken = True
         try:
-            from pathlib import Path
-
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  💾 Saving Session")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             filename = args.save if isinstance(args.save, str) else None
             if filename is not None:
                 print(f"  • Name: {filename}")
@@ -285,7 +300,7 @@ def handle_persistence_commands(args, manager: ChatManager) -> bool:
             method = "conversation_manager._save_current_conversation"
             try:
                 if hasattr(manager.settings, "conversations_dir"):
-                    conv_dir = Path(manager.settings.conversations_dir).resolve()
+                    conv_dir = _resolved_dir(str(manager.settings.conversations_dir))
                     file_path = Path(save_path).resolve() if save_path else None
                     if file_path and str(file_path).startswith(str(conv_dir)):
                         rel_path = file_path.relative_to(conv_dir)
@@ -298,10 +313,10 @@ def handle_persistence_commands(args, manager: ChatManager) -> bool:
                 display_path = Path(save_path).name if save_path else str(save_path)
             print(f"  ✅ Session saved successfully using '{method}'")
             print(f"  • Path: {display_path}")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
         except PersistenceError as e:
             print(f"  ❌ Error saving session: {e}")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
         except Exception as e:
             print(f"  ❌ Unexpected error: {e}")
             if hasattr(manager, "settings") and hasattr(manager.settings, "conversations_dir"):
@@ -312,7 +327,7 @@ def handle_persistence_commands(args, manager: ChatManager) -> bool:
                     print(
                         "  Try creating it manually or use %llm_config --auto-save to create it automatically."
                     )
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
 
     return action_taken
 
@@ -20,7 +20,6 @@ def load_magics(ipython: Optional[InteractiveShell] = None) -> None:
     """
     import importlib
     import pkgutil
-    import sys
 
     try:
         # Get ipython if not provided
@@ -43,12 +42,12 @@ def load_magics(ipython: Optional[InteractiveShell] = None) -> None:
 
         # First register core magic classes - we load these explicitly to ensure proper order
         from .ambient_magic import AmbientModeMagics
-        from .config_magic import ConfigMagics
+        from .common import register_config_magic
         from .llm_magic import CoreLLMMagics
 
-        # Register the core magic classes
+        # Register the core magic classes. ConfigMagics is loaded on the first %llm_config.
         ipython.register_magics(CoreLLMMagics(ipython))
-        ipython.register_magics(ConfigMagics(ipython))
+        register_config_magic(ipython)
         ipython.register_magics(AmbientModeMagics(ipython))
         logger.info("Registered core magic commands")
 
@@ -56,7 +55,7 @@ def load_magics(ipython: Optional[InteractiveShell] = None) -> None:
         core_modules = {"ambient_magic", "config_magic", "llm_magic", "__pycache__"}
 
         # Modules that should not be processed as magic modules (utilities, etc.)
-        excluded_modules = {"common", "__pycache__"}
+        excluded_modules = {"common", "config_handlers", "magic_args", "__pycache__"}
 
         # Now dynamically discover and register any additional magic modules
         import cellmage.magic_commands.ipython as magics_pkg
@@ -7,12 +7,13 @@ cells are processed as LLM prompts, and the %%py magic to run cells as Python co
 
 import sys
 import time
+from typing import Any, Dict
 
 from IPython import get_ipython
 from IPython.core.magic import cell_magic, line_magic, magics_class
-from IPython.core.magic_arguments import argument, magic_arguments
+from IPython.core.magic_arguments import magic_arguments
 
-from cellmage.magic_commands.core import extract_metadata_for_status
+from cellmage.magic_commands.core import HEAVY_RULE, extract_metadata_for_status
 
 from ...ambient_mode import (
     disable_ambient_mode,
@@ -20,8 +21,8 @@ from ...ambient_mode import (
     is_ambient_mode_enabled,
     register_ambient_handler,
 )
-from ...context_providers.ipython_context_provider import get_ipython_context_provider
 from .common import _IPYTHON_AVAILABLE, IPythonMagicsBase, logger
+from .magic_args import LLM_CONFIG_ARGS, add_arguments
 
 # Global instance of AmbientModeMagics to use for the module-level function
 _ambient_magic_instance = None
@@ -67,62 +68,7 @@ class AmbientModeMagics(IPythonMagicsBase):
         logger.info("Registered ambient handler from AmbientModeMagics")
 
     @magic_arguments()
-    @argument("-p", "--persona", type=str, help="Select and activate a persona by name.")
-    @argument(
-        "--show-persona", action="store_true", help="Show the currently active persona details."
-    )
-    @argument("--list-personas", action="store_true", help="List available persona names.")
-    @argument(
-        "--set-override",
-        nargs=2,
-        metavar=("KEY", "VALUE"),
-        help="Set a temporary LLM param override (e.g., --set-override temperature 0.5).",
-    )
-    @argument("--remove-override", type=str, metavar="KEY", help="Remove a specific override key.")
-    @argument(
-        "--clear-overrides", action="store_true", help="Clear all temporary LLM param overrides."
-    )
-    @argument("--show-overrides", action="store_true", help="Show the currently active overrides.")
-    @argument(
-        "--clear-history",
-        action="store_true",
-        help="Clear the current chat history (keeps system prompt).",
-    )
-    @argument("--show-history", action="store_true", help="Display the current message history.")
-    @argument(
-        "--save",
-        type=str,
-        nargs="?",
-        const=True,
-        metavar="FILENAME",
-        help="Save session. If no name, uses current session ID. '.md' added automatically.",
-    )
-    @argument(
-        "--load",
-        type=str,
-        metavar="SESSION_ID",
-        help="Load session from specified identifier (filename without .md).",
-    )
-    @argument("--list-sessions", action="store_true", help="List saved session identifiers.")
-    @argument("--list-snippets", action="store_true", help="List available snippet names.")
-    @argument(
-        "--snippet",
-        type=str,
-        action="append",
-        help="Add user snippet content before sending prompt. Can be used multiple times.",
-    )
-    @argument(
-        "--sys-snippet",
-        type=str,
-        action="append",
-        help="Add system snippet content before sending prompt. Can be used multiple times.",
-    )
-    @argument(
-        "--status",
-        action="store_true",
-        help="Show current status (persona, overrides, history length).",
-    )
-    @argument("--model", type=str, help="Set the default model for the LLM client.")
+    @add_arguments(LLM_CONFIG_ARGS)
     @line_magic("llm_config_persistent")
     def configure_llm_persistent(self, line):
         """
@@ -153,21 +99,21 @@ class AmbientModeMagics(IPythonMagicsBase):
             enable_ambient_mode(ip)
             # Register the handler again to ensure it's set for persistent mode
             register_ambient_handler(process_cell_as_prompt)
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  🔄 Ambient Mode Enabled")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  • All cells will now be processed as LLM prompts")
             print("  • Cells starting with % (magic) or ! (shell) will run normally")
             print("  • Use %%py to run a specific cell as Python code")
             print("  • Use %disable_llm_config_persistent to disable ambient mode")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
         else:
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  ℹ️  Ambient Mode Status")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  • Ambient mode is already active")
             print("  • Use %disable_llm_config_persistent to disable it")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
 
     @line_magic("disable_llm_config_persistent")
     def disable_llm_config_persistent(self, line):
@@ -261,9 +207,9 @@ class AmbientModeMagics(IPythonMagicsBase):
         if not _IPYTHON_AVAILABLE:
             return
 
-        start_time = time.time()
-        status_info = {"success": False, "duration": 0.0}
-        context_provider = get_ipython_context_provider()
+        start_time = time.perf_counter()
+        status_info: Dict[str, Any] = {"success": False, "duration": 0.0}
+        context_provider = self._context_provider
 
         try:
             manager = self._get_manager()
@@ -276,7 +222,7 @@ class AmbientModeMagics(IPythonMagicsBase):
             logger.debug("Skipping empty prompt in ambient mode.")
             return
 
-        logger.debug(f"Processing cell as prompt in ambient mode: '{prompt[:50]}...'")
+        logger.debug("Processing cell as prompt in ambient mode: %r", prompt[:50])
 
         try:
             # Call the ChatManager's chat method with default settings
@@ -293,10 +239,7 @@ class AmbientModeMagics(IPythonMagicsBase):
                 status_info["success"] = True
                 status_info["response_content"] = result
                 try:
-                    from cellmage.magic_commands.core import get_last_assistant_metadata
-
-                    history = manager.get_history()
-                    last_meta = get_last_assistant_metadata(history)
+                    last_meta = manager.get_last_response_metadata()
                     status_info.update(extract_metadata_for_status(last_meta))
                 except Exception as e:
                     logger.error(f"Error computing status bar statistics: {e}")
@@ -306,10 +249,10 @@ class AmbientModeMagics(IPythonMagicsBase):
             logger.error(f"Error during LLM call in ambient mode: {e}")
             status_info["response_content"] = f"Error: {str(e)}"
         finally:
-            status_info["duration"] = time.time() - start_time
+            status_info["duration"] = time.perf_counter() - start_time
             # Always ensure model_used is present for the status bar
             if "model_used" not in status_info:
-                status_info["model_used"] = status_info.get("model", "")
+                status_info["model_used"] = self._default_model_name(manager)
             context_provider.display_status(status_info)
 
     @line_magic("llm_magic")
@@ -4,10 +4,11 @@ Common utilities and functions for IPython magic commands in CellMage.
 This module contains shared functionality used across the various magic command modules.
 """
 
+import contextlib
 import logging
 import os
 import sys
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 # IPython imports with fallback handling
 try:
@@ -29,6 +30,7 @@ except ImportError:
 
 from ...chat_manager import ChatManager
 from ...context_providers.ipython_context_provider import get_ipython_context_provider
+from .magic_args import coerce_param_value
 
 # Project imports
 # Note: Avoiding circular import by not directly importing BaseMagics
@@ -135,6 +137,98 @@ def get_chat_manager() -> ChatManager:
         raise RuntimeError(f"Error retrieving ChatManager: {e}")
 
 
+_param_deprecation_shown = False
+
+
+def _parse_param_pairs(param_groups: List[List[str]]) -> List[Tuple[str, str]]:
+    """
+    Split the values of repeated --param options into (key, value) pairs.
+
+    Accepts ``--param KEY=VALUE [KEY=VALUE ...]`` as well as the deprecated
+    two-token form ``--param KEY VALUE``.
+
+    Args:
+        param_groups: One list of tokens per --param occurrence
+
+    Returns:
+        List of (key, value) string pairs
+
+    Raises:
+        ValueError: If a token is neither KEY=VALUE nor part of a KEY VALUE pair
+    """
+    global _param_deprecation_shown
+    pairs = []
+    for tokens in param_groups:
+        if len(tokens) == 2 and "=" not in tokens[0]:
+            if not _param_deprecation_shown:
+                print("⚠️ '--param KEY VALUE' is deprecated, use '--param KEY=VALUE' instead.")
+                _param_deprecation_shown = True
+            pairs.append((tokens[0], tokens[1]))
+            continue
+        for token in tokens:
+            key, sep, value = token.partition("=")
+            if not sep or not key:
+                raise ValueError(f"Invalid --param '{token}', expected KEY=VALUE")
+            pairs.append((key, value))
+    return pairs
+
+
+def register_config_magic(ipython: Any) -> None:
+    """
+    Register %llm_config without importing ConfigMagics and its handlers yet.
+
+    A small stand-in magic is registered instead. Its first call imports
+    ConfigMagics, registers it in its place and runs the command, so sessions
+    that never configure anything don't pay for the handlers (and the adapter
+    modules they import).
+
+    Args:
+        ipython: The IPython shell to register the magic with
+    """
+
+    def llm_config(line):
+        """Configure the LLM session state and manage resources."""
+        from .config_magic import ConfigMagics
+
+        config_magics = ConfigMagics(ipython)
+        ipython.register_magics(config_magics)
+        logger.info("Registered ConfigMagics class with llm_config magic")
+        return config_magics.configure_llm(line)
+
+    ipython.register_magic_function(llm_config, magic_kind="line", magic_name="llm_config")
+
+
+@contextlib.contextmanager
+def model_override(llm_client: Any, model: Optional[str]) -> Iterator[bool]:
+    """
+    Override the LLM client's model for the duration of the block.
+
+    The previous override is restored on exit, also when the block raises.
+
+    Args:
+        llm_client: LLM client of the ChatManager (may be None)
+        model: Model to use inside the block; nothing is changed if empty
+
+    Yields:
+        True if the override was applied, False if the client doesn't support overrides
+    """
+    set_override = getattr(llm_client, "set_override", None) if model else None
+    if set_override is None:
+        yield False
+        return
+
+    original_model = llm_client.get_overrides().get("model")
+    set_override("model", model)
+    logger.debug(f"Temporarily set model override to: {model}")
+    try:
+        yield True
+    finally:
+        if original_model is not None:
+            set_override("model", original_model)
+        elif hasattr(llm_client, "remove_override"):
+            llm_client.remove_override("model")
+
+
 @magics_class
 class IPythonMagicsBase(Magics):
     """Base class for all IPython magic commands in CellMage."""
@@ -146,6 +240,8 @@ class IPythonMagicsBase(Magics):
 
         # Only call super().__init__ when IPython is available
         super().__init__(shell)
+        # The provider is a process-wide singleton; look it up once, not on every cell
+        self._context_provider = get_ipython_context_provider()
         try:
             get_chat_manager()
             logger.info(
@@ -170,6 +266,20 @@ class IPythonMagicsBase(Magics):
             )
             raise RuntimeError("NotebookLLM manager unavailable.") from e
 
+    def _default_model_name(self, manager: ChatManager) -> str:
+        """
+        Model a call without a reported model was sent to.
+
+        A model set with %llm_config --model takes precedence over the active persona's.
+        """
+        override_model = manager.get_overrides().get("model")
+        if override_model:
+            return str(override_model)
+        persona = manager.get_active_persona()
+        if persona and persona.config:
+            return persona.config.get("model") or ""
+        return ""
+
     def _prepare_runtime_params(self, args) -> Dict[str, Any]:
         """Extract runtime parameters from args and convert to dictionary.
 
@@ -177,29 +287,16 @@ class IPythonMagicsBase(Magics):
         """
         runtime_params = {}
 
-        # Handle simple parameters
-        if hasattr(args, "temperature") and args.temperature is not None:
+        # Handle simple parameters; the parser always sets these attributes
+        if args.temperature is not None:
             runtime_params["temperature"] = args.temperature
 
-        if hasattr(args, "max_tokens") and args.max_tokens is not None:
+        if args.max_tokens is not None:
             runtime_params["max_tokens"] = args.max_tokens
 
         # Handle arbitrary parameters from --param
-        if hasattr(args, "param") and args.param:
-            for key, value in args.param:
-                # Try to convert string values to appropriate types
-                try:
-                    # First try to convert to int or float if it looks numeric
-                    if "." in value:
-                        parsed_value = float(value)
-                    else:
-                        try:
-                            parsed_value = int(value)
-                        except ValueError:
-                            parsed_value = value
-                except ValueError:
-                    parsed_value = value
-
-                runtime_params[key] = parsed_value
+        if args.param:
+            for key, value in _parse_param_pairs(args.param):
+                runtime_params[key] = coerce_param_value(value)
 
         return runtime_params
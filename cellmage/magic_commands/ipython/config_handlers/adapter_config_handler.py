@@ -4,12 +4,11 @@ Adapter configuration handler for the %llm_config magic command.
 This module handles adapter-related arguments for the %llm_config magic command.
 """
 
+import importlib
 import logging
 import os
 from typing import Any
 
-from cellmage.adapters.direct_client import DirectLLMAdapter
-from cellmage.adapters.langchain_client import LangChainAdapter
 from cellmage.config import settings
 from cellmage.interfaces import LLMClientInterface
 
@@ -18,10 +17,19 @@ from .base_config_handler import BaseConfigHandler
 # Create a logger
 logger = logging.getLogger(__name__)
 
+# --adapter value -> (module, class, display name). Adapters are imported when
+# switched to, so the LangChain one only needs langchain installed when used.
+_ADAPTERS = {
+    "langchain": ("cellmage.adapters.langchain_client", "LangChainAdapter", "LangChain"),
+    "direct": ("cellmage.adapters.direct_client", "DirectLLMAdapter", "Direct"),
+}
+
 
 class AdapterConfigHandler(BaseConfigHandler):
     """Handler for LLM adapter configuration arguments."""
 
+    options = ("adapter",)
+
     def handle_args(self, args: Any, manager: Any) -> bool:
         """
         Handle adapter-related arguments for the %llm_config magic.
@@ -35,83 +43,54 @@ class AdapterConfigHandler(BaseConfigHandler):
         """
         action_taken = False
 
-        if hasattr(args, "adapter") and args.adapter:
+        if args.adapter:
             action_taken = True
             adapter_type = args.adapter.lower()
 
             try:
-                # Initialize the appropriate LLM client adapter
-                if adapter_type == "langchain":
-                    try:
-                        # Create new adapter instance with current settings from existing client
-                        current_api_key = None
-                        current_api_base = None
-                        current_model = settings.default_model
-
-                        if manager.llm_client:
-                            if hasattr(manager.llm_client, "get_overrides"):
-                                overrides = manager.llm_client.get_overrides()
-                                current_api_key = overrides.get("api_key")
-                                current_api_base = overrides.get("api_base")
-                                current_model = overrides.get("model", current_model)
-
-                        # Create the new adapter
-                        new_client: LLMClientInterface = LangChainAdapter(
-                            api_key=current_api_key,
-                            api_base=current_api_base,
-                            default_model=current_model,
-                        )
-
-                        # Set the new adapter
-                        manager.llm_client = new_client
-
-                        # Update env var for persistence between sessions
-                        os.environ["CELLMAGE_ADAPTER"] = "langchain"
-
-                        print("✅ Switched to LangChain adapter")
-                        logger.info("Switched to LangChain adapter")
-
-                    except ImportError:
-                        print(
-                            "❌ LangChain adapter not available. Make sure langchain is installed."
-                        )
-                        logger.error("LangChain adapter requested but not available")
-
-                elif adapter_type == "direct":
-                    # Create new adapter instance with current settings from existing client
-                    current_api_key = None
-                    current_api_base = None
-                    current_model = settings.default_model
-
-                    if manager.llm_client:
-                        if hasattr(manager.llm_client, "get_overrides"):
-                            overrides = manager.llm_client.get_overrides()
-                            current_api_key = overrides.get("api_key")
-                            current_api_base = overrides.get("api_base")
-                            current_model = overrides.get("model", current_model)
-
-                    # Create the new adapter
-                    new_client = DirectLLMAdapter(
+                if adapter_type not in _ADAPTERS:
+                    print(f"❌ Unknown adapter type: {adapter_type}")
+                    logger.error(f"Unknown adapter type requested: {adapter_type}")
+                    return action_taken
+                module_name, class_name, label = _ADAPTERS[adapter_type]
+
+                # Create new adapter instance with current settings from existing client
+                current_api_key = None
+                current_api_base = None
+                current_model = settings.default_model
+
+                get_overrides = getattr(manager.llm_client, "get_overrides", None)
+                if get_overrides is not None:
+                    overrides = get_overrides()
+                    current_api_key = overrides.get("api_key")
+                    current_api_base = overrides.get("api_base")
+                    current_model = overrides.get("model", current_model)
+
+                try:
+                    adapter_class = getattr(importlib.import_module(module_name), class_name)
+                    new_client: LLMClientInterface = adapter_class(
                         api_key=current_api_key,
                         api_base=current_api_base,
                         default_model=current_model,
                     )
+                except ImportError as e:
+                    print(
+                        f"❌ {label} adapter not available. Make sure its packages are installed."
+                    )
+                    logger.error(f"{label} adapter requested but not available: {e}")
+                    return action_taken
 
-                    # Set the new adapter
-                    manager.llm_client = new_client
-
-                    # Update env var for persistence between sessions
-                    os.environ["CELLMAGE_ADAPTER"] = "direct"
+                # Set the new adapter
+                manager.llm_client = new_client
 
-                    print("✅ Switched to Direct adapter")
-                    logger.info("Switched to Direct adapter")
+                # Update env var for persistence between sessions
+                os.environ["CELLMAGE_ADAPTER"] = adapter_type
 
-                else:
-                    print(f"❌ Unknown adapter type: {adapter_type}")
-                    logger.error(f"Unknown adapter type requested: {adapter_type}")
+                print(f"✅ Switched to {label} adapter")
+                logger.info(f"Switched to {label} adapter")
 
             except Exception as e:
                 print(f"❌ Error switching adapter: {e}")
-                logger.exception(f"Error switching to adapter {adapter_type}: {e}")
+                logger.exception("Error switching to adapter %s: %s", adapter_type, e)
 
         return action_taken
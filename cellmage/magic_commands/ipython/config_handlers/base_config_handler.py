@@ -6,7 +6,14 @@ This module provides the base class for all config command handlers.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Tuple
+
+# Box-drawing rules, re-exported for the handlers
+from cellmage.magic_commands.core import (  # noqa: F401
+    HEAVY_RULE,
+    LIGHT_RULE,
+    SECTION_RULE,
+)
 
 # Create a logger
 logger = logging.getLogger(__name__)
@@ -20,13 +27,37 @@ class BaseConfigHandler(ABC):
     and implement the handle_args method to process specific arguments.
     """
 
+    # Names of the options the handler acts on. Handlers that leave it empty are
+    # called for every %llm_config line.
+    options: Tuple[str, ...] = ()
+
+    def is_requested(self, args: Any) -> bool:
+        """
+        Check whether any of the handler's options was given.
+
+        Args:
+            args: The parsed arguments from the magic command.
+
+        Returns:
+            bool: True if handle_args() has something to do, False otherwise.
+        """
+        if not self.options:
+            return True
+        for option in self.options:
+            value = getattr(args, option)
+            if value is not None and value is not False:
+                return True
+        return False
+
     @abstractmethod
     def handle_args(self, args: Any, manager: Any) -> bool:
         """
         Handle arguments for the %llm_config magic command.
 
         Args:
-            args: The parsed arguments from the magic command.
+            args: The parsed arguments from the magic command. Every option the
+                magic declares is set (None/False when not given), so handlers
+                read them directly.
             manager: The ChatManager instance.
 
         Returns:
@@ -16,9 +16,11 @@ logger = logging.getLogger(__name__)
 class BaseDirConfigHandler(BaseConfigHandler):
     """Handler for base directory configuration arguments."""
 
+    options = ("base_dir",)
+
     def handle_args(self, args: Any, manager: Any) -> bool:
         action_taken = False
-        if hasattr(args, "base_dir") and args.base_dir:
+        if args.base_dir:
             action_taken = True
             import os
 
@@ -8,19 +8,30 @@ import datetime
 import logging
 from typing import Any, Dict, List
 
-from cellmage.magic_commands.core import extract_metadata_for_status
+from cellmage.magic_commands.core import extract_metadata_for_status, preview_text
 from cellmage.models import Message
 
 from ....utils.token_utils import count_tokens
-from .base_config_handler import BaseConfigHandler
+from .base_config_handler import SECTION_RULE, BaseConfigHandler
 
 # Create a logger
 logger = logging.getLogger(__name__)
 
+# Icons shown in front of each message of --show-history
+_ROLE_ICONS = {"system": "⚙️", "user": "👤", "assistant": "🤖"}
+_INTEGRATION_ICONS = {
+    "github": "🐙",
+    "gitlab": "🦊",
+    "jira": "📋",
+    "confluence": "📘",
+}
+
 
 class HistoryDisplayHandler(BaseConfigHandler):
     """Handler for history-related configuration arguments."""
 
+    options = ("clear_history", "show_history")
+
     def _count_tokens(self, messages: List[Message], manager) -> Dict[str, Any]:
         """
         Count tokens in the conversation history.
@@ -134,42 +145,17 @@ class HistoryDisplayHandler(BaseConfigHandler):
         """
         action_taken = False
 
-        if hasattr(args, "clear_history") and args.clear_history:
+        if args.clear_history:
             action_taken = True
             manager.clear_history()
             logger.info("✅ Chat history cleared.")
             print("✅ Chat history cleared.")
 
-        if hasattr(args, "show_history") and args.show_history:
+        if args.show_history:
             action_taken = True
 
             history = manager.get_history()
-            logger.debug(f"DEBUG: Retrieved {len(history)} total messages")
-
-            # Detailed debug of message types and integration messages
-            role_counts = {}
-            source_counts = {}
-            integration_metadata = []
-
-            for i, msg in enumerate(history):
-                # Count roles
-                role = msg.role
-                role_counts[role] = role_counts.get(role, 0) + 1
-
-                # Track integration sources
-                if msg.metadata and "source" in msg.metadata:
-                    source = msg.metadata.get("source", "")
-                    if source:
-                        source_counts[source] = source_counts.get(source, 0) + 1
-                        # Collect details about this integration message
-                        integration_metadata.append(
-                            {
-                                "index": i,
-                                "source": source,
-                                "type": msg.metadata.get("type", "unknown"),
-                                "role": msg.role,
-                            }
-                        )
+            logger.debug("Retrieved %d total messages", len(history))
 
             # Get accurate token counts using the LLM client if available
             token_counts = self._count_tokens(history, manager)
@@ -178,13 +164,8 @@ class HistoryDisplayHandler(BaseConfigHandler):
             total_tokens_out = token_counts["assistant"]
             estimated_messages = token_counts.get("is_approximate", False)
 
-            # Combining source_counts and role_counts for readable output
-            integration_counts = source_counts
-
-            # Print history header with summary information
-            print("📜 Conversation History")
-            print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-            print(f"• Messages: {len(history)}")
+            # The report is collected here and printed at once
+            lines = ["📜 Conversation History", SECTION_RULE, f"• Messages: {len(history)}"]
 
             # Format token information
             token_summary = f"• 📊 Total: {total_tokens} tokens"
@@ -192,154 +173,114 @@ class HistoryDisplayHandler(BaseConfigHandler):
                 token_summary += f" (Input: {total_tokens_in} • Output: {total_tokens_out})"
             if estimated_messages > 0:
                 token_summary += f" (includes {estimated_messages} estimated message{'s' if estimated_messages > 1 else ''})"
-            print(token_summary)
+            lines.append(token_summary)
 
             if not history:
-                print("(No messages in history)")
+                lines.append("(No messages in history)")
             else:
-                # First, display a summary of models used in the conversation
-                models_used = {}
+                # One pass over the history for the summary counts and the metadata
+                # shown for each message below
+                models_used: Dict[str, int] = {}
+                role_counts: Dict[str, int] = {}
+                integration_counts: Dict[str, int] = {}
+                message_metadata = []
                 for msg in history:
-                    if msg.metadata:
-                        meta = extract_metadata_for_status(msg.metadata)
-                        model = meta.get("model_used") or meta.get("model") or ""
-                        if model and msg.role == "assistant":
-                            models_used[model] = models_used.get(model, 0) + 1
-
-                if models_used:
-                    model_str = "• 🤖 Models: " + ", ".join(
-                        f"{model} ({count})" for model, count in models_used.items()
-                    )
-                    print(model_str)
+                    metadata = msg.metadata or {}
+                    meta = extract_metadata_for_status(metadata)
+                    message_metadata.append((metadata, meta))
 
-                # Count message types and integrations
-                role_counts = {}
-                integration_counts = {}
-                for msg in history:
-                    # Count by role
                     role_counts[msg.role] = role_counts.get(msg.role, 0) + 1
 
-                    # Count integration sources
-                    if msg.metadata and "source" in msg.metadata:
-                        source = msg.metadata.get("source", "")
-                        if source:
-                            integration_counts[source] = integration_counts.get(source, 0) + 1
+                    model = meta.get("model_used", "")
+                    if model and msg.role == "assistant":
+                        models_used[model] = models_used.get(model, 0) + 1
 
-                # Print message type summary
-                if role_counts:
-                    role_summary = "• Message types: " + ", ".join(
-                        f"{role} ({count})" for role, count in role_counts.items()
+                    source = metadata.get("source", "")
+                    if source:
+                        integration_counts[source] = integration_counts.get(source, 0) + 1
+
+                if models_used:
+                    lines.append(
+                        "• 🤖 Models: "
+                        + ", ".join(f"{model} ({count})" for model, count in models_used.items())
                     )
-                    print(role_summary)
+
+                # Print message type summary
+                lines.append(
+                    "• Message types: "
+                    + ", ".join(f"{role} ({count})" for role, count in role_counts.items())
+                )
 
                 # Print integration summary if any
                 if integration_counts:
-                    integration_summary = "• Integrations: " + ", ".join(
-                        f"{source} ({count})" for source, count in integration_counts.items()
+                    lines.append(
+                        "• Integrations: "
+                        + ", ".join(
+                            f"{source} ({count})" for source, count in integration_counts.items()
+                        )
                     )
-                    print(integration_summary)
 
-                print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+                lines.append(SECTION_RULE)
+
+                # _count_tokens() lists the messages in history order
+                message_tokens = token_counts.get("messages", [])
+                is_estimated = token_counts.get("is_approximate", False)
+                last_index = len(history) - 1
 
                 # Display the messages with improved formatting
                 for i, msg in enumerate(history):
-                    meta = extract_metadata_for_status(msg.metadata) if msg.metadata else {}
-                    model_used = meta.get("model_used") or meta.get("model") or ""
-                    cost_str = meta.get("cost_str") or meta.get("cost") or ""
-
-                    # Use accurate token counts from the token_counts dictionary
-                    # Find the matching message in token_counts
-                    msg_tokens = 0
-                    is_estimated = False
-
-                    # Find this message in our token count results
-                    for msg_data in token_counts.get("messages", []):
-                        if msg_data.get("role") == msg.role and msg_data.get(
-                            "content_snippet", ""
-                        ).startswith(msg.content[:20].replace("\n", " ")):
-                            msg_tokens = msg_data.get("tokens", 0)
-                            is_estimated = token_counts.get("is_approximate", False)
-                            break
-
-                    tokens_in = 0
-                    tokens_out = 0
-                    if msg.role == "user" or msg.role == "system":
-                        tokens_in = msg_tokens
-                    elif msg.role == "assistant":
-                        tokens_out = msg_tokens
+                    metadata, meta = message_metadata[i]
+                    model_used = meta.get("model_used", "")
+                    cost_str = meta.get("cost_str", "")
+                    msg_tokens = (
+                        message_tokens[i].get("tokens", 0) if i < len(message_tokens) else 0
+                    )
 
                     # Get integration source if available
-                    source = meta.get("source", "")
-                    source_type = meta.get("type", "")
-
-                    # Mark any message with a source as an integration message
-                    is_integration = bool(source)
-
-                    # Determine role icon and create a formatted role label
-                    role_icon = ""
-                    if msg.role == "system":
-                        role_icon = "⚙️"
-                    elif msg.role == "user":
-                        role_icon = "👤"
-                    elif msg.role == "assistant":
-                        role_icon = "🤖"
-                    else:
-                        role_icon = "📄"
+                    source = metadata.get("source", "")
+                    source_type = metadata.get("type", "")
 
                     # Create role label with possible integration source info
+                    role_icon = _ROLE_ICONS.get(msg.role, "📄")
                     role_label = f"[{i}] {role_icon} {msg.role.upper()}"
 
                     # Add integration source info to the label with more prominent styling
                     if source:
-                        integration_icon = "🔌"
-                        if source.lower() == "github":
-                            integration_icon = "🐙"  # GitHub octopus icon
-                        elif source.lower() == "gitlab":
-                            integration_icon = "🦊"  # GitLab fox icon
-                        elif source.lower() == "jira":
-                            integration_icon = "📋"  # Jira ticket icon
-                        elif source.lower() == "confluence":
-                            integration_icon = "📘"  # Confluence docs icon
-
-                        # Add integration source info to the label
+                        integration_icon = _INTEGRATION_ICONS.get(source.lower(), "🔌")
                         role_label += f" {integration_icon} {source.upper()}"
                         if source_type:
                             role_label += f" ({source_type})"
 
                     # Display token info based on role
                     token_info = ""
-                    if msg.role == "user" and tokens_in > 0:
-                        token_info = f"📥 {tokens_in} tokens{' (est.)' if is_estimated else ''}"
-                    elif msg.role == "assistant" and tokens_out > 0:
-                        token_info = f"📤 {tokens_out} tokens{' (est.)' if is_estimated else ''}"
+                    estimated = " (est.)" if is_estimated else ""
+                    if msg.role == "user" and msg_tokens > 0:
+                        token_info = f"📥 {msg_tokens} tokens{estimated}"
+                    elif msg.role == "assistant" and msg_tokens > 0:
+                        token_info = f"📤 {msg_tokens} tokens{estimated}"
                         if cost_str:
                             token_info += f" • {cost_str}"
 
-                    # Print the message header with role and tokens
-                    if token_info:
-                        print(f"{role_label}  {token_info}")
-                    else:
-                        print(role_label)
+                    # Message header with role and tokens
+                    lines.append(f"{role_label}  {token_info}" if token_info else role_label)
 
                     # Format the message content with proper handling of long text
-                    content_preview = msg.content.replace("\n", " ").strip()
                     # For integration messages, make the content preview slightly longer
-                    preview_length = 150 if is_integration else 100
+                    content_preview = preview_text(msg.content.strip(), 150 if source else 100)
 
-                    if len(content_preview) > preview_length:
-                        content_preview = content_preview[: preview_length - 3] + "..."
-
-                    # Print content with indentation
-                    print(f"  {content_preview}")
+                    # Content with indentation
+                    lines.append(f"  {content_preview}")
 
                     # Format metadata in a cleaner way
                     meta_items = []
 
                     # Add source-specific ID if available
+                    source_id_shown = False
                     if source:
-                        for key, value in meta.items():
+                        for key, value in metadata.items():
                             if key.endswith("_id") and value and key != "cell_id":
                                 meta_items.append(f"{source} ID: {value}")
+                                source_id_shown = True
                                 break
 
                     # Add other metadata
@@ -353,25 +294,26 @@ class HistoryDisplayHandler(BaseConfigHandler):
                         meta_items.append(f"Model: {model_used}")
                     if msg.is_snippet:
                         meta_items.append("Snippet: Yes")
-                    if "timestamp" in meta:
+                    if "timestamp" in metadata:
                         try:
-                            ts = datetime.datetime.fromisoformat(meta["timestamp"])
+                            ts = datetime.datetime.fromisoformat(metadata["timestamp"])
                             meta_items.append(f"Time: {ts.strftime('%H:%M:%S')}")
                         except (ValueError, TypeError):
                             pass
 
                     # Ensure source is always shown
-                    if source and not any(item.startswith(f"{source} ID:") for item in meta_items):
+                    if source and not source_id_shown:
                         meta_items.append(f"Source: {source}")
 
                     if meta_items:
-                        meta_str = "  └─ " + ", ".join(meta_items)
-                        print(meta_str)
+                        lines.append("  └─ " + ", ".join(meta_items))
 
                     # Add separator between messages
-                    if i < len(history) - 1:
-                        print("  ·····")
+                    if i < last_index:
+                        lines.append("  ·····")
+
+                lines.append(SECTION_RULE)
 
-                print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+            print("\n".join(lines))
 
         return action_taken
@@ -7,7 +7,7 @@ This module handles model-related arguments for the %llm_config magic command.
 import logging
 from typing import Any
 
-from .base_config_handler import BaseConfigHandler
+from .base_config_handler import HEAVY_RULE, BaseConfigHandler
 
 # Create a logger
 logger = logging.getLogger(__name__)
@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 class ModelSetupHandler(BaseConfigHandler):
     """Handler for model setup configuration arguments."""
 
+    options = ("model", "set_rate", "list_mappings", "add_mapping", "remove_mapping")
+
     def handle_args(self, args: Any, manager: Any) -> bool:
         """
         Handle model-related arguments for the %llm_config magic.
@@ -29,7 +31,7 @@ class ModelSetupHandler(BaseConfigHandler):
         """
         action_taken = False
 
-        if hasattr(args, "model") and args.model:
+        if args.model:
             action_taken = True
             model_name = args.model
             manager.set_override("model", model_name)
@@ -42,22 +44,44 @@ class ModelSetupHandler(BaseConfigHandler):
                 except Exception:
                     pass
 
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  🤖 Model Set")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print(f"  • Model: {model_name}")
 
             if mapped_model and mapped_model != model_name:
                 print(f"  • Maps to: {mapped_model}")
 
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
 
-        if hasattr(args, "list_mappings") and args.list_mappings:
+        if args.set_rate:
+            action_taken = True
+            model_name, input_rate, output_rate = args.set_rate
+
+            try:
+                # Rates are given per million tokens, the manager expects per-token rates
+                manager.set_model_rate(
+                    model_name, float(input_rate) / 1_000_000, float(output_rate) / 1_000_000
+                )
+                print(HEAVY_RULE)
+                print("  💲 Model Rate Set")
+                print(HEAVY_RULE)
+                print(f"  • Model: {model_name}")
+                print(f"  • Input: ${float(input_rate):g} / 1M tokens")
+                print(f"  • Output: ${float(output_rate):g} / 1M tokens")
+                print(HEAVY_RULE)
+            except ValueError:
+                print(HEAVY_RULE)
+                print("  ❌ Error setting model rate")
+                print("  • INPUT and OUTPUT must be numbers (USD per 1M tokens)")
+                print(HEAVY_RULE)
+
+        if args.list_mappings:
             action_taken = True
 
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  🔄 Model Name Mappings")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
 
             has_mappings = False
             if hasattr(manager.llm_client, "model_mapper"):
@@ -74,9 +98,9 @@ class ModelSetupHandler(BaseConfigHandler):
                 print("  No model mappings configured")
                 print("  • Use %llm_config --add-mapping ALIAS FULL_NAME to add")
 
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
 
-        if hasattr(args, "add_mapping") and args.add_mapping:
+        if args.add_mapping:
             action_taken = True
             alias, full_name = args.add_mapping
 
@@ -85,22 +109,22 @@ class ModelSetupHandler(BaseConfigHandler):
             ):
                 try:
                     manager.llm_client.model_mapper.add_mapping(alias, full_name)
-                    print("══════════════════════════════════════════════════════════")
+                    print(HEAVY_RULE)
                     print("  ✅ Model Mapping Added")
-                    print("══════════════════════════════════════════════════════════")
+                    print(HEAVY_RULE)
                     print(f"  • {alias} → {full_name}")
-                    print("══════════════════════════════════════════════════════════")
+                    print(HEAVY_RULE)
                 except Exception as e:
-                    print("══════════════════════════════════════════════════════════")
+                    print(HEAVY_RULE)
                     print("  ❌ Error adding model mapping")
                     print(f"  • {e}")
-                    print("══════════════════════════════════════════════════════════")
+                    print(HEAVY_RULE)
             else:
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 print("  ❌ Model mapper not available")
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
 
-        if hasattr(args, "remove_mapping") and args.remove_mapping:
+        if args.remove_mapping:
             action_taken = True
             alias = args.remove_mapping
 
@@ -109,20 +133,20 @@ class ModelSetupHandler(BaseConfigHandler):
             ):
                 try:
                     removed = manager.llm_client.model_mapper.remove_mapping(alias)
-                    print("══════════════════════════════════════════════════════════")
+                    print(HEAVY_RULE)
                     if removed:
                         print(f"  ✅ Mapping for '{alias}' removed")
                     else:
                         print(f"  ⚠️ Mapping '{alias}' not found")
-                    print("══════════════════════════════════════════════════════════")
+                    print(HEAVY_RULE)
                 except Exception as e:
-                    print("══════════════════════════════════════════════════════════")
+                    print(HEAVY_RULE)
                     print("  ❌ Error removing model mapping")
                     print(f"  • {e}")
-                    print("══════════════════════════════════════════════════════════")
+                    print(HEAVY_RULE)
             else:
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 print("  ❌ Model mapper not available")
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
 
         return action_taken
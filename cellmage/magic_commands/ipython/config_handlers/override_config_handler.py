@@ -7,7 +7,8 @@ This module handles parameter override arguments for the %llm_config magic comma
 import logging
 from typing import Any
 
-from .base_config_handler import BaseConfigHandler
+from ..magic_args import coerce_param_value
+from .base_config_handler import HEAVY_RULE, BaseConfigHandler
 
 # Create a logger
 logger = logging.getLogger(__name__)
@@ -16,6 +17,8 @@ logger = logging.getLogger(__name__)
 class OverrideConfigHandler(BaseConfigHandler):
     """Handler for parameter override configuration arguments."""
 
+    options = ("set_override", "remove_override", "clear_overrides", "show_overrides")
+
     def handle_args(self, args: Any, manager: Any) -> bool:
         """
         Handle override-related arguments for the %llm_config magic.
@@ -29,21 +32,17 @@ class OverrideConfigHandler(BaseConfigHandler):
         """
         action_taken = False
 
-        if hasattr(args, "set_override") and args.set_override:
+        if args.set_override:
             action_taken = True
             key, value = args.set_override
-            # Attempt basic type conversion (optional, could pass strings directly)
-            try:
-                # Try float, int, then string
-                parsed_value = float(value) if "." in value else int(value)
-            except ValueError:
-                parsed_value = value  # Keep as string if conversion fails
+            # Numbers become int or float, the same way as %%llm --param values
+            parsed_value = coerce_param_value(value)
             manager.set_override(key, parsed_value)
 
             # Enhanced message for setting override
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  ⚙️  Parameter Override Set")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print(f"  • Parameter: {key}")
             print(f"  • Value: {parsed_value}")
             print(f"  • Type: {type(parsed_value).__name__}")
@@ -59,31 +58,31 @@ class OverrideConfigHandler(BaseConfigHandler):
                 except Exception:
                     pass
 
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
 
-        if hasattr(args, "remove_override") and args.remove_override:
+        if args.remove_override:
             action_taken = True
             key = args.remove_override
             manager.remove_override(key)
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  ⚙️  Parameter Override Removed")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print(f"  • Parameter: {key}")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
 
-        if hasattr(args, "clear_overrides") and args.clear_overrides:
+        if args.clear_overrides:
             action_taken = True
             manager.clear_overrides()
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  ⚙️  All Parameter Overrides Cleared")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
 
-        if hasattr(args, "show_overrides") and args.show_overrides:
+        if args.show_overrides:
             action_taken = True
             overrides = manager.get_overrides()
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("  ⚙️  Active Parameter Overrides")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             if overrides:
                 for k, v in overrides.items():
                     # Hide API key for security
@@ -93,6 +92,6 @@ class OverrideConfigHandler(BaseConfigHandler):
                         print(f"  • {k} = {v}")
             else:
                 print("  No active overrides")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
 
         return action_taken
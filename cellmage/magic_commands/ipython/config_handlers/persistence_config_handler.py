@@ -6,19 +6,70 @@ This module handles session persistence arguments for the %llm_config magic comm
 
 import logging
 import os
-from typing import Any
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
 
 from cellmage.exceptions import ResourceNotFoundError
 
-from .base_config_handler import BaseConfigHandler
+from .base_config_handler import HEAVY_RULE, LIGHT_RULE, BaseConfigHandler
 
 # Create a logger
 logger = logging.getLogger(__name__)
 
+# Manager methods that save, load and list sessions, in order of preference
+_SESSION_SAVERS = ("save_conversation", "save_session")
+# Manager method that copies the conversation for a save written in the background
+_SESSION_SAVE_PREPARER = "prepare_save_conversation"
+_SESSION_LOADERS = ("load_session", "load_conversation")
+_SESSION_LISTERS = ("list_saved_sessions", "list_conversations")
+
+# Seconds the session list shown after a mistyped --load is reused for the next attempts
+_SESSION_HINT_TTL = 2.0
+
+
+# Single worker, so saves are written one at a time and in the order they were requested
+_save_executor: Optional[ThreadPoolExecutor] = None
+_pending_save: Optional[Future] = None
+
+
+def _submit_save(write: Callable[[], Any]) -> Future:
+    """Run write() on the background save thread and return its future."""
+    global _save_executor, _pending_save
+    if _save_executor is None:
+        _save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cellmage-save")
+    _pending_save = _save_executor.submit(write)
+    return _pending_save
+
+
+def _wait_for_pending_save() -> None:
+    """Block until the last queued save has finished (its outcome is reported separately)."""
+    if _pending_save is not None:
+        try:
+            _pending_save.result()
+        except Exception:
+            pass
+
+
+def _find_manager_method(
+    manager: Any, names: Tuple[str, ...]
+) -> Tuple[Optional[str], Optional[Callable[..., Any]]]:
+    """Return the name and bound method of the first of names the manager has, or (None, None)."""
+    for name in names:
+        method = getattr(manager, name, None)
+        if method is not None:
+            return name, method
+    return None, None
+
 
 class PersistenceConfigHandler(BaseConfigHandler):
     """Handler for session persistence configuration arguments."""
 
+    options = ("save", "load", "list_sessions", "auto_save", "no_auto_save")
+
+    # (time listed, listing method, sorted sessions) of the last --load hint
+    _session_hint_cache: Optional[Tuple[float, Callable[[], Any], List[Any]]] = None
+
     def handle_args(self, args: Any, manager: Any) -> bool:
         """
         Handle persistence-related arguments for the %llm_config magic.
@@ -33,78 +84,79 @@ class PersistenceConfigHandler(BaseConfigHandler):
         action_taken = False
 
         # Handle saving the current conversation
-        if hasattr(args, "save") and args.save is not None:
+        if args.save is not None:
             action_taken = True
             try:
                 # If --save is used without a value, use the session ID
                 session_id = args.save if args.save is not True else None
 
-                if hasattr(manager, "save_conversation"):
-                    session_id = manager.save_conversation(session_id)
-                    method = "save_conversation"
-                elif hasattr(manager, "save_session"):
-                    session_id = manager.save_session(session_id)
-                    method = "save_session"
-                else:
+                method, save = _find_manager_method(manager, _SESSION_SAVERS)
+                if save is None:
                     raise AttributeError("No method found for saving sessions")
 
-                print("══════════════════════════════════════════════════════════")
-                print(f"  ✅ Session saved successfully as '{session_id}' using '{method}'")
-
-                # Get conversations directory path to inform the user
-                if hasattr(manager, "settings") and hasattr(manager.settings, "conversations_dir"):
-                    print(
-                        f"  • Saved to: {os.path.join(manager.settings.conversations_dir, session_id)}.md"
+                conversations_dir = getattr(
+                    getattr(manager, "settings", None), "conversations_dir", None
+                )
+                prepare = getattr(manager, _SESSION_SAVE_PREPARER, None)
+                if prepare is None:
+                    # The conversation can only be saved in place, so save it right away
+                    self._report_save(save(session_id), method, conversations_dir)
+                else:
+                    # The conversation is copied here; only the store write runs in the
+                    # background, and its outcome is printed when it is done
+                    write = prepare(session_id)
+                    if write is None:
+                        raise ValueError("Nothing to save yet")
+                    print(HEAVY_RULE)
+                    print("  💾 Saving session...")
+                    print(HEAVY_RULE)
+                    _submit_save(write).add_done_callback(
+                        lambda future: self._report_save_future(future, method, conversations_dir)
                     )
-                print("══════════════════════════════════════════════════════════")
+                self._session_hint_cache = None
             except Exception as e:
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 print(f"  ❌ Error saving session: {e}")
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
 
         # Handle loading a conversation
-        if hasattr(args, "load") and args.load:
+        if args.load:
             action_taken = True
             session_id = args.load
             try:
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 print(f"  🔄 Loading session: {session_id}")
 
+                # Don't replace the conversation while it is still being saved
+                _wait_for_pending_save()
+
                 # Find the right method to use based on what's available
-                if hasattr(manager, "load_session"):
-                    manager.load_session(session_id)
-                    method = "load_session"
-                elif hasattr(manager, "load_conversation"):
-                    manager.load_conversation(session_id)
-                    method = "load_conversation"
-                else:
+                method, load = _find_manager_method(manager, _SESSION_LOADERS)
+                if load is None:
                     raise AttributeError("No method found for loading sessions")
+                load(session_id)
 
                 # Try to get history length after loading
                 try:
-                    history = manager.get_history()
+                    message_count = manager.get_history_length()
                     print(f"  ✅ Session loaded successfully using '{method}'")
-                    print(f"  • Messages: {len(history)}")
+                    print(f"  • Messages: {message_count}")
                 except Exception:
                     print(f"  ✅ Session loaded successfully using '{method}'")
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
 
             except ResourceNotFoundError:
                 print(f"  ❌ Session '{session_id}' not found.")
                 # Try to list available sessions for user convenience
-                if hasattr(manager, "list_saved_sessions") or hasattr(
-                    manager, "list_conversations"
-                ):
+                _, list_sessions = _find_manager_method(manager, _SESSION_LISTERS)
+                if list_sessions is not None:
                     print("  Available sessions:")
                     try:
-                        if hasattr(manager, "list_saved_sessions"):
-                            sessions = manager.list_saved_sessions()
-                        elif hasattr(manager, "list_conversations"):
-                            sessions = manager.list_conversations()
+                        sessions = self._sorted_sessions(list_sessions)
 
                         # Show up to 5 available sessions
                         if sessions:
-                            for i, session in enumerate(sorted(sessions)[:5]):
+                            for session in sessions[:5]:
                                 print(f"  • {session}")
                             if len(sessions) > 5:
                                 print(f"  • ... and {len(sessions) - 5} more")
@@ -112,46 +164,39 @@ class PersistenceConfigHandler(BaseConfigHandler):
                             print("  • No saved sessions found")
                     except Exception as e:
                         print(f"  ❌ Error listing sessions: {e}")
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
             except Exception as e:
                 print(f"  ❌ Error loading session: {e}")
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
 
         # Handle listing saved sessions
-        if hasattr(args, "list_sessions") and args.list_sessions:
+        if args.list_sessions:
             action_taken = True
+            # The report is collected here and printed at once
+            lines = [HEAVY_RULE, "  📋 Saved Sessions", HEAVY_RULE]
             try:
-                print("══════════════════════════════════════════════════════════")
-                print("  📋 Saved Sessions")
-                print("══════════════════════════════════════════════════════════")
-
                 # Find the right method to list sessions
-                if hasattr(manager, "list_saved_sessions"):
-                    sessions = manager.list_saved_sessions()
-                    method = "list_saved_sessions"
-                elif hasattr(manager, "list_conversations"):
-                    sessions = manager.list_conversations()
-                    method = "list_conversations"
-                else:
+                method, list_sessions = _find_manager_method(manager, _SESSION_LISTERS)
+                if list_sessions is None:
                     raise AttributeError("No method found for listing sessions")
+                sessions = list_sessions()
 
                 if sessions:
-                    for session in sorted(sessions):
-                        print(f"  • {session}")
-                    print("──────────────────────────────────────────────────────────")
-                    print(f"  ℹ️ {len(sessions)} sessions found using '{method}'")
+                    lines.extend(f"  • {session}" for session in sorted(sessions))
+                    lines.append(LIGHT_RULE)
+                    lines.append(f"  ℹ️ {len(sessions)} sessions found using '{method}'")
                 else:
-                    print("  No saved sessions found")
+                    lines.append("  No saved sessions found")
 
-                print("──────────────────────────────────────────────────────────")
-                print("  Use: %llm_config --load <session_id> to load a session")
-                print("══════════════════════════════════════════════════════════")
+                lines.append(LIGHT_RULE)
+                lines.append("  Use: %llm_config --load <session_id> to load a session")
             except Exception as e:
-                print(f"  ❌ Error listing sessions: {e}")
-                print("══════════════════════════════════════════════════════════")
+                lines.append(f"  ❌ Error listing sessions: {e}")
+            lines.append(HEAVY_RULE)
+            print("\n".join(lines))
 
         # Handle auto-save settings
-        if hasattr(args, "auto_save") and args.auto_save:
+        if args.auto_save:
             action_taken = True
             try:
                 # Set auto-save to true
@@ -161,10 +206,10 @@ class PersistenceConfigHandler(BaseConfigHandler):
                     manager.settings.auto_save = True
                 else:
                     print("  ❌ Unable to set auto_save: no appropriate setting found")
-                    print("══════════════════════════════════════════════════════════")
+                    print(HEAVY_RULE)
                     return action_taken
 
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 print("  ✅ Auto-save enabled")
 
                 # Show the conversations directory
@@ -175,7 +220,7 @@ class PersistenceConfigHandler(BaseConfigHandler):
                     conversations_dir = manager.conversations_dir
 
                 if conversations_dir:
-                    print("══════════════════════════════════════════════════════════")
+                    print(HEAVY_RULE)
                     print(f"  • Conversations will be saved to: {conversations_dir}")
 
                     # Check if directory exists, create if not
@@ -187,9 +232,9 @@ class PersistenceConfigHandler(BaseConfigHandler):
                         except Exception as mkdir_error:
                             print(f"  ❌ Failed to create directory: {mkdir_error}")
 
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
             except Exception as e:
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 print(f"  ❌ Unexpected error: {e}")
                 # Check if conversations directory exists
                 if hasattr(manager, "settings") and hasattr(manager.settings, "conversations_dir"):
@@ -200,10 +245,10 @@ class PersistenceConfigHandler(BaseConfigHandler):
                         print(
                             "  Try creating it manually or use %llm_config --auto-save to create it automatically."
                         )
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
 
         # Handle disabling auto-save
-        if hasattr(args, "no_auto_save") and args.no_auto_save:
+        if args.no_auto_save:
             action_taken = True
             try:
                 # Set auto-save to false
@@ -215,12 +260,69 @@ class PersistenceConfigHandler(BaseConfigHandler):
                     print("  ❌ Unable to disable auto_save: no appropriate setting found")
                     return action_taken
 
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 print("  ✅ Auto-save disabled")
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
             except Exception as e:
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 print(f"  ❌ Error disabling auto-save: {e}")
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
 
         return action_taken
+
+    def _sorted_sessions(self, list_sessions: Callable[[], Any]) -> List[Any]:
+        """
+        List the saved sessions for the --load hint, sorted.
+
+        The list is reused for a couple of seconds, so retrying a mistyped
+        session name does not scan the store again. --save clears it.
+
+        Args:
+            list_sessions: The manager's session listing method
+
+        Returns:
+            The sorted session identifiers
+        """
+        now = time.monotonic()
+        cached = self._session_hint_cache
+        if (
+            cached is not None
+            and cached[1] == list_sessions
+            and now - cached[0] < _SESSION_HINT_TTL
+        ):
+            return cached[2]
+
+        sessions = sorted(list_sessions())
+        self._session_hint_cache = (now, list_sessions, sessions)
+        return sessions
+
+    @staticmethod
+    def _report_save(
+        session_id: Optional[str], method: Optional[str], conversations_dir: Optional[str]
+    ) -> None:
+        """Print the outcome of a save started by --save."""
+        lines = [HEAVY_RULE]
+        if session_id is None:
+            lines.append("  ❌ Session was not saved (see the log for details)")
+        else:
+            lines.append(f"  ✅ Session saved successfully as '{session_id}' using '{method}'")
+
+            # Get conversations directory path to inform the user
+            if conversations_dir:
+                lines.append(f"  • Saved to: {os.path.join(conversations_dir, session_id)}.md")
+        lines.append(HEAVY_RULE)
+        print("\n".join(lines))
+
+    @classmethod
+    def _report_save_future(
+        cls, future: Future, method: Optional[str], conversations_dir: Optional[str]
+    ) -> None:
+        """Print the outcome of a background save started by --save."""
+        try:
+            session_id = future.result()
+        except Exception as e:
+            print(HEAVY_RULE)
+            print(f"  ❌ Error saving session: {e}")
+            print(HEAVY_RULE)
+            return
+        cls._report_save(session_id, method, conversations_dir)
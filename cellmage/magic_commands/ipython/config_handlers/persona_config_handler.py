@@ -8,8 +8,9 @@ import logging
 from typing import Any
 
 from cellmage.exceptions import ResourceNotFoundError
+from cellmage.magic_commands.core import preview_text
 
-from .base_config_handler import BaseConfigHandler
+from .base_config_handler import HEAVY_RULE, LIGHT_RULE, BaseConfigHandler
 
 # Create a logger
 logger = logging.getLogger(__name__)
@@ -18,6 +19,8 @@ logger = logging.getLogger(__name__)
 class PersonaConfigHandler(BaseConfigHandler):
     """Handler for persona-related configuration arguments."""
 
+    options = ("list_personas", "show_persona", "persona")
+
     def handle_args(self, args: Any, manager: Any) -> bool:
         """
         Handle persona-related arguments for the %llm_config magic.
@@ -31,67 +34,59 @@ class PersonaConfigHandler(BaseConfigHandler):
         """
         action_taken = False
 
-        if hasattr(args, "list_personas") and args.list_personas:
+        if args.list_personas:
             action_taken = True
             try:
                 personas = manager.list_personas()
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 print("  👤 Available Personas")
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 if personas:
-                    for persona in sorted(personas):
+                    for persona in personas:
                         print(f"  • {persona}")
                 else:
                     print("  No personas found")
-                print("──────────────────────────────────────────────────────────")
+                print(LIGHT_RULE)
                 print("  Use: %llm_config --persona <n> to activate a persona")
             except Exception as e:
                 print(f"❌ Error listing personas: {e}")
 
-        if hasattr(args, "show_persona") and args.show_persona:
+        if args.show_persona:
             action_taken = True
             try:
                 active_persona = manager.get_active_persona()
-                print("══════════════════════════════════════════════════════════")
-                print("  👤 Active Persona Details")
-                print("══════════════════════════════════════════════════════════")
+                # The report is collected here and printed at once
+                lines = [HEAVY_RULE, "  👤 Active Persona Details", HEAVY_RULE]
                 if active_persona:
-                    print(f"  📝 Name: {active_persona.name}")
-                    print("  📋 System Prompt:")
-
-                    # Format system prompt with nice wrapping for readability
-                    system_lines = []
-                    remaining = active_persona.system_message
-                    while remaining and len(remaining) > 80:
-                        split_point = remaining[:80].rfind(" ")
-                        if split_point == -1:  # No space found, just cut at 80
-                            split_point = 80
-                        system_lines.append(remaining[:split_point])
-                        remaining = remaining[split_point:].lstrip()
-                    if remaining:
-                        system_lines.append(remaining)
-
-                    for line in system_lines:
-                        print(f"    {line}")
+                    lines.append(f"  📝 Name: {active_persona.name}")
+                    lines.append("  📋 System Prompt:")
+
+                    import textwrap
+
+                    # Format system prompt with nice wrapping for readability. Lines are
+                    # wrapped one by one, so the prompt's own line breaks stay indented.
+                    for prompt_line in active_persona.system_message.splitlines():
+                        for line in textwrap.wrap(prompt_line, width=80) or [""]:
+                            lines.append(f"    {line}")
 
                     if active_persona.config:
-                        print("  ⚙️  LLM Parameters:")
-                        for k, v in active_persona.config.items():
-                            print(f"    • {k}: {v}")
+                        lines.append("  ⚙️  LLM Parameters:")
+                        lines.extend(f"    • {k}: {v}" for k, v in active_persona.config.items())
                 else:
-                    print("  ❌ No active persona")
-                    print("  • To set a persona, use: %llm_config --persona <n>")
-                    print("  • To list available personas, use: %llm_config --list-personas")
-                print("══════════════════════════════════════════════════════════")
+                    lines.append("  ❌ No active persona")
+                    lines.append("  • To set a persona, use: %llm_config --persona <n>")
+                    lines.append("  • To list available personas, use: %llm_config --list-personas")
+                lines.append(HEAVY_RULE)
+                print("\n".join(lines))
             except Exception as e:
                 print(f"❌ Error retrieving active persona: {e}")
                 print("  Try listing available personas with: %llm_config --list-personas")
 
-        if hasattr(args, "persona") and args.persona:
+        if args.persona:
             action_taken = True
             try:
                 manager.set_default_persona(args.persona)
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 print(f"  👤 Persona '{args.persona}' Activated ✅")
 
                 # Show brief summary of the activated persona
@@ -99,19 +94,16 @@ class PersonaConfigHandler(BaseConfigHandler):
                     active_persona = manager.get_active_persona()
                     if active_persona and active_persona.system_message:
                         # Show just the beginning of the system message
-                        preview = active_persona.system_message[:100].replace("\n", " ")
-                        if len(active_persona.system_message) > 100:
-                            preview += "..."
-                        print(f"  📋 System: {preview}")
+                        print(f"  📋 System: {preview_text(active_persona.system_message)}")
 
                     if active_persona and active_persona.config:
-                        params = ", ".join(f"{k}={v}" for k, v in active_persona.config.items())
+                        params = ", ".join([f"{k}={v}" for k, v in active_persona.config.items()])
                         print(f"  ⚙️  Params: {params}")
 
                 except Exception:
                     pass  # If this fails, just skip the extra info
 
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 print("  Use %llm_config --show-persona for full details")
             except ResourceNotFoundError:
                 print(f"❌ Error: Persona '{args.persona}' not found.")
@@ -119,7 +111,7 @@ class PersonaConfigHandler(BaseConfigHandler):
                 try:
                     personas = manager.list_personas()
                     if personas:
-                        print("  Available personas: " + ", ".join(sorted(personas)))
+                        print("  Available personas: " + ", ".join(personas))
                 except Exception:
                     pass
             except Exception as e:
@@ -5,17 +5,74 @@ This module handles snippet-related arguments for the %llm_config magic command.
 """
 
 import logging
-from typing import Any
+import re
+from typing import Any, List
 
-from .base_config_handler import BaseConfigHandler
+from cellmage.magic_commands.core import preview_text
+
+from .base_config_handler import HEAVY_RULE, LIGHT_RULE, BaseConfigHandler
 
 # Create a logger
 logger = logging.getLogger(__name__)
 
+# Snippet name wrapped in matching single or double quotes
+_QUOTED_NAME = re.compile(r"(['\"])(.*)\1", re.DOTALL)
+
 
 class SnippetConfigHandler(BaseConfigHandler):
     """Handler for snippet-related configuration arguments."""
 
+    options = ("sys_snippet", "snippet", "list_snippets")
+
+    def _load_snippets(self, manager: Any, names: List[str], role: str) -> None:
+        """
+        Add snippets to the history and report the outcome.
+
+        Args:
+            manager: The ChatManager instance.
+            names: Snippet names or paths, as given on the command line.
+            role: "system" for --sys-snippet, "user" for --snippet.
+        """
+        label = role.capitalize()
+        single = len(names) == 1
+
+        # If multiple snippets are being added, show a header
+        if not single:
+            print(HEAVY_RULE)
+            print(f"  📎 Loading {label} Snippets")
+            print(HEAVY_RULE)
+
+        for name in names:
+            # Handle quoted paths by removing quotes
+            quoted = _QUOTED_NAME.fullmatch(name)
+            if quoted:
+                name = quoted.group(2)
+
+            # If single snippet and no header printed yet
+            if single:
+                print(HEAVY_RULE)
+                print(f"  📎 Loading {label} Snippet: {name}")
+                print(HEAVY_RULE)
+
+            if manager.add_snippet(name, role=role):
+                if not single:
+                    print(f"  • ✅ Added: {name}")
+                else:
+                    print(f"  ✅ {label} snippet loaded successfully")
+                    # Try to get a preview of the snippet content; add_snippet() appends
+                    # it, so it is the last message
+                    try:
+                        msg = manager.get_last_message()
+                        if msg and msg.is_snippet and msg.role == role:
+                            print(f"  📄 Content: {preview_text(msg.content)}")
+                    except Exception:
+                        pass  # Skip preview if something goes wrong
+            else:
+                if not single:
+                    print(f"  • ❌ Failed to add: {name}")
+                else:
+                    print(f"  ❌ Failed to load {role} snippet: {name}")
+
     def handle_args(self, args: Any, manager: Any) -> bool:
         """
         Handle snippet-related arguments for the %llm_config magic.
@@ -30,107 +87,27 @@ class SnippetConfigHandler(BaseConfigHandler):
         action_taken = False
 
         try:
-            if hasattr(args, "sys_snippet") and args.sys_snippet:
+            if args.sys_snippet:
                 action_taken = True
-                # If multiple snippets are being added, show a header
-                if len(args.sys_snippet) > 1:
-                    print("══════════════════════════════════════════════════════════")
-                    print("  📎 Loading System Snippets")
-                    print("══════════════════════════════════════════════════════════")
-
-                for name in args.sys_snippet:
-                    # Handle quoted paths by removing quotes
-                    if (name.startswith('"') and name.endswith('"')) or (
-                        name.startswith("'") and name.endswith("'")
-                    ):
-                        name = name[1:-1]
-
-                    # If single snippet and no header printed yet
-                    if len(args.sys_snippet) == 1:
-                        print("══════════════════════════════════════════════════════════")
-                        print(f"  📎 Loading System Snippet: {name}")
-                        print("══════════════════════════════════════════════════════════")
-
-                    if manager.add_snippet(name, role="system"):
-                        if len(args.sys_snippet) > 1:
-                            print(f"  • ✅ Added: {name}")
-                        else:
-                            print("  ✅ System snippet loaded successfully")
-                            # Try to get a preview of the snippet content
-                            try:
-                                history = manager.get_history()
-                                for msg in reversed(history):
-                                    if msg.is_snippet and msg.role == "system":
-                                        preview = msg.content.replace("\n", " ")[:100]
-                                        if len(msg.content) > 100:
-                                            preview += "..."
-                                        print(f"  📄 Content: {preview}")
-                                        break
-                            except Exception:
-                                pass  # Skip preview if something goes wrong
-                    else:
-                        if len(args.sys_snippet) > 1:
-                            print(f"  • ❌ Failed to add: {name}")
-                        else:
-                            print(f"  ❌ Failed to load system snippet: {name}")
+                self._load_snippets(manager, args.sys_snippet, "system")
 
-            if hasattr(args, "snippet") and args.snippet:
+            if args.snippet:
                 action_taken = True
-                # If multiple snippets are being added, show a header
-                if len(args.snippet) > 1:
-                    print("══════════════════════════════════════════════════════════")
-                    print("  📎 Loading User Snippets")
-                    print("══════════════════════════════════════════════════════════")
-
-                for name in args.snippet:
-                    # Handle quoted paths by removing quotes
-                    if (name.startswith('"') and name.endswith('"')) or (
-                        name.startswith("'") and name.endswith("'")
-                    ):
-                        name = name[1:-1]
-
-                    # If single snippet and no header printed yet
-                    if len(args.snippet) == 1:
-                        print("══════════════════════════════════════════════════════════")
-                        print(f"  📎 Loading User Snippet: {name}")
-                        print("══════════════════════════════════════════════════════════")
-
-                    if manager.add_snippet(name, role="user"):
-                        if len(args.snippet) > 1:
-                            print(f"  • ✅ Added: {name}")
-                        else:
-                            print("  ✅ User snippet loaded successfully")
-                            # Try to get a preview of the snippet content
-                            try:
-                                history = manager.get_history()
-                                for msg in reversed(history):
-                                    if msg.is_snippet and msg.role == "user":
-                                        preview = msg.content.replace("\n", " ")[:100]
-                                        if len(msg.content) > 100:
-                                            preview += "..."
-                                        print(f"  📄 Content: {preview}")
-                                        break
-                            except Exception:
-                                pass  # Skip preview if something goes wrong
-                    else:
-                        if len(args.snippet) > 1:
-                            print(f"  • ❌ Failed to add: {name}")
-                        else:
-                            print(f"  ❌ Failed to load user snippet: {name}")
+                self._load_snippets(manager, args.snippet, "user")
 
-            if hasattr(args, "list_snippets") and args.list_snippets:
+            if args.list_snippets:
                 action_taken = True
                 try:
                     snippets = manager.list_snippets()
-                    print("══════════════════════════════════════════════════════════")
+                    print(HEAVY_RULE)
                     print("  📎 Available Snippets")
-                    print("══════════════════════════════════════════════════════════")
+                    print(HEAVY_RULE)
                     if snippets:
-                        for snippet in sorted(snippets):
+                        for snippet in snippets:
                             print(f"  • {snippet}")
                     else:
                         print("  No snippets found")
-                    print("──────────────────────────────────────────────────────────")
+                    print(LIGHT_RULE)
                     print("  Use: %llm_config --snippet <n> to load a user snippet")
                     print("  Use: %llm_config --sys-snippet <n> for system snippets")
                 except Exception as e:
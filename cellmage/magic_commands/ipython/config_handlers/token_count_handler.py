@@ -20,6 +20,8 @@ logger = logging.getLogger(__name__)
 class TokenCountHandler(BaseConfigHandler):
     """Handler for token counting arguments in the %llm_config magic."""
 
+    options = ("tokens", "token")
+
     def handle_args(self, args: Any, manager: Any) -> bool:
         """
         Handle token counting arguments for the %llm_config magic.
@@ -34,16 +36,14 @@ class TokenCountHandler(BaseConfigHandler):
         action_taken = False
 
         # Check if we should show token count
-        show_tokens = (
-            hasattr(args, "tokens") and args.tokens or hasattr(args, "token") and args.token
-        )
+        show_tokens = args.tokens or args.token
 
         if show_tokens:
             action_taken = True
             try:
                 self._show_token_count(manager)
             except Exception as e:
-                logger.exception(f"Error showing token count: {e}")
+                logger.exception("Error showing token count: %s", e)
                 print(f"❌ Error showing token count: {e}")
 
         return action_taken
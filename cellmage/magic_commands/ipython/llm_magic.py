@@ -7,15 +7,16 @@ This module provides the %%llm cell magic for sending prompts to LLMs.
 import sys
 import time
 import uuid
+from typing import Any, Dict
 
 from IPython.core.magic import cell_magic, magics_class
-from IPython.core.magic_arguments import argument, magic_arguments, parse_argstring
+from IPython.core.magic_arguments import magic_arguments
 
 from cellmage.magic_commands.core import extract_metadata_for_status
 
-from ...context_providers.ipython_context_provider import get_ipython_context_provider
 from ...models import Message
-from .common import _IPYTHON_AVAILABLE, IPythonMagicsBase, logger
+from .common import _IPYTHON_AVAILABLE, IPythonMagicsBase, logger, model_override
+from .magic_args import LLM_ARGS, add_arguments, parse_args
 
 
 @magics_class
@@ -26,64 +27,31 @@ class CoreLLMMagics(IPythonMagicsBase):
     """
 
     @magic_arguments()
-    @argument("-p", "--persona", type=str, help="Use specific persona for THIS call only.")
-    @argument("-m", "--model", type=str, help="Use specific model for THIS call only.")
-    @argument("-t", "--temperature", type=float, help="Set temperature for THIS call.")
-    @argument("--max-tokens", type=int, dest="max_tokens", help="Set max_tokens for THIS call.")
-    @argument(
-        "--no-history",
-        action="store_false",
-        dest="add_to_history",
-        help="Do not add this exchange to history.",
-    )
-    @argument(
-        "--no-stream",
-        action="store_false",
-        dest="stream",
-        help="Do not stream output (wait for full response).",
-    )
-    @argument(
-        "--no-rollback",
-        action="store_false",
-        dest="auto_rollback",
-        help="Disable auto-rollback check for this cell run.",
-    )
-    @argument(
-        "--param",
-        nargs=2,
-        metavar=("KEY", "VALUE"),
-        action="append",
-        help="Set any other LLM param ad-hoc (e.g., --param top_p 0.9).",
-    )
-    @argument("--list-snippets", action="store_true", help="List available snippet names.")
-    @argument(
-        "--snippet",
-        type=str,
-        action="append",
-        help="Add user snippet content before sending prompt. Can be used multiple times.",
-    )
-    @argument(
-        "--sys-snippet",
-        type=str,
-        action="append",
-        help="Add system snippet content before sending prompt. Can be used multiple times.",
-    )
+    @add_arguments(LLM_ARGS)
     @cell_magic("llm")
     def execute_llm(self, line, cell):
         """Send the cell content as a prompt to the LLM, applying arguments."""
         if not _IPYTHON_AVAILABLE:
             return
 
-        start_time = time.time()
-        status_info = {"success": False, "duration": 0.0}
-        context_provider = get_ipython_context_provider()
+        start_time = time.perf_counter()
+        status_info: Dict[str, Any] = {"success": False, "duration": 0.0}
+        context_provider = self._context_provider
+
+        # Nothing to send: skip before parsing arguments or touching the chat manager
+        if not cell or not cell.strip():
+            print("⚠️ LLM prompt is empty, skipping.")
+            status_info["skipped"] = True
+            status_info["duration"] = time.perf_counter() - start_time
+            context_provider.display_status(status_info)
+            return
 
         try:
-            args = parse_argstring(self.execute_llm, line)
+            args = parse_args(self.execute_llm, line)
             manager = self._get_manager()
         except Exception as e:
             print(f"Error parsing arguments: {e}")
-            status_info["duration"] = time.time() - start_time
+            status_info["duration"] = time.perf_counter() - start_time
             context_provider.display_status(status_info)
             return
 
@@ -91,11 +59,11 @@ class CoreLLMMagics(IPythonMagicsBase):
         temp_persona = None
         if args.persona:
             # Check if persona exists
-            logger.info(f"DEBUG: Checking for persona '{args.persona}'")
+            logger.info("DEBUG: Checking for persona '%s'", args.persona)
             if manager.persona_loader and manager.persona_loader.get_persona(args.persona):
                 temp_persona = manager.persona_loader.get_persona(args.persona)
                 print(f"Using persona: {args.persona} for this request only")
-                logger.info(f"DEBUG: Successfully loaded persona '{args.persona}'")
+                logger.info("DEBUG: Successfully loaded persona '%s'", args.persona)
 
                 # If using an external persona (starts with / or .), ensure its system message is added
                 # and it's the first system message
@@ -104,7 +72,7 @@ class CoreLLMMagics(IPythonMagicsBase):
                     and temp_persona is not None
                     and getattr(temp_persona, "system_message", None)
                 ):
-                    logger.info(f"Using external file persona: {args.persona}")
+                    logger.info("Using external file persona: %s", args.persona)
 
                     # Get current history
                     current_history = manager.get_history()
@@ -119,7 +87,7 @@ class CoreLLMMagics(IPythonMagicsBase):
                     # Add persona system message first
                     manager.conversation_manager.add_message(
                         Message(
-                            role="system", content=temp_persona.system_message, id=str(uuid.uuid4())
+                            role="system", content=temp_persona.system_message, id=uuid.uuid4().hex
                         )
                     )
 
@@ -138,16 +106,11 @@ class CoreLLMMagics(IPythonMagicsBase):
                 logger.info(f"DEBUG: Available personas: {available_personas}")
                 print(f"❌ Error: Persona '{args.persona}' not found.")
                 print("  To list available personas, use: %llm_config --list-personas")
-                status_info["duration"] = time.time() - start_time
+                status_info["duration"] = time.perf_counter() - start_time
                 context_provider.display_status(status_info)
                 return
 
         prompt = cell.strip()
-        if not prompt:
-            print("⚠️ LLM prompt is empty, skipping.")
-            status_info["duration"] = time.time() - start_time
-            context_provider.display_status(status_info)
-            return
 
         # Handle snippets
         try:
@@ -159,69 +122,45 @@ class CoreLLMMagics(IPythonMagicsBase):
             snippet_handler.handle_args(args, manager)
         except Exception as e:
             print(f"❌ Unexpected error processing snippets: {e}")
-            status_info["duration"] = time.time() - start_time
+            status_info["duration"] = time.perf_counter() - start_time
             context_provider.display_status(status_info)
             return
 
         # Prepare runtime params
-        runtime_params = self._prepare_runtime_params(args)
-
-        # Handle model override
-        original_model = None
-        if args.model:
-            # Directly set model override in the LLM client to ensure highest priority
-            if (
-                hasattr(manager, "llm_client")
-                and manager.llm_client is not None
-                and hasattr(manager.llm_client, "set_override")
-            ):
-                # Temporarily set model override for this call
-                original_model = manager.llm_client.get_overrides().get("model")
-                manager.llm_client.set_override("model", args.model)
-                logger.debug(f"Temporarily set model override to: {args.model}")
-            else:
-                # Fallback if direct override not possible
-                runtime_params["model"] = args.model
+        try:
+            runtime_params = self._prepare_runtime_params(args)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            status_info["duration"] = time.perf_counter() - start_time
+            context_provider.display_status(status_info)
+            return
 
         # Debug logging
-        logger.debug(f"Sending message with prompt: '{prompt[:50]}...'")
-        logger.debug(f"Runtime params: {runtime_params}")
+        logger.debug("Sending message with prompt: %r", prompt[:50])
+        logger.debug("Runtime params: %s", runtime_params)
 
         try:
-            # Call the ChatManager's chat method
-            result = manager.chat(
-                prompt=prompt,
-                persona_name=args.persona if args.persona else None,
-                model=args.model if args.model else None,
-                stream=args.stream,
-                add_to_history=args.add_to_history,
-                auto_rollback=args.auto_rollback,
-                **runtime_params,
-            )
-
-            # If we temporarily overrode the model, restore the original value
-            if (
-                args.model
-                and hasattr(manager, "llm_client")
-                and manager.llm_client is not None
-                and hasattr(manager.llm_client, "set_override")
-            ):
-                if original_model is not None:
-                    manager.llm_client.set_override("model", original_model)
-                    logger.debug(f"Restored original model override: {original_model}")
-                elif hasattr(manager.llm_client, "remove_override"):
-                    manager.llm_client.remove_override("model")
-                    logger.debug("Removed temporary model override")
+            # Set the model directly on the LLM client, for this call only, so it
+            # takes priority over any other override; it is also passed to chat()
+            with model_override(getattr(manager, "llm_client", None), args.model):
+                # Call the ChatManager's chat method
+                result = manager.chat(
+                    prompt=prompt,
+                    persona_name=args.persona if args.persona else None,
+                    model=args.model if args.model else None,
+                    stream=args.stream,
+                    add_to_history=args.add_to_history,
+                    auto_rollback=args.auto_rollback,
+                    use_cache=args.use_cache,
+                    **runtime_params,
+                )
 
             # If result is successful, mark as success and collect status info
             if result:
                 status_info["success"] = True
                 status_info["response_content"] = result
                 try:
-                    history = manager.get_history()
-                    from cellmage.magic_commands.core import get_last_assistant_metadata
-
-                    last_meta = get_last_assistant_metadata(history)
+                    last_meta = manager.get_last_response_metadata()
                     status_info.update(extract_metadata_for_status(last_meta))
                 except Exception as e:
                     logger.error(f"Error extracting metadata for status bar: {e}")
@@ -230,24 +169,14 @@ class CoreLLMMagics(IPythonMagicsBase):
             print(f"❌ LLM Error: {e}", file=sys.stderr)
             logger.error(f"Error during LLM call: {e}")
             status_info["response_content"] = f"Error: {str(e)}"
-
-            # Make sure to restore model override even on error
-            if (
-                args.model
-                and hasattr(manager, "llm_client")
-                and manager.llm_client is not None
-                and hasattr(manager.llm_client, "set_override")
-            ):
-                if original_model is not None:
-                    manager.llm_client.set_override("model", original_model)
-                elif hasattr(manager.llm_client, "remove_override"):
-                    manager.llm_client.remove_override("model")
-                logger.debug("Restored model override after error")
         finally:
-            status_info["duration"] = time.time() - start_time
+            status_info["duration"] = time.perf_counter() - start_time
             # Always ensure model_used is present for the status bar
             if "model_used" not in status_info:
-                status_info["model_used"] = status_info.get("model", "")
+                # Only look at the persona when the call itself didn't tell us the model
+                status_info["model_used"] = (
+                    runtime_params.get("model") or args.model or self._default_model_name(manager)
+                )
             context_provider.display_status(status_info)
 
         return None
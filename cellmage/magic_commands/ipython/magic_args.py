@@ -0,0 +1,331 @@
+"""
+Shared argument definitions for the CellMage IPython magics.
+
+The %%llm, %llm_config and %llm_config_persistent magics accept overlapping
+sets of options. Each group of options is defined once here; the factories are
+memoized so the ``argument`` decorator objects are only built the first time
+they are requested and then shared by every magic that uses them.
+"""
+
+import argparse
+import copy
+import functools
+import re
+from typing import Any, Callable, Tuple
+
+from IPython.core.magic_arguments import argument, parse_argstring
+
+ArgumentGroup = Tuple[Callable, ...]
+
+# Help suffixes shared by the per-call %%llm options
+_FOR_THIS_CALL = "for THIS call."
+_FOR_THIS_CALL_ONLY = "for THIS call only."
+
+# Numeric --param values, e.g. "42", "-3", "0.9", ".5", "1e5", "2.5E-3"
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+
+@functools.lru_cache(maxsize=None)
+def persona_args() -> ArgumentGroup:
+    """Arguments for selecting and inspecting personas."""
+    return (
+        argument("-p", "--persona", type=str, help="Select and activate a persona by name."),
+        argument(
+            "--show-persona", action="store_true", help="Show the currently active persona details."
+        ),
+        argument("--list-personas", action="store_true", help="List available persona names."),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def model_mapping_args() -> ArgumentGroup:
+    """Arguments for managing model name mappings."""
+    return (
+        argument("--list-mappings", action="store_true", help="List current model name mappings"),
+        argument(
+            "--add-mapping",
+            nargs=2,
+            metavar=("ALIAS", "FULL_NAME"),
+            help="Add a model name mapping (e.g., --add-mapping g4 gpt-4)",
+        ),
+        argument(
+            "--remove-mapping",
+            type=str,
+            help="Remove a model name mapping",
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def override_args() -> ArgumentGroup:
+    """Arguments for managing temporary LLM parameter overrides."""
+    return (
+        argument(
+            "--set-override",
+            nargs=2,
+            metavar=("KEY", "VALUE"),
+            help="Set a temporary LLM param override (e.g., --set-override temperature 0.5).",
+        ),
+        argument(
+            "--remove-override", type=str, metavar="KEY", help="Remove a specific override key."
+        ),
+        argument(
+            "--clear-overrides",
+            action="store_true",
+            help="Clear all temporary LLM param overrides.",
+        ),
+        argument(
+            "--show-overrides", action="store_true", help="Show the currently active overrides."
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def history_args() -> ArgumentGroup:
+    """Arguments for inspecting and clearing the conversation history."""
+    return (
+        argument(
+            "--clear-history",
+            action="store_true",
+            help="Clear the current chat history (keeps system prompt).",
+        ),
+        argument(
+            "--show-history", action="store_true", help="Display the current message history."
+        ),
+        argument(
+            "--tokens",
+            action="store_true",
+            help="Show token count for the current conversation history.",
+        ),
+        argument(
+            "--token",
+            action="store_true",
+            help="Alias for --tokens, shows token count for conversation history.",
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def persistence_args() -> ArgumentGroup:
+    """Arguments for saving, loading and auto-saving sessions."""
+    return (
+        argument(
+            "--save",
+            type=str,
+            nargs="?",
+            const=True,
+            metavar="FILENAME",
+            help="Save session. If no name, uses current session ID. '.md' added automatically.",
+        ),
+        argument(
+            "--load",
+            type=str,
+            metavar="SESSION_ID",
+            help="Load session from specified identifier (filename without .md).",
+        ),
+        argument("--list-sessions", action="store_true", help="List saved session identifiers."),
+        argument(
+            "--auto-save",
+            action="store_true",
+            help="Enable automatic saving of conversations to the conversations directory.",
+        ),
+        argument(
+            "--no-auto-save", action="store_true", help="Disable automatic saving of conversations."
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def snippet_args() -> ArgumentGroup:
+    """Arguments for listing and adding snippets."""
+    return (
+        argument("--list-snippets", action="store_true", help="List available snippet names."),
+        argument(
+            "--snippet",
+            type=str,
+            action="append",
+            help="Add user snippet content before sending prompt. Can be used multiple times.",
+        ),
+        argument(
+            "--sys-snippet",
+            type=str,
+            action="append",
+            help="Add system snippet content before sending prompt. Can be used multiple times.",
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def config_args() -> ArgumentGroup:
+    """Arguments for general session configuration."""
+    return (
+        argument(
+            "--status",
+            action="store_true",
+            help="Show current status (persona, overrides, history length).",
+        ),
+        argument("--model", type=str, help="Set the default model for the LLM client."),
+        argument(
+            "--set-rate",
+            nargs=3,
+            metavar=("MODEL", "INPUT", "OUTPUT"),
+            help="Set the cost of a model in USD per 1M tokens (e.g., --set-rate g4 2.5 10).",
+        ),
+        argument(
+            "--adapter",
+            type=str,
+            choices=["direct", "langchain"],
+            help="Switch to a different LLM adapter implementation.",
+        ),
+        argument("--base-dir", type=str, help="Set the base directory for all working files."),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def llm_execution_args() -> ArgumentGroup:
+    """Per-call arguments for the %%llm cell magic."""
+    return (
+        argument("-p", "--persona", type=str, help=f"Use specific persona {_FOR_THIS_CALL_ONLY}"),
+        argument("-m", "--model", type=str, help=f"Use specific model {_FOR_THIS_CALL_ONLY}"),
+        argument("-t", "--temperature", type=float, help=f"Set temperature {_FOR_THIS_CALL}"),
+        argument(
+            "--max-tokens", type=int, dest="max_tokens", help=f"Set max_tokens {_FOR_THIS_CALL}"
+        ),
+        argument(
+            "--no-history",
+            action="store_false",
+            dest="add_to_history",
+            help="Do not add this exchange to history.",
+        ),
+        argument(
+            "--no-stream",
+            action="store_false",
+            dest="stream",
+            help="Do not stream output (wait for full response).",
+        ),
+        argument(
+            "--no-rollback",
+            action="store_false",
+            dest="auto_rollback",
+            help="Disable auto-rollback check for this cell run.",
+        ),
+        argument(
+            "--no-cache",
+            action="store_false",
+            dest="use_cache",
+            help="Always call the LLM, even if the response cache has a stored answer.",
+        ),
+        argument(
+            "--param",
+            nargs="+",
+            metavar="KEY=VALUE",
+            action="append",
+            help="Set any other LLM param ad-hoc (e.g., --param top_p=0.9).",
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def sqlite_llm_args() -> ArgumentGroup:
+    """Per-call arguments for the SQLite-backed %%sqlite_llm and %%llm cell magics."""
+    return (
+        argument("-p", "--persona", type=str, help=f"Use specific persona {_FOR_THIS_CALL_ONLY}"),
+        argument("-m", "--model", type=str, help=f"Use specific model {_FOR_THIS_CALL_ONLY}"),
+        argument("-t", "--temperature", type=float, help=f"Set temperature {_FOR_THIS_CALL}"),
+        argument(
+            "--max-tokens", type=int, dest="max_tokens", help=f"Set max_tokens {_FOR_THIS_CALL}"
+        ),
+        argument(
+            "--no-stream",
+            action="store_false",
+            dest="stream",
+            help="Do not stream output (wait for full response).",
+        ),
+        argument(
+            "--param",
+            nargs="+",
+            metavar="KEY=VALUE",
+            action="append",
+            help="Set any other LLM param ad-hoc (e.g., --param top_p=0.9).",
+        ),
+    )
+
+
+# Complete argument lists for each magic, concatenated once at import time
+LLM_ARGS: ArgumentGroup = llm_execution_args() + snippet_args()
+LLM_CONFIG_ARGS: ArgumentGroup = (
+    persona_args()
+    + model_mapping_args()
+    + override_args()
+    + history_args()
+    + persistence_args()
+    + snippet_args()
+    + config_args()
+)
+SQLITE_LLM_ARGS: ArgumentGroup = sqlite_llm_args()
+
+
+def add_arguments(args: ArgumentGroup) -> Callable:
+    """
+    Build a decorator that applies a precomputed argument list to a magic.
+
+    Must be placed below ``@magic_arguments()``. Arguments keep the order in
+    which they are listed, so ``--help`` output reads top to bottom.
+
+    Args:
+        args: Argument decorators, e.g. ``LLM_ARGS`` or ``LLM_CONFIG_ARGS``
+
+    Returns:
+        A decorator that attaches the arguments to the magic function
+    """
+
+    def decorator(func: Callable) -> Callable:
+        # magic_arguments() reads the decorators in reverse application order
+        for arg in reversed(args):
+            func = arg(func)
+        return func
+
+    return decorator
+
+
+def coerce_param_value(value: str) -> Any:
+    """
+    Convert a ``--param`` value to int or float when it is numeric.
+
+    Args:
+        value: Value as typed on the magic line (e.g. "0.9", "42", "1e5", "stop")
+
+    Returns:
+        The int or float value, or the original string if it is not a number
+    """
+    if _INT_RE.fullmatch(value):
+        return int(value)
+    if _FLOAT_RE.fullmatch(value):
+        return float(value)
+    return value
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_argstring_cached(magic_func: Callable, line: str) -> argparse.Namespace:
+    return parse_argstring(magic_func, line)
+
+
+def parse_args(magic_func: Callable, line: str) -> argparse.Namespace:
+    """
+    Parse a magic's argument line, reusing the result for lines seen before.
+
+    Re-running a notebook issues the same lines again, so parsed results are
+    cached per magic and line. Each call gets its own copy, which handlers may
+    modify freely.
+
+    Args:
+        magic_func: The magic method decorated with ``@magic_arguments()``
+        line: The argument line passed to the magic
+
+    Returns:
+        The parsed arguments
+    """
+    # Key on the plain function so the cache does not keep magics instances alive
+    func = getattr(magic_func, "__func__", magic_func)
+    return copy.deepcopy(_parse_argstring_cached(func, line))
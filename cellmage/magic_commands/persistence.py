@@ -5,6 +5,7 @@ This module provides commands for saving and loading conversations,
 and utilities for working with the SQLite storage system.
 """
 
+import functools
 import logging
 import uuid
 from datetime import datetime
@@ -12,6 +13,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from ..chat_manager import ChatManager
+from ..config import settings
 from ..conversation_manager import ConversationManager
 from ..models import ConversationMetadata, Message
 from ..storage.sqlite_store import SQLiteStore
@@ -20,6 +22,24 @@ from ..storage.sqlite_store import SQLiteStore
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _store_for_path(db_path: str) -> SQLiteStore:
+    return SQLiteStore(db_path)
+
+
+def _get_store(db_path: Optional[str] = None) -> SQLiteStore:
+    """
+    Get the shared SQLiteStore for a database, so its connections are reused.
+
+    Args:
+        db_path: Path to SQLite database file. If None, uses the configured path.
+
+    Returns:
+        SQLiteStore for the database
+    """
+    return _store_for_path(str(db_path or settings.sqlite_path_resolved))
+
+
 def migrate_to_sqlite(manager: ChatManager, db_path: Optional[str] = None) -> ConversationManager:
     """
     Migrate conversations from current storage to SQLite.
@@ -40,8 +60,10 @@ def migrate_to_sqlite(manager: ChatManager, db_path: Optional[str] = None) -> Co
     current_history = []
     if hasattr(manager, "conversation_manager") and manager.conversation_manager:
         current_history = manager.conversation_manager.get_messages()
-        for msg in current_history:
-            conversation_manager.add_message(msg)
+        # Save once at the end rather than rewriting the conversation per message
+        with conversation_manager.transaction():
+            for msg in current_history:
+                conversation_manager.add_message(msg)
 
     logger.info(f"Migrated {len(current_history)} messages to SQLite storage")
 
@@ -83,7 +105,7 @@ def export_conversation_to_markdown(
                 conversation_id = conversation_id[len("sqlite://") :]
 
             # Use SQLiteStore directly to avoid changing current conversation
-            store = SQLiteStore()
+            store = _get_store()
             loaded_messages, metadata = store.load_conversation(f"sqlite://{conversation_id}")
             messages = loaded_messages
 
@@ -274,7 +296,7 @@ def list_sqlite_conversations(db_path: Optional[str] = None) -> List[Dict[str, A
         List of conversation metadata dictionaries
     """
     try:
-        store = SQLiteStore(db_path)
+        store = _get_store(db_path)
         return store.list_saved_conversations()
     except Exception as e:
         logger.error(f"Error listing SQLite conversations: {e}")
@@ -295,7 +317,7 @@ def get_sqlite_conversation(
         Tuple of (messages, metadata)
     """
     try:
-        store = SQLiteStore(db_path)
+        store = _get_store(db_path)
 
         # Add sqlite:// prefix if not present
         if not conversation_id.startswith("sqlite://"):
@@ -319,7 +341,7 @@ def delete_sqlite_conversation(conversation_id: str, db_path: Optional[str] = No
         True if successful, False otherwise
     """
     try:
-        store = SQLiteStore(db_path)
+        store = _get_store(db_path)
         return store.delete_conversation(conversation_id)
     except Exception as e:
         logger.error(f"Error deleting SQLite conversation {conversation_id}: {e}")
@@ -339,7 +361,7 @@ def tag_sqlite_conversation(conversation_id: str, tag: str, db_path: Optional[st
         True if successful, False otherwise
     """
     try:
-        store = SQLiteStore(db_path)
+        store = _get_store(db_path)
         return store.add_tag(conversation_id, tag)
     except Exception as e:
         logger.error(f"Error tagging SQLite conversation {conversation_id}: {e}")
@@ -361,7 +383,7 @@ def search_sqlite_conversations(
         List of matching conversation metadata
     """
     try:
-        store = SQLiteStore(db_path)
+        store = _get_store(db_path)
         return store.search_conversations(query, limit)
     except Exception as e:
         logger.error(f"Error searching SQLite conversations: {e}")
@@ -379,7 +401,7 @@ def get_sqlite_statistics(db_path: Optional[str] = None) -> Dict[str, Any]:
         Dictionary with statistics
     """
     try:
-        store = SQLiteStore(db_path)
+        store = _get_store(db_path)
         return store.get_statistics()
     except Exception as e:
         logger.error(f"Error getting SQLite statistics: {e}")
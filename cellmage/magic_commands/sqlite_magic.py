@@ -4,15 +4,23 @@ SQLite-backed IPython magic commands for CellMage.
 This module provides magic commands for using CellMage with SQLite storage in IPython/Jupyter notebooks.
 """
 
+import contextlib
 import logging
 import sys
 import time
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 # IPython imports with fallback handling
 try:
     from IPython.core.magic import cell_magic, line_magic, magics_class
-    from IPython.core.magic_arguments import argument, magic_arguments, parse_argstring
+    from IPython.core.magic_arguments import magic_arguments
+
+    from .ipython.magic_args import (
+        SQLITE_LLM_ARGS,
+        add_arguments,
+        coerce_param_value,
+        parse_args,
+    )
 
     _IPYTHON_AVAILABLE = True
 except ImportError:
@@ -31,11 +39,17 @@ except ImportError:
     def magic_arguments():
         return lambda func: func
 
-    def argument(*args, **kwargs):
+    def add_arguments(args: Tuple[Callable, ...]) -> Callable:
         return lambda func: func
 
+    SQLITE_LLM_ARGS = ()
+
 
-from cellmage.magic_commands.core import extract_metadata_for_status
+from cellmage.magic_commands.core import (
+    HEAVY_RULE,
+    extract_metadata_for_status,
+    report_extension_loaded,
+)
 
 # Import the base magic class
 from cellmage.magic_commands.tools.base_tool_magic import BaseMagics
@@ -43,15 +57,19 @@ from cellmage.magic_commands.tools.base_tool_magic import BaseMagics
 # Create a global logger
 logger = logging.getLogger(__name__)
 
-# Check if SQLite storage components are available
+# Check if SQLite storage components are available. Modules only needed by a
+# single command (history reports, ambient mode) are imported where they are used.
 try:
-    from ..ambient_mode import disable_ambient_mode, is_ambient_mode_enabled
     from ..context_providers.ipython_context_provider import (
         get_ipython_context_provider,
     )
     from ..conversation_manager import ConversationManager
-    from ..magic_commands import history
-    from ..magic_commands.ipython.common import get_chat_manager
+    from ..magic_commands.ipython.common import (
+        _parse_param_pairs,
+        get_chat_manager,
+        model_override,
+        register_config_magic,
+    )
 
     _SQLITE_AVAILABLE = True
 except ImportError:
@@ -70,25 +88,30 @@ class SQLiteCellMagics(BaseMagics):
 
         super().__init__(shell)
         self.conversation_manager = None
+        self._context_provider = get_ipython_context_provider()
         self.setup_manager()
 
     def setup_manager(self) -> None:
         """Set up the conversation manager."""
+        if self.conversation_manager is not None:
+            return
+
         try:
-            # Try to get the chat manager first for compatibility
-            get_chat_manager()
+            # Share the ChatManager's conversation manager: _add_to_history() writes
+            # through it, and reusing it avoids opening the database a second time
+            chat_manager = get_chat_manager()
+            self.conversation_manager = getattr(chat_manager, "conversation_manager", None)
 
-            # Now create or get the conversation manager
             if self.conversation_manager is None:
-                context_provider = get_ipython_context_provider()
-                # Always create a new ConversationManager
-                self.conversation_manager = ConversationManager(context_provider=context_provider)
+                self.conversation_manager = ConversationManager(
+                    context_provider=self._context_provider
+                )
                 logger.info("Created new SQLite-backed ConversationManager")
 
             logger.info("SQLiteCellMagics initialized successfully")
 
         except Exception as e:
-            logger.error(f"Error initializing SQLiteCellMagics: {e}")
+            logger.error("Error initializing SQLiteCellMagics: %s", e)
             print(f"❌ Error initializing SQLite storage: {e}", file=sys.stderr)
 
     def _get_manager(self) -> Optional[ConversationManager]:
@@ -111,6 +134,27 @@ class SQLiteCellMagics(BaseMagics):
             )
             return None
 
+    @contextlib.contextmanager
+    def _history_transaction(
+        self, manager: ConversationManager, chat_manager: Any
+    ) -> Iterator[None]:
+        """
+        Batch history changes made inside the block into one save per conversation.
+
+        Rollbacks run on this magic's conversation manager (as returned by
+        _get_manager()), while _add_to_history() writes through the ChatManager's
+        one; if they differ, both are held open.
+        """
+        conversation_managers: List[Any] = [manager]
+        chat_conversation_manager = getattr(chat_manager, "conversation_manager", None)
+        if chat_conversation_manager not in (None, manager):
+            conversation_managers.append(chat_conversation_manager)
+
+        with contextlib.ExitStack() as stack:
+            for conversation_manager in conversation_managers:
+                stack.enter_context(conversation_manager.transaction())
+            yield
+
     def _add_to_history(
         self, content: str, source_type: str, source_id: str, as_system_msg: bool = False
     ) -> bool:
@@ -134,18 +178,52 @@ class SQLiteCellMagics(BaseMagics):
         """
         indices_to_remove = []
 
-        # Match by source type and ID
+        # Match by source type and ID. The ID is checked first: most messages don't
+        # carry it, so they are rejected after a single lookup.
         for i, msg in enumerate(history):
+            metadata = msg.metadata
             if (
-                msg.metadata
-                and msg.metadata.get("source") == source_name
-                and msg.metadata.get("type") == source_type
-                and msg.metadata.get(id_key) == source_id
+                metadata
+                and metadata.get(id_key) == source_id
+                and metadata.get("source") == source_name
+                and metadata.get("type") == source_type
             ):
                 indices_to_remove.append(i)
 
         return indices_to_remove
 
+    @staticmethod
+    def _populate_status_info(status_info: Dict[str, Any], metadata: Dict[str, Any]) -> None:
+        """Fill the status bar fields from the metadata of the LLM response."""
+        if metadata:
+            status_info.update(extract_metadata_for_status(metadata))
+        status_info.update(
+            {
+                "tokens_in": float(metadata.get("tokens_in") or 0),
+                "tokens_out": float(metadata.get("tokens_out") or 0),
+                "cost_str": metadata.get("cost_str", ""),
+            }
+        )
+        # Ensure model_used is always present
+        if "model_used" not in status_info:
+            status_info["model_used"] = status_info.get("model", "")
+
+    @staticmethod
+    def _attach_response_metadata(
+        manager: ConversationManager, response_id: str, metadata: Dict[str, Any]
+    ) -> None:
+        """Copy the LLM response metadata onto the response message just added to history."""
+        # _add_to_history() appends, so only the last message can be the one just added
+        msg = manager.get_last_message()
+        if (
+            msg
+            and msg.role == "assistant"
+            and msg.metadata
+            and msg.metadata.get("source") == "sqlite"
+            and msg.metadata.get("sqlite_id") == response_id
+        ):
+            msg.metadata.update(metadata)
+
     def _show_status(self) -> None:
         """Show current SQLite storage status."""
         manager = self._get_manager()
@@ -153,31 +231,149 @@ class SQLiteCellMagics(BaseMagics):
             print("❌ Conversation manager not available")
             return
 
+        from ..magic_commands import history
+
         # Get statistics using the history module function
         stats = history.get_conversation_statistics(manager)
 
-        # Print stats
-        print("══════════════════════════════════════════════════════════")
-        print("  🗄️  SQLite Storage Status")
-        print("══════════════════════════════════════════════════════════")
-        print("  • Storage type: SQLite")
-        print(f"  • Current conversation ID: {manager.current_conversation_id}")
-        print(f"  • Current message count: {len(manager.messages)}")
-        print(f"  • Total conversations: {stats.get('total_conversations', 0)}")
-        print(f"  • Total messages: {stats.get('total_messages', 0)}")
+        # Build the report and print it in one call
+        lines = [
+            HEAVY_RULE,
+            "  🗄️  SQLite Storage Status",
+            HEAVY_RULE,
+            "  • Storage type: SQLite",
+            f"  • Current conversation ID: {manager.current_conversation_id}",
+            f"  • Current message count: {len(manager.messages)}",
+            f"  • Total conversations: {stats.get('total_conversations', 0)}",
+            f"  • Total messages: {stats.get('total_messages', 0)}",
+        ]
 
         # Add token stats if available
         if "total_tokens" in stats:
-            print(f"  • Total tokens: {stats.get('total_tokens', 0):,}")
+            lines.append(f"  • Total tokens: {stats.get('total_tokens', 0):,}")
 
         # Show models if available
         if "most_used_model" in stats and stats["most_used_model"]:
             model_info = stats["most_used_model"]
-            print(
+            lines.append(
                 f"  • Most used model: {model_info.get('model')} ({model_info.get('count')} times)"
             )
 
-        print("══════════════════════════════════════════════════════════")
+        lines.append(HEAVY_RULE)
+        print("\n".join(lines))
+
+    def _run_prompt(
+        self,
+        chat_manager: Any,
+        manager: ConversationManager,
+        prompt: str,
+        *,
+        ambient: bool = False,
+        persona: Optional[str] = None,
+        model: Optional[str] = None,
+        stream: bool = True,
+        runtime_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send a prompt to the LLM and record the exchange in the SQLite history.
+
+        Shared by %%sqlite_llm and ambient mode. Handles rollback on cell reruns,
+        the prompt and response messages, their metadata and the status bar.
+
+        Args:
+            chat_manager: ChatManager whose LLM client answers the prompt
+            manager: Conversation manager holding the SQLite history
+            prompt: Prompt text (already stripped)
+            ambient: Whether the prompt comes from a regular cell in ambient mode
+            persona: Persona to use for this call only (None for the default)
+            model: Model to use for this call only (None for the default)
+            stream: Whether to stream the response
+            runtime_params: Additional LLM parameters for this call
+
+        Returns:
+            The status information shown in the status bar
+        """
+        start_time = time.perf_counter()
+        status_info = {"success": False, "duration": 0.0}
+        context_provider = self._context_provider
+        runtime_params = dict(runtime_params or {})
+
+        # Ambient mode keeps its own message types and IDs, so reruns of a cell
+        # only roll back exchanges made the same way
+        if ambient:
+            prompt_type, prompt_prefix = "ambient_prompt", "ambient"
+            response_type = "ambient_response"
+        else:
+            prompt_type = prompt_prefix = "prompt"
+            response_type = "response"
+
+        try:
+            # Get execution context for cell identification
+            exec_count, cell_id = context_provider.get_execution_context()
+
+            # Rollback, prompt and response are saved together, in one commit per
+            # cell; if the LLM call fails, the history is left as it was
+            with self._history_transaction(manager, chat_manager):
+                # Check for cell rerun and perform rollback if needed
+                manager.perform_rollback(cell_id)
+
+                # Add user message using _add_to_history
+                prompt_id = f"{prompt_prefix}_{cell_id}_{exec_count}"
+                self._add_to_history(prompt, prompt_type, prompt_id, as_system_msg=False)
+
+                with model_override(chat_manager.llm_client, model) as overridden:
+                    if model and not overridden:
+                        runtime_params["model"] = model
+
+                    # Call the ChatManager's chat method
+                    result = chat_manager.chat(
+                        prompt=prompt,
+                        persona_name=persona,
+                        stream=stream,
+                        add_to_history=False,  # We manage history ourselves in SQLite
+                        auto_rollback=False,  # We already handled rollback
+                        **runtime_params,
+                    )
+
+                # If result is successful, capture the assistant response
+                if result:
+                    status_info["success"] = True
+                    status_info["response_content"] = result
+
+                    # Token, cost and model details of this call. chat() keeps them, so
+                    # there is no need to look through the history (which, with
+                    # add_to_history=False, doesn't hold the response anyway).
+                    metadata = {}
+                    try:
+                        # Only read below; update() copies it into the new message
+                        metadata = chat_manager.get_last_response_metadata()
+                    except Exception as e:
+                        logger.warning("Error extracting metadata of the LLM response: %s", e)
+                    self._populate_status_info(status_info, metadata)
+
+                    # Add assistant message with the result using _add_to_history
+                    response_id = f"{response_type}_{cell_id}_{exec_count}"
+                    self._add_to_history(result, response_type, response_id, as_system_msg=False)
+
+                    # Update the metadata directly for the message we just added
+                    if metadata:
+                        self._attach_response_metadata(manager, response_id, metadata)
+
+        except Exception as e:
+            if ambient:
+                print(f"❌ LLM Error (Ambient Mode): {e}", file=sys.stderr)
+                logger.error("Error during LLM call in ambient mode: %s", e)
+            else:
+                print(f"❌ LLM Error: {e}", file=sys.stderr)
+                logger.error("Error during LLM call: %s", e)
+            # Add error message to status_info for copying
+            status_info["response_content"] = f"Error: {str(e)}"
+        finally:
+            status_info["duration"] = time.perf_counter() - start_time
+            # Display status bar
+            context_provider.display_status(status_info)
+
+        return status_info
 
     def process_cell_as_prompt(self, cell_content: str) -> None:
         """Process a regular code cell as an LLM prompt in ambient mode using SQLite storage."""
@@ -197,118 +393,18 @@ class SQLiteCellMagics(BaseMagics):
             print("❌ Conversation manager not available", file=sys.stderr)
             return
 
-        start_time = time.time()
-        status_info = {"success": False, "duration": 0.0}
-        context_provider = get_ipython_context_provider()
-
         prompt = cell_content.strip()
         if not prompt:
             logger.debug("Skipping empty prompt in ambient mode.")
             return
 
-        logger.debug(f"Processing cell as prompt in ambient mode: '{prompt[:50]}...'")
-
-        try:
-            # Get execution context for cell identification
-            exec_count, cell_id = context_provider.get_execution_context()
+        logger.debug("Processing cell as prompt in ambient mode: %r", prompt[:50])
 
-            # Check for cell rerun and perform rollback if needed
-            manager.perform_rollback(cell_id)
-
-            # Add user message using _add_to_history
-            unique_id = f"ambient_{cell_id}_{exec_count}"
-            self._add_to_history(prompt, "ambient_prompt", unique_id, as_system_msg=False)
-
-            # Call the ChatManager's chat method with default settings
-            result = chat_manager.chat(
-                prompt=prompt,
-                persona_name=None,  # Use default persona
-                stream=True,  # Default to streaming output
-                add_to_history=False,  # We manage history ourselves
-                auto_rollback=False,  # We've already done rollback
-            )
-
-            # If result is successful, capture the assistant response
-            if result:
-                status_info["success"] = True
-                status_info["response_content"] = result
-
-                # Extract metadata from chat_manager's last message
-                metadata = {}
-                try:
-                    chat_history = chat_manager.conversation_manager.get_messages()
-                    if chat_history and len(chat_history) > 0:
-                        last_msg = chat_history[-1]
-                        if last_msg.role == "assistant" and last_msg.metadata:
-                            metadata = last_msg.metadata.copy()
-                except Exception as e:
-                    logger.warning(f"Error extracting metadata from chat history: {e}")
-                # Use extract_metadata_for_status to update status_info
-                if metadata:
-                    status_info.update(extract_metadata_for_status(metadata))
-                # Ensure model_used is always present
-                if "model_used" not in status_info:
-                    status_info["model_used"] = status_info.get("model", "")
-
-                # Add assistant message with the extracted metadata
-                response_id = f"ambient_response_{cell_id}_{exec_count}"
-
-                # Store the response content with metadata
-                assistant_content = result
-
-                # Add assistant message using _add_to_history
-                self._add_to_history(
-                    assistant_content, "ambient_response", response_id, as_system_msg=False
-                )
-
-                # Update the metadata directly for the message we just added
-                if metadata:
-                    for msg in reversed(manager.messages):
-                        if (
-                            msg.role == "assistant"
-                            and msg.metadata
-                            and msg.metadata.get("source") == "sqlite"
-                            and msg.metadata.get("sqlite_id") == response_id
-                        ):
-                            msg.metadata.update(metadata)
-                            break
-
-                # Collect token counts for status bar
-                tokens_in = metadata.get("tokens_in", 0) or 0
-                tokens_out = metadata.get("tokens_out", 0) or 0
-
-                status_info["tokens_in"] = float(tokens_in)
-                status_info["tokens_out"] = float(tokens_out)
-                status_info["cost_str"] = metadata.get("cost_str", "")
-
-        except Exception as e:
-            print(f"❌ LLM Error (Ambient Mode): {e}", file=sys.stderr)
-            logger.error(f"Error during LLM call in ambient mode: {e}")
-            # Add error message to status_info for copying
-            status_info["response_content"] = f"Error: {str(e)}"
-        finally:
-            status_info["duration"] = time.time() - start_time
-            # Display status bar
-            context_provider.display_status(status_info)
+        # Default persona and model, streaming output
+        self._run_prompt(chat_manager, manager, prompt, ambient=True)
 
     @magic_arguments()
-    @argument("-p", "--persona", type=str, help="Use specific persona for THIS call only.")
-    @argument("-m", "--model", type=str, help="Use specific model for THIS call only.")
-    @argument("-t", "--temperature", type=float, help="Set temperature for THIS call.")
-    @argument("--max-tokens", type=int, dest="max_tokens", help="Set max_tokens for THIS call.")
-    @argument(
-        "--no-stream",
-        action="store_false",
-        dest="stream",
-        help="Do not stream output (wait for full response).",
-    )
-    @argument(
-        "--param",
-        nargs=2,
-        metavar=("KEY", "VALUE"),
-        action="append",
-        help="Set any other LLM param ad-hoc (e.g., --param top_p 0.9).",
-    )
+    @add_arguments(SQLITE_LLM_ARGS)
     @cell_magic("sqlite_llm")
     def sqlite_llm_magic(self, line, cell):
         """Send the cell content as a prompt to the LLM, storing history in SQLite."""
@@ -329,190 +425,77 @@ class SQLiteCellMagics(BaseMagics):
             print(f"❌ Error getting chat manager for LLM client: {e}", file=sys.stderr)
             return None
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         status_info = {"success": False, "duration": 0.0}
-        context_provider = get_ipython_context_provider()
 
         try:
-            args = parse_argstring(self.sqlite_llm_magic, line)
+            args = parse_args(self.sqlite_llm_magic, line)
         except Exception as e:
             print(f"❌ Error parsing arguments: {e}", file=sys.stderr)
-            status_info["duration"] = time.time() - start_time
-            context_provider.display_status(status_info)
+            status_info["duration"] = time.perf_counter() - start_time
+            self._context_provider.display_status(status_info)
             return None
 
         prompt = cell.strip()
         if not prompt:
             print("⚠️ LLM prompt is empty, skipping.", file=sys.stderr)
-            status_info["duration"] = time.time() - start_time
-            context_provider.display_status(status_info)
+            status_info["duration"] = time.perf_counter() - start_time
+            self._context_provider.display_status(status_info)
             return None
 
-        # Get execution context
-        exec_count, cell_id = context_provider.get_execution_context()
-
-        # Check for cell rerun and perform rollback if needed
-        manager.perform_rollback(cell_id)
-
-        # Add user message using _add_to_history
-        prompt_id = f"prompt_{cell_id}_{exec_count}"
-        self._add_to_history(prompt, "prompt", prompt_id, as_system_msg=False)
-
         # Prepare runtime params
         runtime_params = {}
 
-        # Handle simple parameters
-        if hasattr(args, "temperature") and args.temperature is not None:
+        # Handle simple parameters; the parser always sets these attributes
+        if args.temperature is not None:
             runtime_params["temperature"] = args.temperature
 
-        if hasattr(args, "max_tokens") and args.max_tokens is not None:
+        if args.max_tokens is not None:
             runtime_params["max_tokens"] = args.max_tokens
 
         # Handle arbitrary parameters from --param
-        if hasattr(args, "param") and args.param:
-            for key, value in args.param:
-                # Try to convert string values to appropriate types
-                try:
-                    # First try to convert to int or float if it looks numeric
-                    if "." in value:
-                        parsed_value = float(value)
-                    else:
-                        try:
-                            parsed_value = int(value)
-                        except ValueError:
-                            parsed_value = value
-                except ValueError:
-                    parsed_value = value
-
-                runtime_params[key] = parsed_value
-
-        # Handle model override
-        original_model = None
-        if hasattr(args, "model") and args.model:
-            # Temporarily set model override for this call
-            if chat_manager.llm_client and hasattr(chat_manager.llm_client, "set_override"):
-                original_model = chat_manager.llm_client.get_overrides().get("model")
-                chat_manager.llm_client.set_override("model", args.model)
-                logger.debug(f"Temporarily set model override to: {args.model}")
-            else:
-                runtime_params["model"] = args.model
-
-        try:
-            # Call the ChatManager's chat method
-            result = chat_manager.chat(
-                prompt=prompt,
-                persona_name=args.persona if hasattr(args, "persona") else None,
-                stream=args.stream if hasattr(args, "stream") else True,
-                add_to_history=False,  # We manage history ourselves in SQLite
-                auto_rollback=False,  # We already handled rollback
-                **runtime_params,
-            )
-
-            # If original model was overridden, restore it
-            if (
-                hasattr(args, "model")
-                and args.model
-                and chat_manager.llm_client
-                and hasattr(chat_manager.llm_client, "set_override")
-            ):
-                if original_model is not None:
-                    chat_manager.llm_client.set_override("model", original_model)
-                else:
-                    chat_manager.llm_client.remove_override("model")
-
-            # If result is successful, capture the assistant response
-            if result:
-                status_info["success"] = True
-                status_info["response_content"] = result
-
-                # Extract metadata from chat_manager's last message
-                metadata = {}
-                try:
-                    chat_history = chat_manager.conversation_manager.get_messages()
-                    if chat_history and len(chat_history) > 0:
-                        last_msg = chat_history[-1]
-                        if last_msg.role == "assistant" and last_msg.metadata:
-                            metadata = last_msg.metadata.copy()
-                except Exception as e:
-                    logger.warning(f"Error extracting metadata from chat history: {e}")
-                # Use extract_metadata_for_status to update status_info
-                if metadata:
-                    status_info.update(extract_metadata_for_status(metadata))
-                # Ensure model_used is always present
-                if "model_used" not in status_info:
-                    status_info["model_used"] = status_info.get("model", "")
-
-                # Add assistant message with the result using _add_to_history
-                response_id = f"response_{cell_id}_{exec_count}"
-                self._add_to_history(result, "response", response_id, as_system_msg=False)
-
-                # Update the metadata directly for the message we just added
-                if metadata:
-                    for msg in reversed(manager.messages):
-                        if (
-                            msg.role == "assistant"
-                            and msg.metadata
-                            and msg.metadata.get("source") == "sqlite"
-                            and msg.metadata.get("sqlite_id") == response_id
-                        ):
-                            msg.metadata.update(metadata)
-                            break
-
-                # Collect token counts for status bar
-                tokens_in = metadata.get("tokens_in", 0) or 0
-                tokens_out = metadata.get("tokens_out", 0) or 0
-
-                status_info["tokens_in"] = float(tokens_in)
-                status_info["tokens_out"] = float(tokens_out)
-                status_info["cost_str"] = metadata.get("cost_str", "")
-
-        except Exception as e:
-            print(f"❌ LLM Error: {e}", file=sys.stderr)
-            logger.error(f"Error during LLM call: {e}")
-            # Add error message to status_info for copying
-            status_info["response_content"] = f"Error: {str(e)}"
-
-            # Make sure to restore model override even on error
-            if (
-                hasattr(args, "model")
-                and args.model
-                and chat_manager.llm_client
-                and hasattr(chat_manager.llm_client, "set_override")
-            ):
-                if original_model is not None:
-                    chat_manager.llm_client.set_override("model", original_model)
-                else:
-                    chat_manager.llm_client.remove_override("model")
-        finally:
-            status_info["duration"] = time.time() - start_time
-            # Display status bar
-            context_provider.display_status(status_info)
-
+        if args.param:
+            try:
+                param_pairs = _parse_param_pairs(args.param)
+            except ValueError as e:
+                print(f"❌ Error: {e}", file=sys.stderr)
+                status_info["duration"] = time.perf_counter() - start_time
+                self._context_provider.display_status(status_info)
+                return None
+            for key, value in param_pairs:
+                runtime_params[key] = coerce_param_value(value)
+
+        self._run_prompt(
+            chat_manager,
+            manager,
+            prompt,
+            persona=args.persona,
+            model=args.model,
+            stream=args.stream,
+            runtime_params=runtime_params,
+        )
         return None
 
 
+# Same options as %%sqlite_llm, which parses the line; these only provide the --help text
 @magic_arguments()
-@argument("-p", "--persona", type=str, help="Use specific persona for THIS call only.")
-@argument("-m", "--model", type=str, help="Use specific model for THIS call only.")
-@argument("-t", "--temperature", type=float, help="Set temperature for THIS call.")
-@argument("--max-tokens", type=int, dest="max_tokens", help="Set max_tokens for THIS call.")
-@argument("--no-stream", action="store_false", dest="stream", help="Do not stream output.")
-@argument(
-    "--param",
-    nargs=2,
-    metavar=("KEY", "VALUE"),
-    action="append",
-    help="Set any other LLM param ad-hoc (e.g., --param top_p 0.9).",
-)
+@add_arguments(SQLITE_LLM_ARGS)
 @cell_magic("llm")
 def llm_magic(ip, line, cell):
     if not _IPYTHON_AVAILABLE:
         print("❌ IPython not available", file=sys.stderr)
         return
 
-    magics = SQLiteCellMagics(ip)
+    return _get_sqlite_magics(ip).sqlite_llm_magic(line, cell)
+
 
-    return magics.sqlite_llm_magic(line, cell)
+def _get_sqlite_magics(ip) -> SQLiteCellMagics:
+    """Get the shell's SQLiteCellMagics instance, creating it on first use."""
+    magics = ip.user_ns.get("_cellmage_sqlite_magics")
+    if magics is None:
+        magics = SQLiteCellMagics(ip)
+        ip.user_ns["_cellmage_sqlite_magics"] = magics
+    return magics
 
 
 # --- Extension Loading ---
@@ -531,20 +514,19 @@ def load_ipython_extension(ipython):
     try:
         # Create and register the SQLite magic class
         magic_class = SQLiteCellMagics(ipython)
+        ipython.user_ns["_cellmage_sqlite_magics"] = magic_class
         ipython.register_magics(magic_class)
 
-        # Register the standalone llm magic (alias for sqlite_llm)
-        ipython.register_magic_function(llm_magic, magic_kind="cell", magic_name="llm")
+        # Register %%llm as an alias for this instance's %%sqlite_llm
+        ipython.register_magic_function(
+            magic_class.sqlite_llm_magic, magic_kind="cell", magic_name="llm"
+        )
 
-        # Try to load the llm_config line magic from the new magic_commands module
+        # Register the llm_config line magic; ConfigMagics is loaded on its first use
         try:
-            from ..magic_commands.ipython.config_magic import ConfigMagics
-
-            config_magics = ConfigMagics(ipython)
-            ipython.register_magics(config_magics)
-            logger.info("Registered ConfigMagics class with llm_config magic")
+            register_config_magic(ipython)
         except Exception as e:
-            logger.warning(f"Failed to register llm_config line magic: {e}")
+            logger.warning("Failed to register llm_config line magic: %s", e)
             print(f"⚠️ llm_config command not available: {e}", file=sys.stderr)
 
         # Update shell page title if possible
@@ -562,10 +544,9 @@ def load_ipython_extension(ipython):
             register_ambient_handler(magic_class.process_cell_as_prompt)
             logger.info("Registered SQLite ambient mode handler")
         except Exception as e:
-            logger.warning(f"Failed to register ambient mode handler: {e}")
+            logger.warning("Failed to register ambient mode handler: %s", e)
 
-        logger.info("SQLite-backed CellMage extension loaded successfully")
-        print("✅ CellMage loaded with SQLite storage (default)", file=sys.stderr)
+        report_extension_loaded("✅ CellMage loaded with SQLite storage (default)")
 
     except Exception as e:
         logger.exception("Failed to register SQLite magics.")
@@ -579,6 +560,8 @@ def unload_ipython_extension(ipython):
 
     # Disable ambient mode if it's active
     try:
+        from ..ambient_mode import disable_ambient_mode, is_ambient_mode_enabled
+
         if is_ambient_mode_enabled():
             disable_ambient_mode(ipython)
     except Exception:
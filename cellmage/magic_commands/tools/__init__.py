@@ -2,15 +2,40 @@
 Magic command modules for CellMage (tools).
 
 This package contains magic commands for integrations and tools.
+
+The integration modules import their SDKs (jira, atlassian, google-api, ...)
+at module level, so nothing is imported here up front: the magic classes are
+resolved on first attribute access, and register_lazy_tool_magics() registers
+stand-in magics that load an integration the first time it is used.
 """
 
-from .confluence_magic import ConfluenceMagics
-from .gdocs_magic import GoogleDocsMagic
-from .github_magic import GitHubMagics
-from .gitlab_magic import GitLabMagics
-from .image_magic import ImageMagics
-from .jira_magic import JiraMagics
-from .webcontent_magic import WebContentMagics
+import importlib
+import logging
+from typing import Any, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Magic class exported by this package -> module that defines it
+_MAGIC_CLASSES = {
+    "ConfluenceMagics": "confluence_magic",
+    "GoogleDocsMagic": "gdocs_magic",
+    "GitHubMagics": "github_magic",
+    "GitLabMagics": "gitlab_magic",
+    "ImageMagics": "image_magic",
+    "JiraMagics": "jira_magic",
+    "WebContentMagics": "webcontent_magic",
+}
+
+# Integration module -> (magic kind, magic name) of the magics it registers
+_TOOL_MAGICS = {
+    "confluence_magic": (("line", "confluence"),),
+    "gdocs_magic": (("line", "gdocs"),),
+    "github_magic": (("line", "github"),),
+    "gitlab_magic": (("line", "gitlab"),),
+    "image_magic": (("line", "img"),),
+    "jira_magic": (("line", "jira"),),
+    "webcontent_magic": (("line", "webcontent"),),
+}
 
 __all__ = [
     "ConfluenceMagics",
@@ -21,3 +46,54 @@ __all__ = [
     "JiraMagics",
     "WebContentMagics",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    mod_name = _MAGIC_CLASSES.get(name)
+    if mod_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{mod_name}"), name)
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
+
+
+def _make_stand_in(ipython: Any, mod_name: str, kind: str, magic_name: str):
+    def load_integration(*args):
+        module = importlib.import_module(f"{__name__}.{mod_name}")
+        module.load_ipython_extension(ipython)
+        # If the integration could not register itself, its loader has said why
+        if ipython.find_magic(magic_name, kind) is load_integration:
+            return None
+        if kind == "cell":
+            return ipython.run_cell_magic(magic_name, *args)
+        return ipython.run_line_magic(magic_name, *args)
+
+    load_integration.__doc__ = f"Load the {mod_name} integration and run %{magic_name}."
+    return load_integration
+
+
+def register_lazy_tool_magics(ipython: Any) -> Tuple[str, ...]:
+    """
+    Register stand-in magics for the integrations without importing them.
+
+    The first call of a stand-in imports its integration module, runs the
+    module's load_ipython_extension (which registers the real magics in place
+    of the stand-ins) and then runs the command.
+
+    Args:
+        ipython: The IPython shell to register the magics with
+
+    Returns:
+        Names of the integration modules that were registered lazily
+    """
+    for mod_name, magics in _TOOL_MAGICS.items():
+        for kind, magic_name in magics:
+            ipython.register_magic_function(
+                _make_stand_in(ipython, mod_name, kind, magic_name),
+                magic_kind=kind,
+                magic_name=magic_name,
+            )
+    logger.debug(f"Registered lazy integration magics: {', '.join(_TOOL_MAGICS)}")
+    return tuple(_TOOL_MAGICS)
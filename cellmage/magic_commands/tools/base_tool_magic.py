@@ -140,7 +140,7 @@ class BaseMagics(Magics):
             message = Message(
                 role=role,
                 content=content,
-                id=str(uuid.uuid4()),
+                id=uuid.uuid4().hex,
                 cell_id=cell_id,
                 execution_count=exec_count,
                 metadata=metadata,
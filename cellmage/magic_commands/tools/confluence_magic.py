@@ -31,6 +31,8 @@ except ImportError:
         return lambda func: func
 
 
+from cellmage.magic_commands.core import HEAVY_RULE, report_extension_loaded
+
 # Import the base magic class
 from cellmage.magic_commands.tools.base_tool_magic import BaseMagics
 
@@ -124,9 +126,9 @@ class ConfluenceMagics(BaseMagics):
 
     def _handle_page_fetch(self, args, client, manager):
         """Handle fetching a specific Confluence page."""
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         print(f"  📝 Fetching Confluence page: {args.identifier}")
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
 
         try:
             # Fetch the page content with markdown option if specified
@@ -141,10 +143,10 @@ class ConfluenceMagics(BaseMagics):
             # Handle display-only mode
             if args.show:
                 print(content)
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 format_type = "Markdown" if args.markdown else "text"
                 print(f"  ℹ️  Content displayed in {format_type} format (not added to history)")
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 return
 
             # Add to history
@@ -163,9 +165,9 @@ class ConfluenceMagics(BaseMagics):
 
     def _handle_cql_search(self, args, client, manager):
         """Handle searching Confluence with CQL."""
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         print(f"  🔍 Searching Confluence with CQL: {args.cql}")
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
 
         try:
             # Run the search
@@ -202,9 +204,9 @@ class ConfluenceMagics(BaseMagics):
             # Handle display-only mode
             if args.show:
                 print(content)
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 print("  ℹ️  Search results displayed only (not added to history)")
-                print("══════════════════════════════════════════════════════════")
+                print(HEAVY_RULE)
                 return
 
             # Add to history
@@ -363,8 +365,9 @@ def load_ipython_extension(ipython):
         # Create and register the magics class
         confluence_magics = ConfluenceMagics(ipython)
         ipython.register_magics(confluence_magics)
-        print("✅ Confluence Magics loaded. Use %confluence <space:page> to fetch pages.")
-        logger.info("Confluence magics loaded successfully.")
+        report_extension_loaded(
+            "✅ Confluence Magics loaded. Use %confluence <space:page> to fetch pages."
+        )
     except Exception as e:
         logger.exception(f"Failed to load Confluence magics: {e}")
         print(f"❌ Failed to initialize Confluence magics: {e}", file=sys.stderr)
@@ -34,6 +34,7 @@ except ImportError:
 
 from cellmage.config import settings
 from cellmage.integrations.gdocs_utils import _GDOCS_AVAILABLE, GoogleDocsUtils
+from cellmage.magic_commands.core import HEAVY_RULE
 from cellmage.magic_commands.tools.base_tool_magic import BaseMagics
 
 # Create a logger
@@ -64,11 +65,11 @@ class GoogleDocsMagic(BaseMagics):
         # Check if required libraries are available
         if not _GDOCS_AVAILABLE:
             logger.warning("Required libraries for Google Docs integration not available.")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("❌ Required Google Docs libraries not available")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("• Install with: pip install cellmage[gdocs]")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
         else:
             logger.info("GoogleDocsMagic initialized.")
 
@@ -452,20 +453,20 @@ class GoogleDocsMagic(BaseMagics):
 def load_ipython_extension(ipython):
     """Register the Google Docs magics with the IPython runtime."""
     if not _IPYTHON_AVAILABLE:
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         print("❌ IPython not available")
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         print("• Cannot load Google Docs magics")
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         return
 
     if not _GDOCS_AVAILABLE:
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         print("❌ Google Docs API libraries not found")
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         print("• Install with: pip install cellmage[gdocs]")
         print("• Google Docs magics will not be available")
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         return
 
     try:
@@ -33,6 +33,7 @@ except ImportError:
 
 
 from cellmage.integrations.github_utils import GitHubUtils
+from cellmage.magic_commands.core import report_extension_loaded
 
 # Import the base magic class
 from cellmage.magic_commands.tools.base_tool_magic import BaseMagics
@@ -432,7 +433,9 @@ def load_ipython_extension(ipython):
         # Create and register the magic class
         magic_class = GitHubMagics(ipython)
         ipython.register_magics(magic_class)
-        print("✅ GitHub Magics loaded. Use %github username/repo to fetch repositories.")
+        report_extension_loaded(
+            "✅ GitHub Magics loaded. Use %github username/repo to fetch repositories."
+        )
     except Exception as e:
         logger.exception("Failed to register GitHub magics.")
         print(f"❌ Failed to load GitHub Magics: {e}", file=sys.stderr)
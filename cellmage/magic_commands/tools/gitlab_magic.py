@@ -33,6 +33,7 @@ except ImportError:
 
 
 from cellmage.integrations.gitlab_utils import GitLabUtils
+from cellmage.magic_commands.core import report_extension_loaded
 
 # Import the base magic class
 from cellmage.magic_commands.tools.base_tool_magic import BaseMagics
@@ -442,7 +443,9 @@ def load_ipython_extension(ipython):
         # Create and register the magic class
         magic_class = GitLabMagics(ipython)
         ipython.register_magics(magic_class)
-        print("✅ GitLab Magics loaded. Use %gitlab namespace/project to fetch repositories.")
+        report_extension_loaded(
+            "✅ GitLab Magics loaded. Use %gitlab namespace/project to fetch repositories."
+        )
     except Exception as e:
         logger.exception("Failed to register GitLab magics.")
         print(f"❌ Failed to load GitLab Magics: {e}", file=sys.stderr)
@@ -31,6 +31,8 @@ except ImportError:
         return lambda func: func
 
 
+from cellmage.magic_commands.core import report_extension_loaded
+
 # Import the base magic class
 from cellmage.magic_commands.tools.base_tool_magic import BaseMagics
 
@@ -437,7 +439,7 @@ def load_ipython_extension(ipython):
     try:
         magic_class = JiraMagics(ipython)
         ipython.register_magics(magic_class)
-        print("✅ Jira Magics loaded. Use %jira <ticket-key> to fetch tickets.")
+        report_extension_loaded("✅ Jira Magics loaded. Use %jira <ticket-key> to fetch tickets.")
     except Exception as e:
         logger.exception("Failed to register Jira magics.")
         print(f"❌ Failed to load Jira Magics: {e}", file=sys.stderr)
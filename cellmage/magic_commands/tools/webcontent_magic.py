@@ -32,6 +32,8 @@ except ImportError:
         return lambda func: func
 
 
+from cellmage.magic_commands.core import HEAVY_RULE
+
 # Import the base magic class
 from cellmage.magic_commands.tools.base_tool_magic import BaseMagics
 
@@ -70,11 +72,11 @@ class WebContentMagics(BaseMagics):
         # Check if the required libraries are available
         if not _WEBSITE_PARSING_AVAILABLE:
             logger.warning("Required libraries for website content fetching not available.")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("❌ Required libraries not available")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
             print("• Install with: pip install requests beautifulsoup4 markdownify trafilatura")
-            print("══════════════════════════════════════════════════════════")
+            print(HEAVY_RULE)
         else:
             logger.info("WebContentMagics initialized.")
 
@@ -245,20 +247,20 @@ class WebContentMagics(BaseMagics):
 def load_ipython_extension(ipython):
     """Register the WebContent magics with the IPython runtime."""
     if not _IPYTHON_AVAILABLE:
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         print("❌ IPython not available")
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         print("• Cannot load WebContent magics")
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         return
 
     if not _WEBSITE_PARSING_AVAILABLE:
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         print("❌ Website parsing libraries not found")
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         print("• Install with: pip install requests beautifulsoup4 markdownify trafilatura")
         print("• WebContent magics will not be available")
-        print("══════════════════════════════════════════════════════════")
+        print(HEAVY_RULE)
         return
 
     try:
@@ -10,7 +10,7 @@ class Message(BaseModel):
 
     role: str
     content: str
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     created_at: datetime = Field(default_factory=datetime.now)
     execution_count: Optional[int] = None  # Environment-specific metadata
     cell_id: Optional[str] = None  # Environment-specific metadata
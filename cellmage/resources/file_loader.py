@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     import yaml
@@ -29,6 +29,8 @@ class FileLoader(PersonaLoader, SnippetProvider):
         self.personas_dir = personas_dir or "llm_personas"  # Ensure non-empty value
         self.snippets_dir = snippets_dir or "llm_snippets"  # Ensure non-empty value
         self.logger = logging.getLogger(__name__)
+        # Directory listings, keyed by directory, with the directory's mtime when listed
+        self._listing_cache: Dict[str, Tuple[int, List[str]]] = {}
 
         # Ensure directories exist
         for directory in [self.personas_dir, self.snippets_dir]:
@@ -56,16 +58,37 @@ class FileLoader(PersonaLoader, SnippetProvider):
                 )
                 return []
 
-            personas = []
-            for filename in os.listdir(self.personas_dir):
-                if filename.lower().endswith(".md"):
-                    name = os.path.splitext(filename)[0]
-                    personas.append(name)
-            return sorted(personas)
+            return self._list_markdown_names(self.personas_dir)
         except Exception as e:
             self.logger.error(f"Error listing personas: {e}")
             return []
 
+    def _list_markdown_names(self, directory: str) -> List[str]:
+        """
+        List the names of the markdown files in a directory, without extension.
+
+        Adding, removing or renaming a file updates the directory's mtime, so the
+        listing is only read again after such a change.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Sorted file names (without .md extension)
+        """
+        mtime = os.stat(directory).st_mtime_ns
+        cached = self._listing_cache.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+
+        names = sorted(
+            os.path.splitext(filename)[0]
+            for filename in os.listdir(directory)
+            if filename.lower().endswith(".md")
+        )
+        self._listing_cache[directory] = (mtime, names)
+        return list(names)
+
     def get_persona(self, name: str) -> Optional[PersonaConfig]:
         """
         Load a persona configuration from a markdown file.
@@ -233,12 +256,7 @@ model: gpt-4.1-nano
                 )
                 return []
 
-            snippets = []
-            for filename in os.listdir(self.snippets_dir):
-                if filename.lower().endswith(".md"):
-                    name = os.path.splitext(filename)[0]
-                    snippets.append(name)
-            return sorted(snippets)
+            return self._list_markdown_names(self.snippets_dir)
         except Exception as e:
             self.logger.error(f"Error listing snippets: {e}")
             return []
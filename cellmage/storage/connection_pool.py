@@ -0,0 +1,154 @@
+"""
+Connection pool for the SQLite storage backend.
+
+SQLite allows a single writer but, in WAL mode, any number of readers that do
+not block it. The pool keeps one long-lived read-write connection, serialized
+by a lock, plus a few read-only connections for queries, so the database file
+(and its -wal/-shm companions) is opened once instead of on every operation.
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteConnectionPool:
+    """One read-write connection plus a bounded pool of read-only connections."""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        configure: Optional[Callable[[sqlite3.Connection, bool], Any]] = None,
+        max_readers: int = 4,
+    ):
+        """
+        Initialize the pool. Connections are opened lazily.
+
+        Args:
+            db_path: Path to the SQLite database file
+            configure: Called with (connection, readonly) after a connection is opened
+            max_readers: Maximum number of idle read-only connections kept open
+        """
+        self.db_path = Path(db_path)
+        self._configure = configure
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.Lock()
+        # Thread currently holding the read-write connection
+        self._writer_owner: Optional[int] = None
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=max_readers)
+
+    def _open(self, readonly: bool) -> sqlite3.Connection:
+        if readonly:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        if self._configure:
+            self._configure(conn, readonly)
+        return conn
+
+    def acquire_writer(self) -> sqlite3.Connection:
+        """
+        Take the read-write connection. Must be handed back with release().
+
+        Returns:
+            The shared read-write connection, locked for the caller
+
+        Raises:
+            RuntimeError: If the calling thread already holds the read-write connection
+        """
+        if self._writer_owner == threading.get_ident():
+            # The lock is not reentrant: waiting for it here would never return
+            raise RuntimeError("The SQLite read-write connection is already held by this thread")
+
+        self._writer_lock.acquire()
+        try:
+            if self._writer is None:
+                self._writer = self._open(readonly=False)
+        except BaseException:
+            self._writer_lock.release()
+            raise
+        self._writer_owner = threading.get_ident()
+        return self._writer
+
+    def acquire_reader(self) -> sqlite3.Connection:
+        """
+        Take a read-only connection. Must be handed back with release().
+
+        Falls back to the read-write connection if the database cannot be opened
+        read-only (e.g. it does not exist yet).
+
+        Returns:
+            A connection that may only be used for queries
+
+        Raises:
+            RuntimeError: If the fallback is needed while the calling thread holds
+                the read-write connection
+        """
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        try:
+            return self._open(readonly=True)
+        except sqlite3.Error as e:
+            logger.debug(f"Read-only connection unavailable, using the writer: {e}")
+            return self.acquire_writer()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """
+        Return a connection taken with acquire_writer() or acquire_reader().
+
+        Any transaction left open is rolled back, and the row factory is reset
+        so the next user gets plain tuples.
+
+        Args:
+            conn: The connection to return
+        """
+        is_writer = conn is self._writer
+        reusable = True
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = None
+        except sqlite3.Error as e:
+            logger.warning(f"Discarding broken SQLite connection: {e}")
+            conn.close()
+            reusable = False
+
+        if is_writer:
+            if not reusable:
+                self._writer = None
+            self._writer_owner = None
+            self._writer_lock.release()
+            return
+
+        if reusable:
+            try:
+                self._readers.put_nowait(conn)
+                return
+            except queue.Full:
+                pass
+        conn.close()
+
+    def close(self) -> None:
+        """Close every connection held by the pool."""
+        readers: List[sqlite3.Connection] = []
+        while True:
+            try:
+                readers.append(self._readers.get_nowait())
+            except queue.Empty:
+                break
+        for conn in readers:
+            conn.close()
+
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
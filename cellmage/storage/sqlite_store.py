@@ -8,6 +8,7 @@ for persisting conversations in a SQLite database.
 import json
 import logging
 import sqlite3
+import sys
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -17,6 +18,89 @@ from ..config import settings
 from ..exceptions import PersistenceError
 from ..interfaces import HistoryStore
 from ..models import ConversationMetadata, Message
+from .connection_pool import SQLiteConnectionPool
+
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+# Connection settings applied on every open. WAL lets readers run alongside the
+# writer and, with synchronous=NORMAL, turns each commit into a single append to
+# the log instead of two fsyncs of the main database file.
+_WRITER_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA recursive_triggers=ON;
+"""
+_CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+PRAGMA busy_timeout=5000;
+"""
+
+
+def _configure_pragmas(conn: sqlite3.Connection, readonly: bool = False) -> sqlite3.Connection:
+    """
+    Apply the performance PRAGMAs to a freshly opened connection.
+
+    Args:
+        conn: Connection to configure
+        readonly: Whether the connection was opened read-only; the journal mode is
+            stored in the database file, so only the writer sets it
+
+    Returns:
+        The same connection, for chaining
+    """
+    conn.executescript(_CONNECTION_PRAGMAS if readonly else _WRITER_PRAGMAS + _CONNECTION_PRAGMAS)
+    return conn
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize a value to compact JSON for storage.
+
+    Uses orjson when it is installed, otherwise the standard library with no
+    whitespace between items; smaller rows mean fewer pages written per commit.
+
+    Args:
+        obj: JSON-serializable value (usually a metadata dict)
+
+    Returns:
+        The JSON text
+    """
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # e.g. integers wider than 64 bits; let the standard library handle them
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _loads(text: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text read back from the database.
+
+    Uses orjson when it is installed, otherwise the standard library. Values
+    orjson rejects (e.g. NaN written by the standard library) are parsed by the
+    standard library instead.
+
+    Args:
+        text: JSON text, as stored by _dumps()
+
+    Returns:
+        The parsed value
+    """
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
 
 
 class SQLiteStore(HistoryStore):
@@ -41,13 +125,22 @@ class SQLiteStore(HistoryStore):
         else:
             self.db_path = Path(settings.sqlite_path_resolved)
         self.logger.info(f"Initializing SQLiteStore with database at: {self.db_path}")
+        # Writes go through one shared connection; queries use read-only ones
+        self._pool = SQLiteConnectionPool(self.db_path, configure=_configure_pragmas)
+        self._fts_enabled = False
+        # get_statistics() result, paired with the data_version it was computed at
+        self._stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None
         self._initialize_db()
 
+    def close(self) -> None:
+        """Close all database connections held by this store."""
+        self._pool.close()
+
     def _initialize_db(self) -> None:
         """Initialize the database schema if it doesn't exist."""
         conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._pool.acquire_writer()
             cursor = conn.cursor()
 
             # Create conversations table
@@ -172,6 +265,15 @@ class SQLiteStore(HistoryStore):
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_raw_responses_conversation_id ON raw_api_responses (conversation_id)"
             )
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_messages_cell_id ON messages (cell_id)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_messages_conversation_position ON messages (conversation_id, position)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_conversations_timestamp ON conversations (timestamp DESC)"
+            )
+
+            self._fts_enabled = self._create_search_index(cursor)
 
             conn.commit()
             self.logger.info("SQLite database initialized successfully")
@@ -180,7 +282,58 @@ class SQLiteStore(HistoryStore):
             raise PersistenceError(f"Failed to initialize SQLite database: {e}")
         finally:
             if conn:
-                conn.close()
+                self._pool.release(conn)
+
+    def _create_search_index(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the FTS5 index over message contents, kept in sync by triggers.
+
+        Args:
+            cursor: Cursor on the writer connection
+
+        Returns:
+            True if full-text search is available, False if SQLite lacks FTS5
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'messages_fts'")
+        exists = cursor.fetchone() is not None
+        try:
+            cursor.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts
+                USING fts5(content, content='messages', content_rowid='rowid')
+                """
+            )
+        except sqlite3.OperationalError as e:
+            self.logger.info(f"SQLite FTS5 not available, search will use LIKE: {e}")
+            return False
+
+        # INSERT OR REPLACE fires the delete trigger only because the writer enables
+        # recursive_triggers; without it the index would keep replaced rows. The
+        # update trigger is recreated so databases created before it had its WHEN
+        # clause don't re-index rows whose content did not change.
+        cursor.executescript(
+            """
+            DROP TRIGGER IF EXISTS messages_fts_update;
+            CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+                INSERT INTO messages_fts (rowid, content) VALUES (new.rowid, new.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+                INSERT INTO messages_fts (messages_fts, rowid, content)
+                VALUES ('delete', old.rowid, old.content);
+            END;
+            CREATE TRIGGER messages_fts_update AFTER UPDATE OF content ON messages
+            WHEN old.content IS NOT new.content BEGIN
+                INSERT INTO messages_fts (messages_fts, rowid, content)
+                VALUES ('delete', old.rowid, old.content);
+                INSERT INTO messages_fts (rowid, content) VALUES (new.rowid, new.content);
+            END;
+            """
+        )
+
+        if not exists:
+            # Index messages stored before the FTS table was introduced
+            cursor.execute("INSERT INTO messages_fts (messages_fts) VALUES ('rebuild')")
+        return True
 
     def save_conversation(
         self,
@@ -201,7 +354,7 @@ class SQLiteStore(HistoryStore):
         """
         conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._pool.acquire_writer()
             cursor = conn.cursor()
 
             # Generate a conversation ID if not provided
@@ -216,7 +369,7 @@ class SQLiteStore(HistoryStore):
                 if field in metadata_dict:
                     metadata_dict.pop(field, None)
 
-            metadata_json = json.dumps(metadata_dict)
+            metadata_json = _dumps(metadata_dict)
 
             # Insert conversation - using ISO8601 datetime
             timestamp = datetime.now().isoformat()
@@ -255,9 +408,11 @@ class SQLiteStore(HistoryStore):
                     (conversation_id, *current_message_ids),
                 )
 
-            # Insert messages, using INSERT OR REPLACE to handle duplicates
+            # Build all rows first, then insert them with one executemany per table
+            message_rows = []
+            debug_log_rows = []
             for position, msg in enumerate(messages):
-                msg_id = msg.id or str(uuid.uuid4())
+                msg_id = msg.id or uuid.uuid4().hex
                 tokens = (
                     msg.metadata.get("tokens_in", 0)
                     if msg.role == "user"
@@ -266,14 +421,9 @@ class SQLiteStore(HistoryStore):
 
                 # Convert message metadata to JSON
                 msg_metadata = msg.metadata or {}
-                msg_metadata_json = json.dumps(msg_metadata)
+                msg_metadata_json = _dumps(msg_metadata)
 
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO messages
-                    (id, conversation_id, role, content, timestamp, tokens, execution_count, cell_id, position, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+                message_rows.append(
                     (
                         msg_id,
                         conversation_id,
@@ -285,27 +435,21 @@ class SQLiteStore(HistoryStore):
                         msg.cell_id,
                         position,
                         msg_metadata_json,
-                    ),
+                    )
                 )
 
                 # Only add debug log entry for new messages
                 if msg_id not in existing_message_ids:
-                    log_id = str(uuid.uuid4())
-                    cursor.execute(
-                        """
-                        INSERT INTO debug_logs
-                        (id, conversation_id, message_id, timestamp, log_level, component, event, details)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
+                    debug_log_rows.append(
                         (
-                            log_id,
+                            uuid.uuid4().hex,
                             conversation_id,
                             msg_id,
                             timestamp,  # Using same timestamp as conversation
                             "INFO",
                             "SQLiteStore",
                             "message_saved",
-                            json.dumps(
+                            _dumps(
                                 {
                                     "role": msg.role,
                                     "content_length": len(msg.content),
@@ -313,10 +457,49 @@ class SQLiteStore(HistoryStore):
                                     "position": position,
                                 }
                             ),
-                        ),
+                        )
                     )
 
+            # Upsert messages. Rows that are already stored unchanged are left alone,
+            # so saving after each cell only writes (and re-indexes) what changed
+            cursor.executemany(
+                """
+                INSERT INTO messages
+                (id, conversation_id, role, content, timestamp, tokens, execution_count, cell_id, position, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    conversation_id = excluded.conversation_id,
+                    role = excluded.role,
+                    content = excluded.content,
+                    timestamp = excluded.timestamp,
+                    tokens = excluded.tokens,
+                    execution_count = excluded.execution_count,
+                    cell_id = excluded.cell_id,
+                    position = excluded.position,
+                    metadata = excluded.metadata
+                WHERE content IS NOT excluded.content
+                   OR conversation_id IS NOT excluded.conversation_id
+                   OR role IS NOT excluded.role
+                   OR tokens IS NOT excluded.tokens
+                   OR execution_count IS NOT excluded.execution_count
+                   OR cell_id IS NOT excluded.cell_id
+                   OR position IS NOT excluded.position
+                   OR metadata IS NOT excluded.metadata
+                """,
+                message_rows,
+            )
+            if debug_log_rows:
+                cursor.executemany(
+                    """
+                    INSERT INTO debug_logs
+                    (id, conversation_id, message_id, timestamp, log_level, component, event, details)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    debug_log_rows,
+                )
+
             conn.commit()
+            self._stats_cache = None
 
             # Return a URI that can be used to refer to this conversation
             uri = f"sqlite://{conversation_id}"
@@ -330,7 +513,7 @@ class SQLiteStore(HistoryStore):
             raise PersistenceError(f"Failed to save conversation to SQLite: {e}")
         finally:
             if conn:
-                conn.close()
+                self._pool.release(conn)
 
     def load_conversation(self, filepath: str) -> Tuple[List[Message], ConversationMetadata]:
         """
@@ -349,7 +532,7 @@ class SQLiteStore(HistoryStore):
             if filepath.startswith("sqlite://"):
                 conversation_id = filepath[len("sqlite://") :]
 
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._pool.acquire_writer()
             conn.row_factory = sqlite3.Row  # Access results by column name
             cursor = conn.cursor()
 
@@ -374,7 +557,7 @@ class SQLiteStore(HistoryStore):
                 )
 
             # Load additional metadata from JSON
-            metadata_dict = json.loads(conversation["metadata"]) if conversation["metadata"] else {}
+            metadata_dict = _loads(conversation["metadata"]) if conversation["metadata"] else {}
 
             # Ensure saved_at is always a datetime
             saved_at_val = conversation["saved_at"]
@@ -409,14 +592,16 @@ class SQLiteStore(HistoryStore):
             messages = []
             for row in cursor.fetchall():
                 # Parse message metadata
-                msg_metadata = json.loads(row["metadata"]) if row["metadata"] else {}
+                msg_metadata = _loads(row["metadata"]) if row["metadata"] else {}
 
                 # Create message object with preserved message ID from the database
                 # This is critical to ensure that when this message is saved again,
                 # it will update the existing record rather than create a duplicate
                 message = Message(
                     id=row["id"],  # Preserve original ID from database
-                    role=row["role"],
+                    # Interned like the role literals used in code, so role checks and
+                    # lookups keyed by role match on identity
+                    role=sys.intern(row["role"]),
                     content=row["content"],
                     execution_count=row["execution_count"],
                     cell_id=row["cell_id"],
@@ -426,7 +611,7 @@ class SQLiteStore(HistoryStore):
                 messages.append(message)
 
             # Log debug information
-            log_id = str(uuid.uuid4())
+            log_id = uuid.uuid4().hex
             cursor.execute(
                 """
                 INSERT INTO debug_logs
@@ -440,7 +625,7 @@ class SQLiteStore(HistoryStore):
                     "INFO",
                     "SQLiteStore",
                     "conversation_loaded",
-                    json.dumps({"message_count": len(messages)}),
+                    _dumps({"message_count": len(messages)}),
                 ),
             )
 
@@ -454,7 +639,7 @@ class SQLiteStore(HistoryStore):
             raise PersistenceError(f"Failed to load conversation from SQLite: {e}")
         finally:
             if conn:
-                conn.close()
+                self._pool.release(conn)
 
     def list_saved_conversations(self) -> List[Dict[str, Any]]:
         """
@@ -465,7 +650,7 @@ class SQLiteStore(HistoryStore):
         """
         conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._pool.acquire_reader()
             conn.row_factory = sqlite3.Row  # Access results by column name
             cursor = conn.cursor()
 
@@ -498,7 +683,7 @@ class SQLiteStore(HistoryStore):
 
                 # Parse any additional metadata
                 if conv["metadata"]:
-                    additional_metadata = json.loads(conv["metadata"])
+                    additional_metadata = _loads(conv["metadata"])
                     conv.update(additional_metadata)
 
                 conversations.append(conv)
@@ -511,7 +696,7 @@ class SQLiteStore(HistoryStore):
             return []
         finally:
             if conn:
-                conn.close()
+                self._pool.release(conn)
 
     def delete_conversation(self, conversation_id: str) -> bool:
         """
@@ -529,7 +714,7 @@ class SQLiteStore(HistoryStore):
             if conversation_id.startswith("sqlite://"):
                 conversation_id = conversation_id[len("sqlite://") :]
 
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._pool.acquire_writer()
             cursor = conn.cursor()
 
             # Delete messages first (due to foreign key constraint)
@@ -546,6 +731,7 @@ class SQLiteStore(HistoryStore):
 
             row_count = cursor.rowcount
             conn.commit()
+            self._stats_cache = None
 
             success = row_count > 0
             if success:
@@ -562,7 +748,7 @@ class SQLiteStore(HistoryStore):
             return False
         finally:
             if conn:
-                conn.close()
+                self._pool.release(conn)
 
     def add_tag(self, conversation_id: str, tag: str) -> bool:
         """
@@ -581,7 +767,7 @@ class SQLiteStore(HistoryStore):
             if conversation_id.startswith("sqlite://"):
                 conversation_id = conversation_id[len("sqlite://") :]
 
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._pool.acquire_writer()
             cursor = conn.cursor()
 
             # Add tag (the UNIQUE constraint will prevent duplicates)
@@ -601,7 +787,7 @@ class SQLiteStore(HistoryStore):
             return False
         finally:
             if conn:
-                conn.close()
+                self._pool.release(conn)
 
     def remove_tag(self, conversation_id: str, tag: str) -> bool:
         """
@@ -620,7 +806,7 @@ class SQLiteStore(HistoryStore):
             if conversation_id.startswith("sqlite://"):
                 conversation_id = conversation_id[len("sqlite://") :]
 
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._pool.acquire_writer()
             cursor = conn.cursor()
 
             # Remove tag
@@ -639,12 +825,17 @@ class SQLiteStore(HistoryStore):
             return False
         finally:
             if conn:
-                conn.close()
+                self._pool.release(conn)
 
     def search_conversations(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Search for conversations by content.
 
+        With FTS5 available, message contents are matched as whole words, the
+        last one as a prefix ("data" finds "database"). If no message matches
+        that way, contents are searched as substrings ("base" finds "database").
+        Conversation and persona names are always matched as substrings.
+
         Args:
             query: Search query string
             limit: Maximum number of results to return
@@ -654,29 +845,45 @@ class SQLiteStore(HistoryStore):
         """
         conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._pool.acquire_reader()
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
-            # SQLite FTS would be better but for simplicity we'll use LIKE
+            # Substring match, unless full-text search finds the query in a message
+            content_filter = "m.content LIKE ?"
+            content_arg = f"%{query}%"
+            if self._fts_enabled:
+                # Quote the query as an FTS5 phrase (so its syntax characters are
+                # literal) and match it as a prefix of the last word
+                fts_arg = '"' + query.replace('"', '""') + '"*'
+                cursor.execute(
+                    "SELECT 1 FROM messages_fts WHERE messages_fts MATCH ? LIMIT 1", (fts_arg,)
+                )
+                if cursor.fetchone() is not None:
+                    content_filter = (
+                        "m.rowid IN (SELECT rowid FROM messages_fts WHERE messages_fts MATCH ?)"
+                    )
+                    content_arg = fts_arg
+
             cursor.execute(
-                """
+                f"""
                 SELECT DISTINCT c.*,
                        COUNT(DISTINCT m.id) as message_count
                 FROM conversations c
                 JOIN messages m ON c.id = m.conversation_id
-                WHERE m.content LIKE ?
+                WHERE {content_filter}
                    OR c.name LIKE ?
                    OR c.persona_name LIKE ?
                 GROUP BY c.id
                 ORDER BY c.timestamp DESC
                 LIMIT ?
                 """,
-                (f"%{query}%", f"%{query}%", f"%{query}%", limit),
+                (content_arg, f"%{query}%", f"%{query}%", limit),
             )
+            rows = cursor.fetchall()
 
             conversations = []
-            for row in cursor.fetchall():
+            for row in rows:
                 # Convert SQLite row to dictionary
                 conv = dict(row)
 
@@ -689,7 +896,7 @@ class SQLiteStore(HistoryStore):
 
                 # Parse any additional metadata
                 if conv["metadata"]:
-                    additional_metadata = json.loads(conv["metadata"])
+                    additional_metadata = _loads(conv["metadata"])
                     conv.update(additional_metadata)
 
                 conversations.append(conv)
@@ -702,37 +909,78 @@ class SQLiteStore(HistoryStore):
             return []
         finally:
             if conn:
-                conn.close()
+                self._pool.release(conn)
+
+    def _data_version(self) -> int:
+        """
+        Get the writer connection's PRAGMA data_version.
+
+        The value changes whenever another connection (including one in another
+        process) commits to the database. Commits made through this store are
+        tracked by clearing the statistics cache directly.
+        """
+        conn = self._pool.acquire_writer()
+        try:
+            return conn.execute("PRAGMA data_version").fetchone()[0]
+        finally:
+            self._pool.release(conn)
 
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about stored conversations.
 
+        The aggregates scan every message, so the result is cached until the
+        conversations or messages change.
+
         Returns:
             Dictionary with statistics
         """
         conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            data_version = self._data_version()
+            if self._stats_cache is not None and self._stats_cache[0] == data_version:
+                return dict(self._stats_cache[1])
+
+            conn = self._pool.acquire_reader()
             cursor = conn.cursor()
 
             stats = {}
 
-            # Count conversations
-            cursor.execute("SELECT COUNT(*) FROM conversations")
-            stats["total_conversations"] = cursor.fetchone()[0]
-
-            # Count messages
-            cursor.execute("SELECT COUNT(*) FROM messages")
-            stats["total_messages"] = cursor.fetchone()[0]
-
-            # Count by role
-            cursor.execute("SELECT role, COUNT(*) FROM messages GROUP BY role")
-            stats["messages_by_role"] = {role: count for role, count in cursor.fetchall()}
+            # Conversation count and most used model in one query; the LEFT JOIN
+            # keeps the count row when no conversation has a model
+            cursor.execute(
+                """
+                SELECT (SELECT COUNT(*) FROM conversations), top.model_name, top.count
+                FROM (SELECT 1)
+                LEFT JOIN (
+                    SELECT model_name, COUNT(*) as count
+                    FROM conversations
+                    WHERE model_name IS NOT NULL
+                    GROUP BY model_name
+                    ORDER BY count DESC
+                    LIMIT 1
+                ) AS top
+                """
+            )
+            total_conversations, top_model, top_model_count = cursor.fetchone()
+            stats["total_conversations"] = total_conversations
 
-            # Sum tokens
-            cursor.execute("SELECT SUM(tokens) FROM messages")
-            stats["total_tokens"] = cursor.fetchone()[0] or 0
+            # Message counts and token totals in a single pass over messages
+            cursor.execute(
+                """
+                SELECT role,
+                       COUNT(*),
+                       SUM(tokens),
+                       SUM(CASE WHEN tokens > 0 THEN tokens END),
+                       COUNT(CASE WHEN tokens > 0 THEN 1 END)
+                FROM messages
+                GROUP BY role
+                """
+            )
+            role_rows = cursor.fetchall()
+            stats["total_messages"] = sum(row[1] for row in role_rows)
+            stats["messages_by_role"] = {row[0]: row[1] for row in role_rows}
+            stats["total_tokens"] = sum(row[2] or 0 for row in role_rows)
 
             # Most active day
             cursor.execute(
@@ -748,37 +996,25 @@ class SQLiteStore(HistoryStore):
             if result:
                 stats["most_active_day"] = {"date": result[0], "message_count": result[1]}
 
-            # Most used model
-            cursor.execute(
-                """
-                SELECT model_name, COUNT(*) as count
-                FROM conversations
-                WHERE model_name IS NOT NULL
-                GROUP BY model_name
-                ORDER BY count DESC
-                LIMIT 1
-                """
-            )
-            result = cursor.fetchone()
-            if result and result[0]:
-                stats["most_used_model"] = {"model": result[0], "count": result[1]}
+            if top_model:
+                stats["most_used_model"] = {"model": top_model, "count": top_model_count}
 
-            # Average tokens per message
-            cursor.execute(
-                """
-                SELECT AVG(tokens) FROM messages WHERE tokens > 0
-                """
+            # Average tokens per message, over messages with a token count
+            counted_messages = sum(row[4] for row in role_rows)
+            counted_tokens = sum(row[3] or 0 for row in role_rows)
+            stats["avg_tokens_per_message"] = (
+                counted_tokens / counted_messages if counted_messages else 0
             )
-            stats["avg_tokens_per_message"] = cursor.fetchone()[0] or 0
 
-            return stats
+            self._stats_cache = (data_version, stats)
+            return dict(stats)
 
         except Exception as e:
             self.logger.error(f"Error getting statistics: {e}")
             return {"error": str(e)}
         finally:
             if conn:
-                conn.close()
+                self._pool.release(conn)
 
     def log_debug(
         self, conversation_id: str, component: str, event: str, details: Dict[str, Any]
@@ -798,12 +1034,12 @@ class SQLiteStore(HistoryStore):
             if conversation_id and conversation_id.startswith("sqlite://"):
                 conversation_id = conversation_id[len("sqlite://") :]
 
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._pool.acquire_writer()
             cursor = conn.cursor()
 
-            log_id = str(uuid.uuid4())
+            log_id = uuid.uuid4().hex
             timestamp = datetime.now().isoformat()
-            details_json = json.dumps(details)
+            details_json = _dumps(details)
 
             cursor.execute(
                 """
@@ -820,7 +1056,7 @@ class SQLiteStore(HistoryStore):
             self.logger.error(f"Error logging debug information: {e}")
         finally:
             if conn:
-                conn.close()
+                self._pool.release(conn)
 
     def store_raw_api_response(
         self,
@@ -853,16 +1089,16 @@ class SQLiteStore(HistoryStore):
             if conversation_id and conversation_id.startswith("sqlite://"):
                 conversation_id = conversation_id[len("sqlite://") :]
 
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._pool.acquire_writer()
             cursor = conn.cursor()
 
             # Generate a unique ID
-            response_id = str(uuid.uuid4())
+            response_id = uuid.uuid4().hex
             timestamp = datetime.now().isoformat()
 
             # Convert dictionaries to JSON
-            request_json = json.dumps(request_data)
-            response_json = json.dumps(response_data)
+            request_json = _dumps(request_data)
+            response_json = _dumps(response_data)
 
             cursor.execute(
                 """
@@ -895,7 +1131,7 @@ class SQLiteStore(HistoryStore):
             return None
         finally:
             if conn:
-                conn.close()
+                self._pool.release(conn)
 
     def get_raw_api_responses(
         self, message_id: Optional[str] = None, conversation_id: Optional[str] = None
@@ -916,7 +1152,7 @@ class SQLiteStore(HistoryStore):
             if conversation_id and conversation_id.startswith("sqlite://"):
                 conversation_id = conversation_id[len("sqlite://") :]
 
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._pool.acquire_reader()
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -943,10 +1179,10 @@ class SQLiteStore(HistoryStore):
 
                 # Parse JSON data
                 if response["request_data"]:
-                    response["request_data"] = json.loads(response["request_data"])
+                    response["request_data"] = _loads(response["request_data"])
 
                 if response["response_data"]:
-                    response["response_data"] = json.loads(response["response_data"])
+                    response["response_data"] = _loads(response["response_data"])
 
                 responses.append(response)
 
@@ -957,7 +1193,7 @@ class SQLiteStore(HistoryStore):
             return []
         finally:
             if conn:
-                conn.close()
+                self._pool.release(conn)
 
     def get_message_with_raw_response(self, message_id: str) -> Dict[str, Any]:
         """
@@ -971,7 +1207,7 @@ class SQLiteStore(HistoryStore):
         """
         conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._pool.acquire_reader()
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -986,7 +1222,7 @@ class SQLiteStore(HistoryStore):
 
             # Parse message metadata
             if message["metadata"]:
-                message["metadata"] = json.loads(message["metadata"])
+                message["metadata"] = _loads(message["metadata"])
 
             # Get raw API responses for this message
             cursor.execute(
@@ -1000,10 +1236,10 @@ class SQLiteStore(HistoryStore):
 
                 # Parse JSON data
                 if response["request_data"]:
-                    response["request_data"] = json.loads(response["request_data"])
+                    response["request_data"] = _loads(response["request_data"])
 
                 if response["response_data"]:
-                    response["response_data"] = json.loads(response["response_data"])
+                    response["response_data"] = _loads(response["response_data"])
 
                 raw_responses.append(response)
 
@@ -1016,4 +1252,4 @@ class SQLiteStore(HistoryStore):
             return {"error": str(e)}
         finally:
             if conn:
-                conn.close()
+                self._pool.release(conn)
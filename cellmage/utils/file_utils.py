@@ -2,8 +2,6 @@ import datetime
 import os
 from typing import Any, List, Optional
 
-from IPython.display import Markdown, display
-
 
 def display_files_as_table(
     files_list: List[str],
@@ -206,5 +204,7 @@ def display_directory(
         show_lines=show_lines,
     )
 
-    # Display the markdown in Jupyter
+    # Display the markdown in Jupyter (imported here so `import cellmage` doesn't load IPython)
+    from IPython.display import Markdown, display
+
     display(Markdown(markdown_content))
@@ -0,0 +1,90 @@
+"""
+Integration tests for the LLM response cache.
+
+These tests run ChatManager.chat() against a DirectLLMAdapter whose network
+call is mocked, to check which requests are answered from the cache.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from cellmage.adapters.direct_client import DirectLLMAdapter
+from cellmage.chat_manager import ChatManager
+from cellmage.config import Settings
+
+
+class TestResponseCacheIntegration(unittest.TestCase):
+    """Integration tests for the response cache in ChatManager.chat()."""
+
+    def setUp(self):
+        """Set up a chat manager with the response cache enabled."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        self.client = DirectLLMAdapter(
+            api_key="test-key", api_base="http://localhost:1", default_model="test-model"
+        )
+        settings = Settings(
+            response_cache=True,
+            response_cache_dir=os.path.join(self.tmp_dir.name, "responses"),
+            auto_display=False,
+        )
+        self.manager = ChatManager(settings=settings, llm_client=self.client)
+
+    def _ask(self, prompt):
+        return self.manager.chat(prompt, stream=False, add_to_history=False)
+
+    def test_repeated_request_is_served_from_cache(self):
+        """An unchanged request is only sent to the LLM once."""
+        with patch.object(self.client, "chat", return_value="cached answer") as mock_chat:
+            self.assertEqual(self._ask("Hello"), "cached answer")
+            self.assertEqual(self._ask("Hello"), "cached answer")
+
+        self.assertEqual(mock_chat.call_count, 1)
+        self.assertTrue(self.manager.get_last_response_metadata().get("cache_hit"))
+
+    def test_trailing_whitespace_and_blank_lines_hit_cache(self):
+        """A prompt differing only in trailing whitespace and blank lines is served from cache."""
+        with patch.object(self.client, "chat", return_value="cached answer") as mock_chat:
+            self._ask("def f():\n    return 1")
+            self.assertEqual(self._ask("def f():  \n\n    return 1\n"), "cached answer")
+
+        self.assertEqual(mock_chat.call_count, 1)
+
+    def test_changed_indentation_misses_cache(self):
+        """A prompt with different indentation or line breaks is sent to the LLM again."""
+        with patch.object(
+            self.client, "chat", side_effect=["first", "second", "third"]
+        ) as mock_chat:
+            self._ask("if x:\n    a()\n    b()")
+            self.assertEqual(self._ask("if x:\n    a()\nb()"), "second")
+            self.assertEqual(self._ask("if x: a() b()"), "third")
+
+        self.assertEqual(mock_chat.call_count, 3)
+
+    def test_changed_override_misses_cache(self):
+        """Changing an instance override sends the request to the LLM again."""
+        with patch.object(self.client, "chat", side_effect=["first", "second"]) as mock_chat:
+            self.assertEqual(self._ask("Hello"), "first")
+
+            self.client.set_override("temperature", 0.3)
+            self.assertEqual(self._ask("Hello"), "second")
+
+        self.assertEqual(mock_chat.call_count, 2)
+        self.assertFalse(self.manager.get_last_response_metadata().get("cache_hit"))
+
+    def test_changed_api_base_misses_cache(self):
+        """Pointing the client at another API base sends the request to the LLM again."""
+        with patch.object(self.client, "chat", side_effect=["first", "second"]) as mock_chat:
+            self._ask("Hello")
+
+            self.client.set_override("api_base", "http://localhost:2")
+            self.assertEqual(self._ask("Hello"), "second")
+
+        self.assertEqual(mock_chat.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Tests for parsing the --param option of the LLM magics.
+"""
+
+import contextlib
+import io
+import unittest
+from unittest.mock import patch
+
+from cellmage.magic_commands.ipython import common
+from cellmage.magic_commands.ipython.common import _parse_param_pairs
+from cellmage.magic_commands.ipython.magic_args import coerce_param_value
+
+
+class TestCoerceParamValue(unittest.TestCase):
+    """Tests for coerce_param_value()."""
+
+    def test_int(self):
+        """Whole numbers become ints."""
+        for value, expected in [("42", 42), ("-3", -3), ("+7", 7), ("0", 0)]:
+            with self.subTest(value=value):
+                result = coerce_param_value(value)
+                self.assertIsInstance(result, int)
+                self.assertEqual(result, expected)
+
+    def test_float(self):
+        """Decimal numbers become floats."""
+        for value, expected in [("0.7", 0.7), ("-1.5", -1.5), (".5", 0.5), ("2.", 2.0)]:
+            with self.subTest(value=value):
+                result = coerce_param_value(value)
+                self.assertIsInstance(result, float)
+                self.assertEqual(result, expected)
+
+    def test_exponent(self):
+        """Numbers with an exponent become floats."""
+        for value, expected in [("1e3", 1000.0), ("2.5E-2", 0.025), ("-1e+2", -100.0)]:
+            with self.subTest(value=value):
+                result = coerce_param_value(value)
+                self.assertIsInstance(result, float)
+                self.assertEqual(result, expected)
+
+    def test_string(self):
+        """Anything else is kept as a string."""
+        for value in ["gpt-4o", "true", "1.2.3", "1e", "12abc", "", "nan", "inf"]:
+            with self.subTest(value=value):
+                self.assertEqual(coerce_param_value(value), value)
+
+
+class TestParseParamPairs(unittest.TestCase):
+    """Tests for _parse_param_pairs()."""
+
+    def setUp(self):
+        """Start each test as if the deprecation warning had not been shown yet."""
+        patcher = patch.object(common, "_param_deprecation_shown", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _parse(self, param_groups):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            pairs = _parse_param_pairs(param_groups)
+        return pairs, output.getvalue()
+
+    def test_key_value(self):
+        """KEY=VALUE tokens are split at the first '='."""
+        pairs, output = self._parse([["temperature=0.5", "top_p=1"], ["stop=END"]])
+        self.assertEqual(pairs, [("temperature", "0.5"), ("top_p", "1"), ("stop", "END")])
+        self.assertEqual(output, "")
+
+    def test_equals_in_value(self):
+        """An '=' inside the value is kept in the value."""
+        pairs, _ = self._parse([["stop=a=b", "suffix=="]])
+        self.assertEqual(pairs, [("stop", "a=b"), ("suffix", "=")])
+
+    def test_empty_value(self):
+        """KEY= gives an empty value."""
+        pairs, _ = self._parse([["stop="]])
+        self.assertEqual(pairs, [("stop", "")])
+
+    def test_deprecated_key_space_value(self):
+        """The two-token KEY VALUE form still works and prints a deprecation warning."""
+        pairs, output = self._parse([["temperature", "0.5"]])
+        self.assertEqual(pairs, [("temperature", "0.5")])
+        self.assertIn("deprecated", output)
+        self.assertTrue(common._param_deprecation_shown)
+
+    def test_deprecation_warning_shown_once(self):
+        """The deprecation warning is only printed the first time."""
+        _, first = self._parse([["temperature", "0.5"]])
+        pairs, second = self._parse([["top_p", "1"], ["max_tokens", "10"]])
+        self.assertIn("deprecated", first)
+        self.assertEqual(second, "")
+        self.assertEqual(pairs, [("top_p", "1"), ("max_tokens", "10")])
+
+    def test_malformed(self):
+        """Tokens without a key or without '=' raise ValueError."""
+        for param_groups in [[["temperature"]], [["=0.5"]], [["a=1", "b"]], [["a", "b", "c"]]]:
+            with self.subTest(param_groups=param_groups):
+                with self.assertRaises(ValueError):
+                    self._parse(param_groups)
+
+
+if __name__ == "__main__":
+    unittest.main()
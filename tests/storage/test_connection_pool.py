@@ -0,0 +1,189 @@
+"""
+Tests for the SQLite connection pool and its use by SQLiteStore.
+
+These tests use a temporary database file for each test case.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from cellmage.models import ConversationMetadata, Message
+from cellmage.storage.connection_pool import SQLiteConnectionPool
+from cellmage.storage.sqlite_store import SQLiteStore
+
+
+class TestSQLiteConnectionPool(unittest.TestCase):
+    """Tests for SQLiteConnectionPool."""
+
+    def setUp(self):
+        """Create a pool on a database with one table."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.db_path = os.path.join(self.tmp_dir.name, "test.db")
+        self.pool = SQLiteConnectionPool(self.db_path, max_readers=2)
+        self.addCleanup(self.pool.close)
+
+        conn = self.pool.acquire_writer()
+        conn.execute("CREATE TABLE items (name TEXT)")
+        conn.commit()
+        self.pool.release(conn)
+
+    def _count_items(self):
+        conn = self.pool.acquire_reader()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        finally:
+            self.pool.release(conn)
+
+    def test_reader_is_reused(self):
+        """A released read-only connection is handed out again."""
+        reader = self.pool.acquire_reader()
+        self.pool.release(reader)
+        self.assertIs(self.pool.acquire_reader(), reader)
+
+    def test_reader_is_read_only(self):
+        """Read-only connections cannot write."""
+        reader = self.pool.acquire_reader()
+        try:
+            with self.assertRaises(sqlite3.OperationalError):
+                reader.execute("INSERT INTO items VALUES ('x')")
+        finally:
+            self.pool.release(reader)
+
+    def test_reader_falls_back_to_writer(self):
+        """A database that can't be opened read-only is read through the writer."""
+        pool = SQLiteConnectionPool(os.path.join(self.tmp_dir.name, "new.db"))
+        self.addCleanup(pool.close)
+
+        conn = pool.acquire_reader()
+        try:
+            self.assertIs(conn, pool._writer)
+        finally:
+            pool.release(conn)
+
+        # The writer is free again afterwards
+        pool.release(pool.acquire_writer())
+
+    def test_reader_fallback_while_holding_writer_raises(self):
+        """The fallback raises instead of deadlocking when this thread holds the writer."""
+        writer = self.pool.acquire_writer()
+        try:
+            with patch.object(
+                self.pool, "_open", side_effect=sqlite3.OperationalError("unable to open")
+            ):
+                with self.assertRaises(RuntimeError):
+                    self.pool.acquire_reader()
+        finally:
+            self.pool.release(writer)
+
+        # Other threads can still take the writer
+        self.pool.release(self.pool.acquire_writer())
+
+    def test_writer_is_exclusive(self):
+        """Another thread waits until the writer is released."""
+        writer = self.pool.acquire_writer()
+        acquired = threading.Event()
+
+        def take_writer():
+            self.pool.release(self.pool.acquire_writer())
+            acquired.set()
+
+        thread = threading.Thread(target=take_writer)
+        thread.start()
+        self.assertFalse(acquired.wait(0.2))
+
+        self.pool.release(writer)
+        thread.join(5)
+        self.assertTrue(acquired.is_set())
+
+    def test_release_rolls_back_open_transaction(self):
+        """Uncommitted changes are rolled back when the writer is released."""
+        writer = self.pool.acquire_writer()
+        writer.execute("INSERT INTO items VALUES ('uncommitted')")
+        self.pool.release(writer)
+
+        self.assertEqual(self._count_items(), 0)
+        self.assertFalse(self.pool.acquire_writer().in_transaction)
+        self.pool.release(self.pool._writer)
+
+    def test_release_resets_row_factory(self):
+        """The row factory set by one user is not seen by the next one."""
+        reader = self.pool.acquire_reader()
+        reader.row_factory = sqlite3.Row
+        self.pool.release(reader)
+        self.assertIsNone(self.pool.acquire_reader().row_factory)
+
+    def test_broken_reader_is_discarded(self):
+        """A reader that fails on release is not handed out again."""
+        reader = self.pool.acquire_reader()
+        reader.close()
+        self.pool.release(reader)
+
+        new_reader = self.pool.acquire_reader()
+        try:
+            self.assertIsNot(new_reader, reader)
+            self.assertEqual(new_reader.execute("SELECT 1").fetchone(), (1,))
+        finally:
+            self.pool.release(new_reader)
+
+    def test_broken_writer_is_replaced(self):
+        """A writer that fails on release is reopened on the next acquire."""
+        writer = self.pool.acquire_writer()
+        writer.close()
+        self.pool.release(writer)
+
+        new_writer = self.pool.acquire_writer()
+        try:
+            self.assertIsNot(new_writer, writer)
+            new_writer.execute("INSERT INTO items VALUES ('x')")
+            new_writer.commit()
+        finally:
+            self.pool.release(new_writer)
+        self.assertEqual(self._count_items(), 1)
+
+    def test_close(self):
+        """close() closes the idle readers and the writer."""
+        reader = self.pool.acquire_reader()
+        self.pool.release(reader)
+        writer = self.pool.acquire_writer()
+        self.pool.release(writer)
+
+        self.pool.close()
+
+        for conn in (reader, writer):
+            with self.assertRaises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+        self.assertIsNone(self.pool._writer)
+        self.assertTrue(self.pool._readers.empty())
+
+
+class TestSQLiteStorePool(unittest.TestCase):
+    """Tests for SQLiteStore's use of the connection pool."""
+
+    def setUp(self):
+        """Create a store on a temporary database."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.store = SQLiteStore(os.path.join(self.tmp_dir.name, "test.db"))
+        self.addCleanup(self.store.close)
+
+    def test_saves_through_writer_and_lists_through_reader(self):
+        """A saved conversation is listed on a read-only connection."""
+        metadata = ConversationMetadata(session_id="conv", saved_at=datetime.now())
+        self.store.save_conversation([Message(role="user", content="hello")], metadata, "conv")
+
+        conversations = self.store.list_saved_conversations()
+
+        self.assertEqual([conv["id"] for conv in conversations], ["conv"])
+        self.assertFalse(self.store._pool._readers.empty())
+        # The writer was released by both calls
+        self.store._pool.release(self.store._pool.acquire_writer())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Tests for the SQLite conversation store.
+
+These tests use a temporary database file for each test case.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from cellmage.models import ConversationMetadata, Message
+from cellmage.storage.sqlite_store import SQLiteStore
+
+
+class TestSQLiteStoreSearch(unittest.TestCase):
+    """Tests for SQLiteStore.search_conversations()."""
+
+    def setUp(self):
+        """Create a store with two saved conversations."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.store = SQLiteStore(os.path.join(self.tmp_dir.name, "test.db"))
+        self.addCleanup(self.store.close)
+
+        self._save("baseline", "hello")
+        self._save("other", "the database is down")
+
+    def _save(self, name, content):
+        metadata = ConversationMetadata(session_id=name, saved_at=datetime.now())
+        self.store.save_conversation([Message(role="user", content=content)], metadata, name)
+
+    def _search(self, query):
+        return sorted(conv["name"] for conv in self.store.search_conversations(query))
+
+    def test_whole_word(self):
+        """A whole word in a message finds its conversation."""
+        self.assertEqual(self._search("database"), ["other"])
+
+    def test_prefix(self):
+        """The start of a word in a message finds its conversation."""
+        self.assertEqual(self._search("data"), ["other"])
+
+    def test_substring(self):
+        """Text inside a word of a message finds its conversation."""
+        self.assertEqual(self._search("tabas"), ["other"])
+
+    def test_substring_and_name(self):
+        """A query matching one conversation's name still searches the other's messages."""
+        self.assertEqual(self._search("base"), ["baseline", "other"])
+
+    def test_word_and_name(self):
+        """A query matching a name and a message word finds both conversations."""
+        self._save("down_notes", "nothing to report")
+        self.assertEqual(self._search("down"), ["down_notes", "other"])
+
+    def test_name_only(self):
+        """A query only matching a conversation name finds that conversation."""
+        self.assertEqual(self._search("baseli"), ["baseline"])
+
+    def test_no_match(self):
+        """A query matching nothing returns no conversations."""
+        self.assertEqual(self._search("missing"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Tests for ConversationManager saving.
+
+These tests use a temporary SQLite database for each test case.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from cellmage.conversation_manager import ConversationManager
+from cellmage.models import Message
+
+
+class TestConversationManagerSaving(unittest.TestCase):
+    """Tests for ConversationManager.transaction() and prepare_save()."""
+
+    def setUp(self):
+        """Create a conversation manager on a temporary database."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.manager = ConversationManager(db_path=os.path.join(self.tmp_dir.name, "test.db"))
+        self.addCleanup(self.manager.store.close)
+
+    def _add(self, role, content):
+        self.manager.add_message(Message(role=role, content=content))
+
+    def _stored_contents(self):
+        messages, _ = self.manager.store.load_conversation(self.manager.current_conversation_id)
+        return [m.content for m in messages]
+
+    def _count_saves(self):
+        return patch.object(
+            self.manager.store, "save_conversation", wraps=self.manager.store.save_conversation
+        )
+
+    def test_transaction_saves_once(self):
+        """Messages added in a transaction are saved together when it exits."""
+        with self._count_saves() as save:
+            with self.manager.transaction():
+                self._add("user", "question")
+                self._add("assistant", "answer")
+                self.assertEqual(save.call_count, 0)
+
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(self._stored_contents(), ["question", "answer"])
+
+    def test_transaction_without_changes_does_not_save(self):
+        """A transaction that changes nothing writes nothing."""
+        self._add("user", "question")
+
+        with self._count_saves() as save:
+            with self.manager.transaction():
+                pass
+
+        self.assertEqual(save.call_count, 0)
+
+    def test_transaction_restores_messages_on_error(self):
+        """If the block raises, the history is restored and nothing is saved."""
+        self._add("user", "question")
+
+        with self._count_saves() as save:
+            with self.assertRaises(ValueError):
+                with self.manager.transaction():
+                    self._add("user", "lost")
+                    raise ValueError("failed")
+
+        self.assertEqual(save.call_count, 0)
+        self.assertEqual([m.content for m in self.manager.get_messages()], ["question"])
+        self.assertEqual(self._stored_contents(), ["question"])
+
+    def test_nested_transaction_saves_once(self):
+        """Only the outermost transaction saves."""
+        with self._count_saves() as save:
+            with self.manager.transaction():
+                self._add("user", "question")
+                with self.manager.transaction():
+                    self._add("assistant", "answer")
+                self.assertEqual(save.call_count, 0)
+                self._add("user", "follow-up")
+
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(self._stored_contents(), ["question", "answer", "follow-up"])
+
+    def test_nested_transaction_error_restores_outer_state(self):
+        """An error raised through a nested block restores the outermost block's starting state."""
+        self._add("user", "question")
+
+        with self.assertRaises(ValueError):
+            with self.manager.transaction():
+                self._add("assistant", "answer")
+                with self.manager.transaction():
+                    raise ValueError("failed")
+
+        self.assertEqual([m.content for m in self.manager.get_messages()], ["question"])
+
+    def test_saves_resume_after_transaction(self):
+        """Messages added after a transaction are saved immediately again."""
+        with self.manager.transaction():
+            self._add("user", "question")
+
+        with self._count_saves() as save:
+            self._add("assistant", "answer")
+
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(self._stored_contents(), ["question", "answer"])
+
+    def test_prepared_save_captures_messages(self):
+        """A prepared save writes the messages as they were when it was prepared."""
+        with self.manager.transaction():
+            self._add("user", "question")
+        write = self.manager.prepare_save()
+        self.manager.messages.append(Message(role="assistant", content="unsaved"))
+
+        write()
+
+        self.assertEqual(self._stored_contents(), ["question"])
+
+    def test_older_prepared_save_does_not_overwrite_newer(self):
+        """A save prepared earlier but written later is skipped."""
+        self._add("user", "question")
+        old_write = self.manager.prepare_save()
+        self._add("assistant", "answer")
+
+        with self._count_saves() as save:
+            old_write()
+
+        self.assertEqual(save.call_count, 0)
+        self.assertEqual(self._stored_contents(), ["question", "answer"])
+
+    def test_prepared_saves_written_out_of_order(self):
+        """Of two prepared saves, the newer one is kept whichever is written last."""
+        self._add("user", "question")
+        old_write = self.manager.prepare_save()
+        self.manager.messages.append(Message(role="assistant", content="answer"))
+        new_write = self.manager.prepare_save()
+
+        new_write()
+        old_write()
+
+        self.assertEqual(self._stored_contents(), ["question", "answer"])
+
+    def test_prepare_save_inside_transaction_is_deferred(self):
+        """Inside a transaction nothing is prepared; the transaction saves instead."""
+        with self.manager.transaction():
+            self._add("user", "question")
+            self.assertIsNone(self.manager.prepare_save())
+
+        self.assertEqual(self._stored_contents(), ["question"])
+
+
+if __name__ == "__main__":
+    unittest.main()